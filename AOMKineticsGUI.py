@@ -1,2476 +1,2004 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import numpy as np
-import pandas as pd
-from scipy.integrate import quad
-import scipy.constants as const
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import (
-    FigureCanvasTkAgg, NavigationToolbar2Tk
-)
-import os
-import math
-import traceback
-
-# 物理常数
-R = 8.314  # 气体常数，J/(mol·K)
-F = 96485.33289  # 法拉第常数，C/mol
-h = 4.13568e-15  # 普朗克常数，eV·s
-kB = 8.61689e-5  # 玻尔兹曼常数，eV/K
-eV_to_J = 1.60218e-19  # 电子伏特到焦耳的转换因子
-epsilon = 1e-6
-
-class AOMKineticsGUI:
-    def __init__(self, root):
-        self.root = root
-        self.root.title("AOM Kinetic Simulation")
-        self.root.geometry("1200x800")
-        self.style = ttk.Style()
-        self.style.configure('TFrame', background='#f0f0f0')
-        self.style.configure('TLabel', background='#f0f0f0', font=('Arial', 10))
-        self.style.configure('TButton', font=('Arial', 10))
-        self.style.configure('Header.TLabel', font=('Arial', 11, 'bold'))
-
-        # 初始化变量
-        self.model_var = tk.StringVar(value="ER-AOM")
-        self.kinetics_var = tk.StringVar(value="Butler-Volmer kinetics")
-        self.bv_method_var = tk.StringVar(value="BEP")  # 新增变量
-        self.chem_method_var = tk.StringVar(value="BEP")# 化学反应方法
-        self.chem_method_var.trace_add("write", self.update_parameters)  # 切换时更新参数界面
-        self.variable_var = tk.StringVar(value="η")
-        self.delta_gw_var = tk.DoubleVar(value=0.8277)  # 新增△G_w变量
-        self.start_var = tk.DoubleVar(value=-1.0)
-        self.end_var = tk.DoubleVar(value=1.0)
-        self.step_var = tk.DoubleVar(value=0.01)
-        self.fixed_eta_var = tk.DoubleVar(value=0.5)
-        self.fixed_ph_var = tk.DoubleVar(value=0)
-        
-        # 2D扫描参数
-        self.eta_start_var = tk.DoubleVar(value=-1.0)
-        self.eta_end_var = tk.DoubleVar(value=1.0)
-        self.eta_step_var = tk.DoubleVar(value=0.01)
-        self.ph_start_var = tk.DoubleVar(value=0)
-        self.ph_end_var = tk.DoubleVar(value=14)
-        self.ph_step_var = tk.DoubleVar(value=1)
-        
-        # 存储参数的Entry部件
-        self.er_aom_bv_entries = []
-        self.er_aom_marcus_entries = []
-        self.er_aom_mg_entries = []  # 初始化MG参数容器
-        self.lh_aom_bv_entries = []
-        self.lh_aom_marcus_entries = []
-        self.lh_aom_mg_entries = []  # 初始化MG参数容器
-        
-        # 创建界面
-        self.create_main_layout()
-        self.update_parameters()
-        self.update_variable_controls()
-        self.setup_plots()
-        self.plot_window = None  # 用于跟踪当前绘图窗口
-        self.current_fig = None  # 避免Matplotlib资源未释放
-                
-    def create_main_layout(self):
-        # 主容器使用Grid布局
-        main_container = ttk.Frame(self.root)
-        main_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        # ===== 左侧控制面板 =====
-        left_panel = ttk.Frame(main_container, width=480)
-        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=False)
-
-        # 参数框架
-        param_frame = ttk.LabelFrame(left_panel, text="Parameters", padding="10")
-        param_frame.pack(fill=tk.BOTH, expand=True)
-
-        # 配置区域
-        config_frame = ttk.Frame(param_frame)
-        config_frame.pack(fill=tk.X, pady=(0, 10))
-
-        # 模型选择
-        model_frame = ttk.LabelFrame(config_frame, text="1. Model Selection", padding="10")
-        model_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-        ttk.Radiobutton(model_frame, text="ER-AOM", variable=self.model_var,
-                       value="ER-AOM", command=self.update_parameters).pack(anchor=tk.W)
-        ttk.Radiobutton(model_frame, text="LH-AOM", variable=self.model_var,
-                       value="LH-AOM", command=self.update_parameters).pack(anchor=tk.W)
-
-        # 动力学公式选择
-        kinetics_frame = ttk.LabelFrame(config_frame, text="2.1 Kinetics Formula(ECR)", padding="10")
-        kinetics_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-
-        kinetics_options = ["Butler-Volmer kinetics", "Marcus kinetics", "Marcus-Gerischer kinetics"]
-        for option in kinetics_options:
-            ttk.Radiobutton(kinetics_frame, text=option, variable=self.kinetics_var,
-                           value=option, command=self.update_parameters).pack(anchor=tk.W)
-        # 新增：B-V方法选择子框架（仅当选择B-V时显示）
-        self.bv_sub_frame = ttk.Frame(kinetics_frame)   
-        ttk.Radiobutton(self.bv_sub_frame, text="BEP", variable=self.bv_method_var,
-                        value="BEP", command=self.update_parameters).pack(side=tk.LEFT)
-        ttk.Radiobutton(self.bv_sub_frame, text="Softplus", variable=self.bv_method_var,
-                        value="Softplus", command=self.update_parameters).pack(side=tk.LEFT)
-        
-        # 在kinetics_frame下方添加新的化学反应方法选择框架
-        self.chem_frame = ttk.LabelFrame(config_frame, text="2.2 Chemical Reaction Method(CR)", padding="10")
-        self.chem_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-        self.chem_method_var = tk.StringVar(value="BEP")  # 新增变量
-        ttk.Radiobutton(self.chem_frame, text="BEP", variable=self.chem_method_var, value="BEP").pack(anchor=tk.W)
-        ttk.Radiobutton(self.chem_frame, text="Softplus", variable=self.chem_method_var, value="Softplus").pack(anchor=tk.W)
-
-        # 变量控制
-        var_frame = ttk.LabelFrame(config_frame, text="3. Variable Control", padding="10")
-        var_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
-        ttk.Label(var_frame, text="Variable:").pack(anchor=tk.W)
-        ttk.Radiobutton(var_frame, text="η (overpotential)", variable=self.variable_var,
-                       value="η", command=self.update_variable_controls).pack(anchor=tk.W)
-        ttk.Radiobutton(var_frame, text="pH", variable=self.variable_var,
-                       value="pH", command=self.update_variable_controls).pack(anchor=tk.W)
-        ttk.Radiobutton(var_frame, text="2D Scan (η & pH)", variable=self.variable_var,
-                       value="2D", command=self.update_variable_controls).pack(anchor=tk.W)
-        
-        # 变量范围
-        ttk.Label(var_frame, text="Range:").pack(anchor=tk.W, pady=(10, 0))
-        range_frame = ttk.Frame(var_frame)
-        range_frame.pack(fill=tk.X)
-        ttk.Label(range_frame, text="Start:").pack(side=tk.LEFT)
-        ttk.Entry(range_frame, textvariable=self.start_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(range_frame, text="End:").pack(side=tk.LEFT)
-        ttk.Entry(range_frame, textvariable=self.end_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(range_frame, text="Step:").pack(side=tk.LEFT)
-        ttk.Entry(range_frame, textvariable=self.step_var, width=8).pack(side=tk.LEFT, padx=5)
-
-        # 固定值框架
-        self.fixed_frame = ttk.Frame(var_frame)
-        self.fixed_frame.pack(fill=tk.X, pady=5)
-        
-        # 固定η控制
-        self.fixed_eta_frame = ttk.Frame(self.fixed_frame)
-        ttk.Label(self.fixed_eta_frame, text="Fixed η:").pack(side=tk.LEFT)
-        ttk.Entry(self.fixed_eta_frame, textvariable=self.fixed_eta_var, width=8).pack(side=tk.LEFT, padx=5)
-        
-        # 固定pH控制
-        self.fixed_ph_frame = ttk.Frame(self.fixed_frame)
-        ttk.Label(self.fixed_ph_frame, text="Fixed pH:").pack(side=tk.LEFT)
-        ttk.Entry(self.fixed_ph_frame, textvariable=self.fixed_ph_var, width=8).pack(side=tk.LEFT, padx=5)
-
-        # 2D扫描范围框架
-        self.eta_2d_frame = ttk.Frame(var_frame)
-        ttk.Label(self.eta_2d_frame, text="η Range:").pack(side=tk.LEFT)
-        ttk.Entry(self.eta_2d_frame, textvariable=self.eta_start_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(self.eta_2d_frame, text="to").pack(side=tk.LEFT)
-        ttk.Entry(self.eta_2d_frame, textvariable=self.eta_end_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(self.eta_2d_frame, text="step").pack(side=tk.LEFT)
-        ttk.Entry(self.eta_2d_frame, textvariable=self.eta_step_var, width=8).pack(side=tk.LEFT, padx=5)
-
-        self.ph_2d_frame = ttk.Frame(var_frame)
-        ttk.Label(self.ph_2d_frame, text="pH Range:").pack(side=tk.LEFT)
-        ttk.Entry(self.ph_2d_frame, textvariable=self.ph_start_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(self.ph_2d_frame, text="to").pack(side=tk.LEFT)
-        ttk.Entry(self.ph_2d_frame, textvariable=self.ph_end_var, width=8).pack(side=tk.LEFT, padx=5)
-        ttk.Label(self.ph_2d_frame, text="step").pack(side=tk.LEFT)
-        ttk.Entry(self.ph_2d_frame, textvariable=self.ph_step_var, width=8).pack(side=tk.LEFT, padx=5)
-
-        # 参数容器
-        self.param_frame_container = ttk.Frame(param_frame)
-        self.param_frame_container.pack(fill=tk.BOTH, expand=True)
-
-        # 按钮区域
-        button_frame = ttk.Frame(left_panel)
-        button_frame.pack(fill=tk.X, pady=10)
-        ttk.Button(button_frame, text="Calculate", command=self.calculate).pack(side=tk.LEFT, padx=10)
-        ttk.Button(button_frame, text="Save Results", command=self.save_results).pack(side=tk.LEFT, padx=10)
-        ttk.Button(button_frame, text="Exit", command=self.root.quit).pack(side=tk.RIGHT, padx=10)
-
-        # 结果表格
-        results_frame = ttk.LabelFrame(left_panel, text="结果表格", padding="10")
-        results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
-
-        # 创建带双滚动条的容器
-        tree_container = ttk.Frame(results_frame)
-        tree_container.pack(fill=tk.BOTH, expand=True)
-
-        # 创建Treeview组件
-        self.tree = ttk.Treeview(
-            tree_container,
-            columns=[],
-            show='headings',
-            height=8,
-            selectmode='extended'
-        )
-
-        # 创建垂直滚动条
-        vsb = ttk.Scrollbar(
-            tree_container,
-            orient="vertical",
-            command=self.tree.yview
-        )
-        self.tree.configure(yscrollcommand=vsb.set)
-
-        # 创建水平滚动条
-        hsb = ttk.Scrollbar(
-            tree_container,
-            orient="horizontal",
-            command=self.tree.xview
-        )
-        self.tree.configure(xscrollcommand=hsb.set)
-
-        # 使用grid布局管理器
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
-        hsb.grid(row=1, column=0, sticky="ew")
-
-        # 配置容器网格权重
-        tree_container.grid_rowconfigure(0, weight=1)
-        tree_container.grid_columnconfigure(0, weight=1)
-
-        # 添加自动调整列宽功能
-        def auto_resize_columns(event=None):
-            for col in self.tree["columns"]:
-                max_width = max(
-                    tk.font.Font().measure(str(self.tree.set(item, col))) 
-                    for item in self.tree.get_children()
-                )
-                self.tree.column(col, width=max_width + 20)
-
-        self.tree.bind("<Configure>", auto_resize_columns)
-
-        # ===== 右侧图表容器 =====
-        self.right_container = ttk.Frame(main_container)
-        self.right_container.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)        
-
-        # 配置权重分配
-        main_container.columnconfigure(0, weight=0)  # 左侧固定宽度
-        main_container.columnconfigure(1, weight=1)  # 右侧自适应
-                       
-    def setup_plots(self):
-        """初始化右侧的三个图表"""
-        # 创建滚动容器
-        canvas = tk.Canvas(self.right_container, borderwidth=0)
-        scrollbar = ttk.Scrollbar(self.right_container, 
-                                orient="vertical", 
-                                command=canvas.yview)
-        scroll_frame = ttk.Frame(canvas)
-
-        # 配置滚动区域
-        scroll_frame.bind("<Configure>", 
-                        lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0,0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # 布局滚动组件
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # 创建图表
-        self.fig = plt.figure(figsize=(8, 10), dpi=80, constrained_layout=True)  # 调整尺寸
-        gs = self.fig.add_gridspec(3, 1, height_ratios=[1,1,1.2], hspace=0.8)
-    
-        self.ax_k = self.fig.add_subplot(gs[0])
-        self.ax_lgr = self.fig.add_subplot(gs[1])
-        self.ax_theta = self.fig.add_subplot(gs[2])
-
-        # 嵌入图表
-        self.canvas = FigureCanvasTkAgg(self.fig, master=scroll_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-        # 添加水平滚动条
-        h_scroll = ttk.Scrollbar(self.right_container,
-                               orient="horizontal",
-                               command=canvas.xview)
-        canvas.configure(xscrollcommand=h_scroll.set)
-        h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
-
-    def create_plot_window(self):
-        """创建独立的绘图窗口"""
-        # 关闭旧窗口（如果存在）
-        if self.plot_window is not None:
-            try:
-                self.plot_window.destroy()
-                plt.close(self.current_fig)  # 显式关闭Figure
-            except:
-                pass
-
-        # 创建新窗口
-        self.plot_window = tk.Toplevel(self.root)
-        self.plot_window.title("仿真结果图表")
-        self.plot_window.geometry("1200x800")
-
-        # 创建Figure和Canvas（绑定到新窗口）
-        self.current_fig = plt.figure(figsize=(10, 15), dpi=100)
-        gs = self.current_fig.add_gridspec(3, 1, height_ratios=[1, 1, 1.5], hspace=0.7)
-        self.ax_k = self.current_fig.add_subplot(gs[0])
-        self.ax_lgr = self.current_fig.add_subplot(gs[1])
-        self.ax_theta = self.current_fig.add_subplot(gs[2])
-
-        # 嵌入Canvas到新窗口
-        self.canvas = FigureCanvasTkAgg(self.current_fig, master=self.plot_window)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-         # 添加工具栏（需先导入 NavigationToolbar2Tk）
-        toolbar = NavigationToolbar2Tk(self.canvas, self.plot_window)
-        toolbar.update()
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-    def update_plot_in_new_window(self):
-        """在新窗口中更新图表"""
-        try:
-            if not hasattr(self, 'results_df') or self.results_df.empty:
-                raise ValueError("无有效数据，请先进行计算")
-
-            # 绘制图表
-            self.draw_plots(self.ax_k, self.ax_lgr, self.ax_theta)
-            self.canvas.draw()
-
-        except Exception as e:
-            messagebox.showerror("绘图错误", f"图表生成失败：\n{str(e)}")
-            traceback.print_exc()
-
-    def draw_plots(self, ax_k, ax_lgr, ax_theta):
-        """通用绘图逻辑（无Figure依赖）"""
-        # 清除旧数据
-        ax_k.clear()
-        ax_lgr.clear()
-        ax_theta.clear()
-
-        # 获取变量数据
-        variable = self.results_df.columns[0]
-        x = self.results_df[variable]
-
-        # 设置颜色主题
-        colors = plt.cm.tab10.colors
-
-        # 绘制速率常数
-        k_cols = [c for c in self.results_df.columns if c.startswith('k') ]
-        for idx, col in enumerate(k_cols):
-            ax_k.plot(x, self.results_df[col], color=colors[idx%10], linewidth=1.5, label=col)
-        ax_k.set_title("Rate Constants", fontsize=12, pad=10)
-        ax_k.legend(fontsize=8, loc='upper right', framealpha=0.8)
-        ax_k.grid(True, linestyle='--', alpha=0.6)
-
-        # 绘制对数速率
-        lgr_cols = [c for c in self.results_df.columns if c.startswith(('lg(r1)', 'lg(r21)', 'lg(r22)', 'lg(r5)'))]
-        for idx, col in enumerate(lgr_cols):
-            ax_lgr.plot(x, self.results_df[col], color=colors[idx%10], linewidth=1.5, label=col.replace('lg', 'log'))
-        ax_lgr.set_title("Reaction Rates (log scale)", fontsize=12, pad=10)
-        ax_lgr.legend(fontsize=8, loc='upper right', framealpha=0.8)
-        ax_lgr.grid(True, linestyle='--', alpha=0.6)
-
-        # 绘制表面覆盖度
-        theta_cols = [c for c in self.results_df.columns if c.startswith('theta')]
-        for idx, col in enumerate(theta_cols):
-            ax_theta.plot(x, self.results_df[col], color=colors[idx%10], linewidth=1.5, label=col)
-        ax_theta.set_title("Surface Coverage", fontsize=12, pad=10)
-        ax_theta.legend(fontsize=8, loc='upper right', framealpha=0.8)
-        ax_theta.grid(True, linestyle='--', alpha=0.6)
-
-        # 设置公共坐标标签
-        ax_theta.set_xlabel(variable, fontsize=10)
-
-    def update_variable_controls(self):
-        current_var = self.variable_var.get()
-        self.fixed_eta_frame.pack_forget()
-        self.fixed_ph_frame.pack_forget()
-        self.eta_2d_frame.pack_forget()
-        self.ph_2d_frame.pack_forget()
-        
-        if current_var == "η":
-            self.fixed_ph_frame.pack(anchor=tk.W)
-        elif current_var == "pH":
-            self.fixed_eta_frame.pack(anchor=tk.W)
-        elif current_var == "2D":
-            self.eta_2d_frame.pack(fill=tk.X, pady=5)
-            self.ph_2d_frame.pack(fill=tk.X, pady=5)
-
-    def update_parameters(self):
-        if hasattr(self, 'current_param_frame'):
-            self.current_param_frame.destroy()
-            self.current_param_frame = None
-        
-        model = self.model_var.get()
-        kinetics = self.kinetics_var.get()
-        chem = self.chem_method_var.get()
-        self.current_param_frame = ttk.Frame(self.param_frame_container)
-        self.current_param_frame.pack(fill=tk.BOTH, expand=True)
-
-        # 滚动条
-        canvas = tk.Canvas(self.current_param_frame, borderwidth=0)
-        scrollbar = ttk.Scrollbar(self.current_param_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        # 标题
-        ttk.Label(scrollable_frame, text=f"Parameters for {model} with {kinetics}", 
-                 style='Header.TLabel').grid(row=0, column=0, columnspan=9, pady=5)
-
-        # 公共参数
-        ttk.Label(scrollable_frame, text="Temperature (T):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
-        self.temp_entry = ttk.Entry(scrollable_frame, width=12)
-        self.temp_entry.grid(row=1, column=1, sticky=tk.W, pady=2)
-        self.temp_entry.insert(0, "298.15")
-        ttk.Label(scrollable_frame, text="K").grid(row=1, column=2, sticky=tk.W, padx=5)
-
-        ttk.Label(scrollable_frame, text="ΔGw (eV):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
-        delta_gw_entry = ttk.Entry(scrollable_frame, width=12, textvariable=self.delta_gw_var)
-        delta_gw_entry.grid(row=2, column=1, sticky=tk.W, pady=2)
-        ttk.Label(scrollable_frame, text="eV").grid(row=2, column=2, sticky=tk.W, padx=5)
-
-
-    
-        # 模型特定参数
-        if model == "ER-AOM":
-            if kinetics == "Butler-Volmer kinetics":
-                self.create_er_aom_bv_parameters(scrollable_frame)
-            elif kinetics == "Marcus kinetics":
-                self.create_er_aom_marcus_parameters(scrollable_frame)
-            else:
-                self.create_er_aom_mg_parameters(scrollable_frame)
-
-        else:
-            if kinetics == "Butler-Volmer kinetics":
-                self.create_lh_aom_bv_parameters(scrollable_frame)
-            elif kinetics == "Marcus kinetics":
-                self.create_lh_aom_marcus_parameters(scrollable_frame)
-            else:
-                self.create_lh_aom_mg_parameters(scrollable_frame)
-
-        if kinetics == "Butler-Volmer kinetics":
-            self.bv_sub_frame.pack(anchor=tk.W, pady=5)  # 显示子选项
-        else:
-            self.bv_sub_frame.pack_forget()  # 隐藏子选项 
-
-    # 以下是完整的参数创建函数
-    def create_er_aom_bv_parameters(self, frame):
-        self.er_aom_bv_entries.clear()
-        # Ea0
-        ttk.Label(frame, text="Ea,0:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
-        self.ea0_entry = ttk.Entry(frame, width=12)
-        self.ea0_entry.grid(row=3, column=1, sticky=tk.W, pady=2)
-        self.ea0_entry.insert(0, "0.5")
-        ttk.Label(frame, text="eV").grid(row=3, column=2, sticky=tk.W, padx=5)
-
-        # Headers
-        ttk.Label(frame, text="ΔG (eV)").grid(row=4, column=1, pady=5)
-        ttk.Label(frame, text="γ").grid(row=4, column=3, pady=5)
-        ttk.Label(frame, text="β").grid(row=4, column=5, pady=5)
-        ttk.Label(frame, text="z").grid(row=4, column=7, pady=5)
-
-        # ΔG, γ, β, z for steps 1-4
-        self.er_aom_bv_entries = []
-        for i, step in enumerate(range(1, 5), start=5):
-            step_entries = {}
-            
-            ttk.Label(frame, text=f"Step {step}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-            
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "0.1")
-            step_entries['deltaG'] = entry
-            
-            # γ
-            gamma_value = "1.3863" if self.bv_method_var.get() == "Softplus" else "0.5"  
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, gamma_value)
-            step_entries['gamma'] = entry
-            
-            # β
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "0.5")
-            step_entries['beta'] = entry
-            
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-            
-            self.er_aom_bv_entries.append(step_entries)
-
-    def create_er_aom_marcus_parameters(self, frame):
-        self.er_aom_marcus_entries.clear()
-        # Headers
-        ttk.Label(frame, text="ΔG (eV)").grid(row=3, column=1, pady=5)
-        ttk.Label(frame, text="λ (eV)").grid(row=3, column=3, pady=5)
-        ttk.Label(frame, text="z").grid(row=3, column=5, pady=5)
-
-        # ΔG, λ, z for steps 1-4
-        self.er_aom_marcus_entries = []
-        for i, step in enumerate(range(1, 5), start=4):
-            step_entries = {}
-            
-            ttk.Label(frame, text=f"Step {step}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-            
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "0.1")
-            step_entries['deltaG'] = entry
-            
-            # λ
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "2")
-            step_entries['lambda'] = entry
-            
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-            
-            self.er_aom_marcus_entries.append(step_entries)
-
-    def create_er_aom_mg_parameters(self, frame):
-        self.er_aom_mg_entries.clear()
-        # Headers
-        ttk.Label(frame, text="ΔG (eV)").grid(row=3, column=1, pady=5)
-        ttk.Label(frame, text="λ (eV)").grid(row=3, column=3, pady=5)
-        ttk.Label(frame, text="z").grid(row=3, column=5, pady=5)
-
-        # ΔG, λ, z for steps 1-4
-        self.er_aom_mag_entries = []
-        for i, step in enumerate(range(1, 5), start=4):
-            step_entries = {}
-            
-            ttk.Label(frame, text=f"Step {step}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-            
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "0.1")
-            step_entries['deltaG'] = entry
-            
-            # λ
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "2")
-            step_entries['lambda'] = entry
-            
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-            
-            self.er_aom_mg_entries.append(step_entries)
-
-    def create_lh_aom_bv_parameters(self, frame):
-        self.lh_aom_bv_entries.clear()
-        # Ea0
-        ttk.Label(frame, text="Ea,0:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
-        self.ea0_entry = ttk.Entry(frame, width=12)
-        self.ea0_entry.grid(row=3, column=1, sticky=tk.W, pady=2)
-        self.ea0_entry.insert(0, "0.5")
-        ttk.Label(frame, text="eV").grid(row=3, column=2, sticky=tk.W, padx=5)
-
-        # Headers
-        ttk.Label(frame, text="ΔG (eV)").grid(row=5, column=1, pady=5)
-        ttk.Label(frame, text="γ").grid(row=5, column=3, pady=5)
-        ttk.Label(frame, text="β").grid(row=5, column=5, pady=5)
-        ttk.Label(frame, text="z").grid(row=5, column=7, pady=5)
-        ttk.Separator(frame, orient='horizontal').grid(row=4, column=0, columnspan=8, pady=10, sticky='ew')
-        ttk.Label(frame, text="CHR", style='Header.TLabel').grid(row=4, column=0, columnspan=8, pady=5)
-        ttk.Separator(frame, orient='horizontal').grid(row=12, column=0, columnspan=8, pady=10, sticky='ew')
-        ttk.Label(frame, text="CR (Step 5)", style='Header.TLabel').grid(row=12, column=0, columnspan=8, pady=5)
-            
-        # Steps:1,21,22,31,32,4
-        steps = [1,21,22,31,32,4]
-        self.lh_aom_bv_entries = []
-        for i, step_num in enumerate(steps, start=6):
-            step_entries = {'step': step_num} 
-            
-            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-            
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "0.1")
-            step_entries['deltaG'] = entry
-            
-            # γ
-            gamma_value = "1.3863" if self.bv_method_var.get() == "Softplus" else "0.5"  
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, gamma_value)
-            step_entries['gamma'] = entry
-            
-            # β
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "0.5")
-            step_entries['beta'] = entry
-            
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-
-            self.lh_aom_bv_entries.append(step_entries)
-        
-        # Steps: 5
-        steps = [5]
-        for i, step_num in enumerate(steps, start=13):
-            step_entries = {'step': step_num} 
-            
-            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-            
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "-0.2")
-            step_entries['deltaG'] = entry
-            
-            # γ
-            gamma_value = "1.3863" if self.chem_method_var.get() == "Softplus" else "0.5"
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, gamma_value)
-            step_entries['gamma'] = entry
-
-            # β
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "0.5")
-            step_entries['beta'] = entry
-            
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-            
-            self.lh_aom_bv_entries.append(step_entries)
-            
-    def create_lh_aom_marcus_parameters(self, frame):
-        self.lh_aom_marcus_entries.clear()
-        # Ea,0 参数
-        ttk.Label(frame, text="Ea,0:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
-        self.ea0_entry = ttk.Entry(frame, width=12)
-        self.ea0_entry.grid(row=3, column=1, sticky=tk.W, pady=2)
-        self.ea0_entry.insert(0, "0.5")
-        ttk.Label(frame, text="eV").grid(row=3, column=2, sticky=tk.W, padx=5)
-
-        # Headers
-        ttk.Label(frame, text="ΔG (eV)").grid(row=5, column=1, pady=5)
-        ttk.Label(frame, text="λ (eV)").grid(row=5, column=3, pady=5)
-        ttk.Label(frame, text="γ").grid(row=5, column=5, pady=5)
-        ttk.Label(frame, text="z").grid(row=5, column=7, pady=5)
-        ttk.Separator(frame, orient='horizontal').grid(row=4, column=0, columnspan=8, pady=10, sticky='ew')
-        ttk.Label(frame, text="CHR", style='Header.TLabel').grid(row=4, column=0, columnspan=8, pady=5)
-        ttk.Separator(frame, orient='horizontal').grid(row=12, column=0, columnspan=8, pady=10, sticky='ew')
-        ttk.Label(frame, text="CR (Step 5)", style='Header.TLabel').grid(row=12, column=0, columnspan=8, pady=5)
-            
-        # Steps: 1, 21, 22, 31, 32, 4
-        steps = [1, 21, 22, 31, 32, 4]
-        self.lh_aom_marcus_entries = []
-        for i, step_num in enumerate(steps, start=6):
-            step_entries = {'step': step_num} 
-            
-            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "0.1")
-            step_entries['deltaG'] = entry
-            
-            # λ
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "2")
-            step_entries['lambda'] = entry
-
-            # γ
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "0.5")
-            step_entries['gamma'] = entry
-        
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-
-            self.lh_aom_marcus_entries.append(step_entries)
-
-        # Steps: 5
-        steps = [5]
-        for i, step_num in enumerate(steps, start=13):
-            step_entries = {'step': step_num} 
-            
-            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-            
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "-0.2")
-            step_entries['deltaG'] = entry
-            
-            # λ
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "2")
-            step_entries['lambda'] = entry
-
-            # γ
-            gamma_value = "1.3863" if self.chem_method_var.get() == "Softplus" else "0.5"
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, gamma_value)
-            step_entries['gamma'] = entry
-        
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-            
-            self.lh_aom_marcus_entries.append(step_entries)
-
-    def create_lh_aom_mg_parameters(self, frame):
-        self.lh_aom_mg_entries.clear()
-        # Ea,0 参数
-        ttk.Label(frame, text="Ea,0:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
-        self.ea0_entry = ttk.Entry(frame, width=12)
-        self.ea0_entry.grid(row=3, column=1, sticky=tk.W, pady=2)
-        self.ea0_entry.insert(0, "0.5")
-        ttk.Label(frame, text="eV").grid(row=3, column=2, sticky=tk.W, padx=5)
-
-        # Headers
-        ttk.Label(frame, text="ΔG (eV)").grid(row=5, column=1, pady=5)
-        ttk.Label(frame, text="λ (eV)").grid(row=5, column=3, pady=5)
-        ttk.Label(frame, text="γ").grid(row=5, column=5, pady=5)
-        ttk.Label(frame, text="z").grid(row=5, column=7, pady=5)
-        ttk.Separator(frame, orient='horizontal').grid(row=4, column=0, columnspan=8, pady=10, sticky='ew')
-        ttk.Label(frame, text="CHR", style='Header.TLabel').grid(row=4, column=0, columnspan=8, pady=5)
-        ttk.Separator(frame, orient='horizontal').grid(row=12, column=0, columnspan=8, pady=10, sticky='ew')
-        ttk.Label(frame, text="CR (Step 5)", style='Header.TLabel').grid(row=12, column=0, columnspan=8, pady=5)
-            
-
-        # Steps: 1, 21, 22, 31, 32, 4
-        steps = [1, 21, 22, 31, 32, 4]
-        self.lh_aom_marcus_entries = []
-        for i, step_num in enumerate(steps, start=6):
-            step_entries = {'step': step_num} 
-            
-            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-            
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "0.1")
-            step_entries['deltaG'] = entry
-            
-            # λ
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "2")
-            step_entries['lambda'] = entry
-
-            # γ
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "0.5")
-            step_entries['gamma'] = entry
-        
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-            
-            self.lh_aom_mg_entries.append(step_entries)
-
-        # Steps: 5
-        steps = [5]
-        for i, step_num in enumerate(steps, start=13):
-            step_entries = {'step': step_num} 
-            
-            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
-            
-            # ΔG
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
-            entry.insert(0, "-0.2")
-            step_entries['deltaG'] = entry
-            
-            # λ
-            entry = ttk.Entry(frame, width=12)
-            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "2")
-            step_entries['lambda'] = entry
-
-            # γ
-            gamma_value = "1.3863" if self.chem_method_var.get() == "Softplus" else "0.5"  
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, gamma_value)
-            step_entries['gamma'] = entry
-        
-            # z
-            entry = ttk.Entry(frame, width=8)
-            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
-            entry.insert(0, "1")
-            step_entries['z'] = entry
-            
-            self.lh_aom_mg_entries.append(step_entries)
-
-    # 以下是完整的计算函数
-    
-    def calculate(self):
-        try:
-            # Get temperature
-            T = float(self.temp_entry.get())
-        
-            scan_mode = self.variable_var.get()
-        
-            if scan_mode == "2D":
-                # 2D扫描逻辑
-                eta_values = np.arange(
-                    self.eta_start_var.get(),
-                    self.eta_end_var.get() + self.eta_step_var.get()/2,
-                    self.eta_step_var.get()
-                )
-                ph_values = np.arange(
-                    self.ph_start_var.get(),
-                    self.ph_end_var.get() + self.ph_step_var.get()/2,
-                    self.ph_step_var.get()
-                )
-                eta_grid, ph_grid = np.meshgrid(eta_values, ph_values)
-            
-                # 获取模型和动力学参数
-                model = self.model_var.get()
-                kinetics = self.kinetics_var.get()
-            
-                # 初始化结果矩阵
-                Z_lgr = np.zeros_like(eta_grid)
-                Z_theta = np.zeros_like(eta_grid)
-            
-                # 根据模型获取参数
-                if model == "LH-AOM":
-                    if kinetics == "Butler-Volmer kinetics":
-                        ea0 = float(self.ea0_entry.get())
-                        steps = {}
-                        for step_entry in self.lh_aom_bv_entries:
-                            step_num = step_entry['step']
-                            steps[step_num] = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'gamma': float(step_entry['gamma'].get()),
-                                'beta': float(step_entry['beta'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-
-                        # 遍历每个点计算
-                        for i in range(len(ph_values)):
-                            for j in range(len(eta_values)):
-                                eta = eta_values[j]
-                                ph = ph_values[i]
-                                try:
-                                    # 计算k值
-                                    k = {}
-                                    # Step 1
-                                    step = steps[1]
-                                    k['k1a'] = self.calculate_bv_ka(step, ea0, T, eta, ph)
-                                    k['k-1a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, ph)
-                                    k['k1b'] = self.calculate_bv_kb(step, ea0, T, eta, ph)
-                                    k['k-1b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, ph)
-                                
-                                    # Step 21
-                                    step = steps[21]
-                                    k['k21a'] = self.calculate_bv_ka(step, ea0, T, eta, ph)
-                                    k['k-21a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, ph)
-                                    k['k21b'] = self.calculate_bv_kb(step, ea0, T, eta, ph)
-                                    k['k-21b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, ph)
-                                
-                                    # Step 22
-                                    step = steps[22]
-                                    k['k22a'] = self.calculate_bv_ka(step, ea0, T, eta, ph)
-                                    k['k-22a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, ph)
-                                    k['k22b'] = self.calculate_bv_kb(step, ea0, T, eta, ph)
-                                    k['k-22b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, ph)
-                                
-                                    # Step 31
-                                    step = steps[31]
-                                    k['k31a'] = self.calculate_bv_ka(step, ea0, T, eta, ph)
-                                    k['k-31a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, ph)
-                                    k['k31b'] = self.calculate_bv_kb(step, ea0, T, eta, ph)
-                                    k['k-31b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, ph)
-                                
-                                    # Step 32
-                                    step = steps[32]
-                                    k['k32a'] = self.calculate_bv_ka(step, ea0, T, eta, ph)
-                                    k['k-32a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, ph)
-                                    k['k32b'] = self.calculate_bv_kb(step, ea0, T, eta, ph)
-                                    k['k-32b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, ph)
-                                
-                                    # Step 4
-                                    step = steps[4]
-                                    k['k4a'] = self.calculate_bv_ka(step, ea0, T, eta, ph)
-                                    k['k-4a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, ph)
-                                    k['k4b'] = self.calculate_bv_kb(step, ea0, T, eta, ph)
-                                    k['k-4b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, ph)
-                                
-                                    # Step 5
-                                    step = steps[5]
-                                    gamma = step['gamma']
-                                    deltaG = step['deltaG']
-                                    if self.chem_method_var.get() == "BEP":
-                                        k['k5'] = (kB * T / h) * math.exp(-(ea0 + step['gamma'] * step['deltaG']) / (kB * T))
-                                        k['k-5'] = (kB * T / h) * math.exp(-(ea0 - step['gamma'] * step['deltaG']) / (kB * T))
-                                    else:
-                                        Ea5 = (1/gamma) * math.log(1 + (math.exp(gamma * deltaG)))
-                                        Ea_minus5 = (1/gamma) * math.log(1 + (math.exp(-gamma * deltaG)))
-                                        k['k5'] = (kB * T / h) * math.exp(-Ea5 / (kB * T))
-                                        k['k-5'] = (kB * T / h) * math.exp(-Ea_minus5 / (kB * T))
-
-                                    # 组合k值
-                                    k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - ph)
-                                    k['k-1'] = k['k-1a'] * 10**-ph + k['k-1b']
-                                    k['k21'] = k['k21a'] + k['k21b'] * 10**-(14 - ph)
-                                    k['k-21'] = k['k-21a'] * 10**-ph + k['k-21b']
-                                    k['k22'] = k['k22a'] + k['k22b'] * 10**-(14 - ph)
-                                    k['k-22'] = k['k-22a'] * 10**-ph + k['k-22b']
-                                    k['k31'] = k['k31a'] + k['k31b'] * 10**-(14 - ph)
-                                    k['k-31'] = k['k-31a'] * 10**-ph + k['k-31b']
-                                    k['k32'] = k['k32a'] + k['k32b'] * 10**-(14 - ph)
-                                    k['k-32'] = k['k-32a'] * 10**-ph + k['k-32b']
-                                    k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - ph)
-                                    k['k-4'] = k['k-4a'] * 10**-ph + k['k-4b']
-                                
-                                    # 计算θ
-                                    theta = self.calculate_lh_aom_theta(k)
-                                
-                                    # 计算r值
-                                    r = {
-                                        'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                        'r21': k['k21'] * theta['theta*OH'] - k['k-21'] * theta['theta*(OH)2'],
-                                        'r22': k['k22'] * theta['theta*OH'] - k['k-22'] * theta['theta*O'],
-                                        'r31': k['k31'] * theta['theta*(OH)2'] - k['k-31'] * theta['theta*O(OH)'],
-                                        'r32': k['k32'] * theta['theta*O'] - k['k-32'] * theta['theta*O(OH)'],
-                                        'r4': k['k4'] * theta['theta*O(OH)'] - k['k-4'] * theta['theta*O(O)'],
-                                        'r5': k['k5'] * theta['theta*O(O)'] - k['k-5'] * theta['theta*']
-                                    }
-                                    r['r2'] = r['r21'] + r['r22']
-                                    r['r3'] = r['r31'] + r['r32']
-                        
-                                
-                                    # 记录结果
-                                    current_r = r['r5']
-                                    Z_lgr[i,j] = math.log10(abs(current_r)) if current_r != 0 else -np.inf
-                                    Z_theta[i,j] = theta['theta*']
-                                    
-                                except Exception as e:
-                                    Z_lgr[i,j] = np.nan
-                                    Z_theta[i,j] = np.nan
-                                    print(f"Error at eta={eta}, ph={ph}: {str(e)}")
-
-                    elif kinetics == "Marcus kinetics":
-                        ea0 = float(self.ea0_entry.get())
-                        steps = {}
-                        for step_entry in self.lh_aom_marcus_entries:
-                            step_num = step_entry['step']
-                            steps[step_num] = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'lambda': float(step_entry['lambda'].get()),
-                                'gamma': float(step_entry['gamma'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-
-                        # 遍历每个点计算
-                        for i in range(len(ph_values)):
-                            for j in range(len(eta_values)):
-                                eta = eta_values[j]
-                                ph = ph_values[i]
-                                try:
-                                    # 计算k值
-                                    k = {}
-                                    # Step 1
-                                    step = steps[1]
-                                    k['k1a'] = self.calculate_marcus_ka(step, T, eta, ph)
-                                    k['k-1a'] = self.calculate_marcus_k_minus_a(step, T, eta, ph)
-                                    k['k1b'] = self.calculate_marcus_kb(step, T, eta, ph)
-                                    k['k-1b'] = self.calculate_marcus_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 21
-                                    step = steps[21]
-                                    k['k21a'] = self.calculate_marcus_ka(step, T, eta, ph)
-                                    k['k-21a'] = self.calculate_marcus_k_minus_a(step, T, eta, ph)
-                                    k['k21b'] = self.calculate_marcus_kb(step, T, eta, ph)
-                                    k['k-21b'] = self.calculate_marcus_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 22
-                                    step = steps[22]
-                                    k['k22a'] = self.calculate_marcus_ka(step, T, eta, ph)
-                                    k['k-22a'] = self.calculate_marcus_k_minus_a(step, T, eta, ph)
-                                    k['k22b'] = self.calculate_marcus_kb(step, T, eta, ph)
-                                    k['k-22b'] = self.calculate_marcus_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 31
-                                    step = steps[31]
-                                    k['k31a'] = self.calculate_marcus_ka(step, T, eta, ph)
-                                    k['k-31a'] = self.calculate_marcus_k_minus_a(step, T, eta, ph)
-                                    k['k31b'] = self.calculate_marcus_kb(step, T, eta, ph)
-                                    k['k-31b'] = self.calculate_marcus_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 32
-                                    step = steps[32]
-                                    k['k32a'] = self.calculate_marcus_ka(step, T, eta, ph)
-                                    k['k-32a'] = self.calculate_marcus_k_minus_a(step, T, eta, ph)
-                                    k['k32b'] = self.calculate_marcus_kb(step, T, eta, ph)
-                                    k['k-32b'] = self.calculate_marcus_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 4
-                                    step = steps[4]
-                                    k['k4a'] = self.calculate_marcus_ka(step, T, eta, ph)
-                                    k['k-4a'] = self.calculate_marcus_k_minus_a(step, T, eta, ph)
-                                    k['k4b'] = self.calculate_marcus_kb(step, T, eta, ph)
-                                    k['k-4b'] = self.calculate_marcus_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 5
-                                    step = steps[5]
-                                    gamma = step['gamma']
-                                    deltaG = step['deltaG']
-                                    if self.chem_method_var.get() == "BEP":
-                                        k['k5'] = (kB * T / h) * math.exp(-(ea0 + step['gamma'] * step['deltaG']) / (kB * T))
-                                        k['k-5'] = (kB * T / h) * math.exp(-(ea0 - step['gamma'] * step['deltaG']) / (kB * T))
-                                    else:
-                                        Ea5 = (1/gamma) * math.log(1 + (math.exp(gamma * deltaG)))
-                                        Ea_minus5 = (1/gamma) * math.log(1 + (math.exp(-gamma * deltaG)))
-                                        k['k5'] = (kB * T / h) * math.exp(-Ea5 / (kB * T))
-                                        k['k-5'] = (kB * T / h) * math.exp(-Ea_minus5 / (kB * T))
-
-                                    # 组合k值
-                                    k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - ph)
-                                    k['k-1'] = k['k-1a'] * 10**-ph + k['k-1b']
-                                    k['k21'] = k['k21a'] + k['k21b'] * 10**-(14 - ph)
-                                    k['k-21'] = k['k-21a'] * 10**-ph + k['k-21b']
-                                    k['k22'] = k['k22a'] + k['k22b'] * 10**-(14 - ph)
-                                    k['k-22'] = k['k-22a'] * 10**-ph + k['k-22b']
-                                    k['k31'] = k['k31a'] + k['k31b'] * 10**-(14 - ph)
-                                    k['k-31'] = k['k-31a'] * 10**-ph + k['k-31b']
-                                    k['k32'] = k['k32a'] + k['k32b'] * 10**-(14 - ph)
-                                    k['k-32'] = k['k-32a'] * 10**-ph + k['k-32b']
-                                    k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - ph)
-                                    k['k-4'] = k['k-4a'] * 10**-ph + k['k-4b']
-                                
-                                    # 计算θ
-                                    theta = self.calculate_lh_aom_theta(k)
-                                
-                                    # 计算r值
-                                    r = {
-                                        'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                        'r21': k['k21'] * theta['theta*OH'] - k['k-21'] * theta['theta*(OH)2'],
-                                        'r22': k['k22'] * theta['theta*OH'] - k['k-22'] * theta['theta*O'],
-                                        'r31': k['k31'] * theta['theta*(OH)2'] - k['k-31'] * theta['theta*O(OH)'],
-                                        'r32': k['k32'] * theta['theta*O'] - k['k-32'] * theta['theta*O(OH)'],
-                                        'r4': k['k4'] * theta['theta*O(OH)'] - k['k-4'] * theta['theta*O(O)'],
-                                        'r5': k['k5'] * theta['theta*O(O)'] - k['k-5'] * theta['theta*']
-                                    }
-                                    r['r2'] = r['r21'] + r['r22']
-                                    r['r3'] = r['r31'] + r['r32']
-                        
-                                
-                                    # 记录结果
-                                    current_r = r['r5']
-                                    Z_lgr[i,j] = math.log10(abs(current_r)) if current_r != 0 else -np.inf
-                                    Z_theta[i,j] = theta['theta*']
-                                    
-                                except Exception as e:
-                                    Z_lgr[i,j] = np.nan
-                                    Z_theta[i,j] = np.nan
-                                    print(f"Error at eta={eta}, ph={ph}: {str(e)}")
-
-                    elif kinetics == "Marcus-Gerischer kinetics":
-                        ea0 = float(self.ea0_entry.get())
-                        steps = {}
-                        for step_entry in self.lh_aom_mg_entries:
-                            step_num = step_entry['step']
-                            steps[step_num] = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'lambda': float(step_entry['lambda'].get()),
-                                'gamma': float(step_entry['gamma'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-
-                        # 遍历每个点计算
-                        for i in range(len(ph_values)):
-                            for j in range(len(eta_values)):
-                                eta = eta_values[j]
-                                ph = ph_values[i]
-                                try:
-                                    # 计算k值
-                                    k = {}
-                                    # Step 1
-                                    step = steps[1]
-                                    k['k1a'] = self.calculate_mg_ka(step, T, eta, ph)
-                                    k['k-1a'] = self.calculate_mg_k_minus_a(step, T, eta, ph)
-                                    k['k1b'] = self.calculate_mg_kb(step, T, eta, ph)
-                                    k['k-1b'] = self.calculate_mg_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 21
-                                    step = steps[21]
-                                    k['k21a'] = self.calculate_mg_ka(step, T, eta, ph)
-                                    k['k-21a'] = self.calculate_mg_k_minus_a(step, T, eta, ph)
-                                    k['k21b'] = self.calculate_mg_kb(step, T, eta, ph)
-                                    k['k-21b'] = self.calculate_mg_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 22
-                                    step = steps[22]
-                                    k['k22a'] = self.calculate_mg_ka(step, T, eta, ph)
-                                    k['k-22a'] = self.calculate_mg_k_minus_a(step, T, eta, ph)
-                                    k['k22b'] = self.calculate_mg_kb(step, T, eta, ph)
-                                    k['k-22b'] = self.calculate_mg_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 31
-                                    step = steps[31]
-                                    k['k31a'] = self.calculate_mg_ka(step, T, eta, ph)
-                                    k['k-31a'] = self.calculate_mg_k_minus_a(step, T, eta, ph)
-                                    k['k31b'] = self.calculate_mg_kb(step, T, eta, ph)
-                                    k['k-31b'] = self.calculate_mg_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 32
-                                    step = steps[32]
-                                    k['k32a'] = self.calculate_mg_ka(step, T, eta, ph)
-                                    k['k-32a'] = self.calculate_mg_k_minus_a(step, T, eta, ph)
-                                    k['k32b'] = self.calculate_mg_kb(step, T, eta, ph)
-                                    k['k-32b'] = self.calculate_mg_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 4
-                                    step = steps[4]
-                                    k['k4a'] = self.calculate_mg_ka(step, T, eta, ph)
-                                    k['k-4a'] = self.calculate_mg_k_minus_a(step, T, eta, ph)
-                                    k['k4b'] = self.calculate_mg_kb(step, T, eta, ph)
-                                    k['k-4b'] = self.calculate_mg_k_minus_b(step, T, eta, ph)
-                                
-                                    # Step 5
-                                    step = steps[5]
-                                    gamma = step['gamma']
-                                    deltaG = step['deltaG']
-                                    if self.chem_method_var.get() == "BEP":
-                                        k['k5'] = (kB * T / h) * math.exp(-(ea0 + step['gamma'] * step['deltaG']) / (kB * T))
-                                        k['k-5'] = (kB * T / h) * math.exp(-(ea0 - step['gamma'] * step['deltaG']) / (kB * T))
-                                    else:
-                                        Ea5 = (1/gamma) * math.log(1 + (math.exp(gamma * deltaG)))
-                                        Ea_minus5 = (1/gamma) * math.log(1 + (math.exp(-gamma * deltaG)))
-                                        k['k5'] = (kB * T / h) * math.exp(-Ea5 / (kB * T))
-                                        k['k-5'] = (kB * T / h) * math.exp(-Ea_minus5 / (kB * T))
-
-                                    # 组合k值
-                                    k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - ph)
-                                    k['k-1'] = k['k-1a'] * 10**-ph + k['k-1b']
-                                    k['k21'] = k['k21a'] + k['k21b'] * 10**-(14 - ph)
-                                    k['k-21'] = k['k-21a'] * 10**-ph + k['k-21b']
-                                    k['k22'] = k['k22a'] + k['k22b'] * 10**-(14 - ph)
-                                    k['k-22'] = k['k-22a'] * 10**-ph + k['k-22b']
-                                    k['k31'] = k['k31a'] + k['k31b'] * 10**-(14 - ph)
-                                    k['k-31'] = k['k-31a'] * 10**-ph + k['k-31b']
-                                    k['k32'] = k['k32a'] + k['k32b'] * 10**-(14 - ph)
-                                    k['k-32'] = k['k-32a'] * 10**-ph + k['k-32b']
-                                    k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - ph)
-                                    k['k-4'] = k['k-4a'] * 10**-ph + k['k-4b']
-                                
-                                    # 计算θ
-                                    theta = self.calculate_lh_aom_theta(k)
-                                
-                                    # 计算r值
-                                    r = {
-                                        'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                        'r21': k['k21'] * theta['theta*OH'] - k['k-21'] * theta['theta*(OH)2'],
-                                        'r22': k['k22'] * theta['theta*OH'] - k['k-22'] * theta['theta*O'],
-                                        'r31': k['k31'] * theta['theta*(OH)2'] - k['k-31'] * theta['theta*O(OH)'],
-                                        'r32': k['k32'] * theta['theta*O'] - k['k-32'] * theta['theta*O(OH)'],
-                                        'r4': k['k4'] * theta['theta*O(OH)'] - k['k-4'] * theta['theta*O(O)'],
-                                        'r5': k['k5'] * theta['theta*O(O)'] - k['k-5'] * theta['theta*']
-                                    }
-                                    r['r2'] = r['r21'] + r['r22']
-                                    r['r3'] = r['r31'] + r['r32']
-                        
-                                
-                                    # 记录结果
-                                    current_r = r['r5']
-                                    Z_lgr[i,j] = math.log10(abs(current_r)) if current_r != 0 else -np.inf
-                                    Z_theta[i,j] = theta['theta*']
-
-
-                                except Exception as e:
-                                    Z_lgr[i,j] = np.nan
-                                    Z_theta[i,j] = np.nan
-                                    print(f"Error at eta={eta}, ph={ph}: {str(e)}")                        
-
-                elif model == "ER-AOM":
-                    if kinetics == "Butler-Volmer kinetics":
-                        ea0 = float(self.ea0_entry.get())
-                        steps = []
-                        for step_entry in self.er_aom_bv_entries:
-                            steps.append({
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'gamma': float(step_entry['gamma'].get()),
-                                'beta': float(step_entry['beta'].get()),
-                                'z': float(step_entry['z'].get())
-                            })
-                    
-                        # 遍历每个点计算
-                        for i in range(len(ph_values)):
-                            for j in range(len(eta_values)):
-                                eta = eta_values[j]
-                                ph = ph_values[i]
-                                try:
-                                    # 计算k值
-                                    k = {} 
-                                    for step_idx, step in enumerate(steps, start=1):
-                                        # Forward reaction (a)
-                                        k[f'k{step_idx}a'] = self.calculate_bv_ka(step, ea0, T, eta, ph)
-                                        # Backward reaction (-a)
-                                        k[f'k-{step_idx}a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, ph)
-                                        # Forward reaction (b)
-                                        k[f'k{step_idx}b'] = self.calculate_bv_kb(step, ea0, T, eta, ph)
-                                        # Backward reaction (-b)
-                                        k[f'k-{step_idx}b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, ph)
-                                
-                                    # 组合k值
-                                    k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - ph)
-                                    k['k-1'] = k['k-1a'] * 10**-ph + k['k-1b']
-                                    k['k2'] = k['k2a'] + k['k2b'] * 10**-(14 - ph)
-                                    k['k-2'] = k['k-2a'] * 10**-ph + k['k-2b']
-                                    k['k3'] = k['k3a'] + k['k3b'] * 10**-(14 - ph)
-                                    k['k-3'] = k['k-3a'] * 10**-ph + k['k-3b']
-                                    k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - ph)
-                                    k['k-4'] = k['k-4a'] * 10**-ph + k['k-4b']
-                                
-                                    # 计算θ
-                                    theta = self.calculate_er_aom_theta(k)
-                                
-                                    # 计算r值
-                                    r = {
-                                        'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                        'r2': k['k2'] * theta['theta*OH'] - k['k-2'] * theta['theta*O'],
-                                        'r3': k['k3'] * theta['theta*O'] - k['k-3'] * theta['theta*OOH'],
-                                        'r4': k['k4'] * theta['theta*OOH'] - k['k-4'] * theta['theta*']
-                                    }
-                                
-                                    # 记录结果
-                                    current_r = r['r4']  # 根据实际需要调整
-                                    Z_lgr[i,j] = math.log10(abs(current_r)) if current_r != 0 else -np.inf
-                                    Z_theta[i,j] = theta['theta*']
-                                    
-                                except Exception as e:
-                                    Z_lgr[i,j] = np.nan
-                                    Z_theta[i,j] = np.nan
-                                    print(f"Error at eta={eta}, ph={ph}: {str(e)}")
-
-                    elif kinetics == "Marcus kinetics":
-                        steps = []
-                        for step_entry in self.er_aom_marcus_entries:
-                            steps.append({
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'lambda': float(step_entry['lambda'].get()),
-                                'z': float(step_entry['z'].get())
-                            })
-                    
-                        # 遍历每个点计算
-                        for i in range(len(ph_values)):
-                            for j in range(len(eta_values)):
-                                eta = eta_values[j]
-                                ph = ph_values[i]
-                                try:
-                                    # 计算k值
-                                    k = {} 
-                                    for step_idx, step in enumerate(steps, start=1):
-                                        # Forward reaction (a)
-                                        k[f'k{step_idx}a'] = self.calculate_marcus_ka(step, T, eta, ph)
-                                        # Backward reaction (-a)
-                                        k[f'k-{step_idx}a'] = self.calculate_marcus_k_minus_a(step, T, eta, ph)
-                                        # Forward reaction (b)
-                                        k[f'k{step_idx}b'] = self.calculate_marcus_kb(step, T, eta, ph)
-                                        # Backward reaction (-b)
-                                        k[f'k-{step_idx}b'] = self.calculate_marcus_k_minus_b(step, T, eta, ph)
-                                
-                                    # 组合k值
-                                    k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - ph)
-                                    k['k-1'] = k['k-1a'] * 10**-ph + k['k-1b']
-                                    k['k2'] = k['k2a'] + k['k2b'] * 10**-(14 - ph)
-                                    k['k-2'] = k['k-2a'] * 10**-ph + k['k-2b']
-                                    k['k3'] = k['k3a'] + k['k3b'] * 10**-(14 - ph)
-                                    k['k-3'] = k['k-3a'] * 10**-ph + k['k-3b']
-                                    k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - ph)
-                                    k['k-4'] = k['k-4a'] * 10**-ph + k['k-4b']
-                                
-                                    # 计算θ
-                                    theta = self.calculate_er_aom_theta(k)
-                                
-                                    # 计算r值
-                                    r = {
-                                        'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                        'r2': k['k2'] * theta['theta*OH'] - k['k-2'] * theta['theta*O'],
-                                        'r3': k['k3'] * theta['theta*O'] - k['k-3'] * theta['theta*OOH'],
-                                        'r4': k['k4'] * theta['theta*OOH'] - k['k-4'] * theta['theta*']
-                                    }
-                                
-                                    # 记录结果
-                                    current_r = r['r4']  # 根据实际需要调整
-                                    Z_lgr[i,j] = math.log10(abs(current_r)) if current_r != 0 else -np.inf
-                                    Z_theta[i,j] = theta['theta*']
-
-                                except Exception as e:
-                                    Z_lgr[i,j] = np.nan
-                                    Z_theta[i,j] = np.nan
-                                    print(f"Error at eta={eta}, ph={ph}: {str(e)}")
-    
-                    elif kinetics == "Marcus-Gerischer kinetics":
-                        steps = []
-                        for step_entry in self.er_aom_mg_entries:
-                            steps.append({
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'lambda': float(step_entry['lambda'].get()),
-                                'z': float(step_entry['z'].get())
-                            })
-        
-                        # 遍历每个点计算
-                        for i in range(len(ph_values)):
-                            for j in range(len(eta_values)):
-                                eta = eta_values[j]
-                                ph = ph_values[i]
-                                try:
-                                    # 计算k值
-                                    k = {} 
-                                    for step_idx, step in enumerate(steps, start=1):
-                                        # Forward reaction (a)
-                                        k[f'k{step_idx}a'] = self.calculate_mg_ka(step, T, eta, ph)
-                                        # Backward reaction (-a)
-                                        k[f'k-{step_idx}a'] = self.calculate_mg_k_minus_a(step, T, eta, ph)
-                                        # Forward reaction (b)
-                                        k[f'k{step_idx}b'] = self.calculate_mg_kb(step, T, eta, ph)
-                                        # Backward reaction (-b)
-                                        k[f'k-{step_idx}b'] = self.calculate_mg_k_minus_b(step, T, eta, ph)
-                                
-                                    # 组合k值
-                                    k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - ph)
-                                    k['k-1'] = k['k-1a'] * 10**-ph + k['k-1b']
-                                    k['k2'] = k['k2a'] + k['k2b'] * 10**-(14 - ph)
-                                    k['k-2'] = k['k-2a'] * 10**-ph + k['k-2b']
-                                    k['k3'] = k['k3a'] + k['k3b'] * 10**-(14 - ph)
-                                    k['k-3'] = k['k-3a'] * 10**-ph + k['k-3b']
-                                    k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - ph)
-                                    k['k-4'] = k['k-4a'] * 10**-ph + k['k-4b']
-                                
-                                    # 计算θ
-                                    theta = self.calculate_er_aom_theta(k)
-                                
-                                    # 计算r值
-                                    r = {
-                                        'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                        'r2': k['k2'] * theta['theta*OH'] - k['k-2'] * theta['theta*O'],
-                                        'r3': k['k3'] * theta['theta*O'] - k['k-3'] * theta['theta*OOH'],
-                                        'r4': k['k4'] * theta['theta*OOH'] - k['k-4'] * theta['theta*']
-                                    }
-                                
-                                    # 记录结果
-                                    current_r = r['r4']  # 根据实际需要调整
-                                    Z_lgr[i,j] = math.log10(abs(current_r)) if current_r != 0 else -np.inf
-                                    Z_theta[i,j] = theta['theta*']
-                                except Exception as e:
-                                    Z_lgr[i,j] = np.nan
-                                    Z_theta[i,j] = np.nan
-                                    print(f"Error at eta={eta}, ph={ph}: {str(e)}")                                    
-                                                             
-
-                # 保存结果
-                self.results_2d = {
-                    'eta': eta_grid,
-                    'ph': ph_grid,
-                    'lgr': Z_lgr,
-                    'theta': Z_theta
-                }
-                
-                # 绘制等值线图
-                self.create_contour_plot()
-                messagebox.showinfo("计算完成", "二维扫描计算成功完成！")
-                return
-            
-            else:
-                # 原有的一维逻辑
-                # Get variable range
-                var_range = np.arange(self.start_var.get(),
-                                    self.end_var.get() + self.step_var.get()/2,
-                                    self.step_var.get())
-
-                # Get fixed values based on selected variable
-                if self.variable_var.get() == "η":
-                    variable = var_range
-                    fixed_value = self.fixed_ph_var.get()
-                    fixed_label = "Fixed pH"
-                else:
-                    variable = var_range
-                    fixed_value = self.fixed_eta_var.get()
-                    fixed_label = "Fixed η"
-
-                # Get model and kinetics type
-                model = self.model_var.get()
-                kinetics = self.kinetics_var.get()
-
-                # Initialize results dictionary
-                results = {
-                    self.variable_var.get(): variable,
-                    fixed_label: [fixed_value] * len(variable)
-                }
-
-                # Perform calculations based on model and kinetics
-                # ... 原有的一维计算代码 ...
-                if model == "ER-AOM":
-                    if kinetics == "Butler-Volmer kinetics":
-                        # Get parameters for ER-AOM with Butler-Volmer kinetics
-                        ea0 = float(self.ea0_entry.get())                              
-                    
-                        # Get step parameters
-                        steps = []
-                        for step_entry in self.er_aom_bv_entries:
-                            step = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'gamma': float(step_entry['gamma'].get()),
-                                'beta': float(step_entry['beta'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-                            steps.append(step)
-                    
-                        # Calculate for each variable value
-                        k_values = []
-                        theta_values = []
-                        r_values = []
-                    
-                        for var in variable:
-                            if self.variable_var.get() == "η":
-                                eta = var
-                                pH = fixed_value
-                            else:
-                                eta = fixed_value
-                                pH = var
-                        
-                            # Calculate all k values
-                            k = {}
-                            for i, step in enumerate(steps, start=1):
-                                # Forward reaction (a)
-                                k[f'k{i}a'] = self.calculate_bv_ka(step, ea0, T, eta, pH)
-                                # Backward reaction (-a)
-                                k[f'k-{i}a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, pH)
-                                # Forward reaction (b)
-                                k[f'k{i}b'] = self.calculate_bv_kb(step, ea0, T, eta, pH)
-                                # Backward reaction (-b)
-                                k[f'k-{i}b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, pH)
-                        
-                            # Calculate combined k values
-                            k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - pH)
-                            k['k-1'] = k['k-1a'] * 10**-pH + k['k-1b']
-                            k['k2'] = k['k2a'] + k['k2b'] * 10**-(14 - pH)
-                            k['k-2'] = k['k-2a'] * 10**-pH + k['k-2b']
-                            k['k3'] = k['k3a'] + k['k3b'] * 10**-(14 - pH)
-                            k['k-3'] = k['k-3a'] * 10**-pH + k['k-3b']
-                            k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - pH)
-                            k['k-4'] = k['k-4a'] * 10**-pH + k['k-4b']
-                        
-                            # Calculate θ values
-                            theta = self.calculate_er_aom_theta(k)
-                        
-                            # Calculate r values
-                            r = {
-                                'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                'r2': k['k2'] * theta['theta*OH'] - k['k-2'] * theta['theta*O'],
-                                'r3': k['k3'] * theta['theta*O'] - k['k-3'] * theta['theta*OOH'],
-                                'r4': k['k4'] * theta['theta*OOH'] - k['k-4'] * theta['theta*']
-                            }
-                        
-                            # Store results
-                            k_values.append(k)
-                            theta_values.append(theta)
-                            r_values.append(r)
-                    
-                        # Prepare results for output
-                        for i in range(1, 5):
-                            results[f'k{i}'] = [k[f'k{i}'] for k in k_values]
-                            results[f'k-{i}'] = [k[f'k-{i}'] for k in k_values]
-                            results[f'lg(r{i})'] = [math.log10(abs(r[f'r{i}'])) if r[f'r{i}'] != 0 else -float('inf') for r in r_values]
-                    
-                        for theta_name in ['theta*', 'theta*OH', 'theta*O', 'theta*OOH']:
-                            results[theta_name] = [theta[theta_name] for theta in theta_values]
-                    
-                    elif kinetics == "Marcus kinetics":
-                        # Get step parameters
-                        steps = []
-                        for step_entry in self.er_aom_marcus_entries:
-                            step = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'lambda': float(step_entry['lambda'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-                            steps.append(step)
-                    
-                        # Calculate for each variable value
-                        k_values = []
-                        theta_values = []
-                        r_values = []
-                    
-                        for var in variable:
-                            if self.variable_var.get() == "η":
-                                eta = var
-                                pH = fixed_value
-                            else:
-                                eta = fixed_value
-                                pH = var
-                        
-                            # Calculate all k values
-                            k = {}
-                            for i, step in enumerate(steps, start=1):
-                                #"Marcus kinetics"
-                                # Forward reaction (a)
-                                k[f'k{i}a'] = self.calculate_marcus_ka(step, T, eta, pH)
-                                # Backward reaction (-a)
-                                k[f'k-{i}a'] = self.calculate_marcus_k_minus_a(step, T, eta, pH)
-                                # Forward reaction (b)
-                                k[f'k{i}b'] = self.calculate_marcus_kb(step, T, eta, pH)
-                                # Backward reaction (-b)
-                                k[f'k-{i}b'] = self.calculate_marcus_k_minus_b(step, T, eta, pH)
-                        
-                            # Calculate combined k values
-                            k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - pH)
-                            k['k-1'] = k['k-1a'] * 10**-pH + k['k-1b']
-                            k['k2'] = k['k2a'] + k['k2b'] * 10**-(14 - pH)
-                            k['k-2'] = k['k-2a'] * 10**-pH + k['k-2b']
-                            k['k3'] = k['k3a'] + k['k3b'] * 10**-(14 - pH)
-                            k['k-3'] = k['k-3a'] * 10**-pH + k['k-3b']
-                            k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - pH)
-                            k['k-4'] = k['k-4a'] * 10**-pH + k['k-4b']
-                        
-                            # Calculate θ values
-                            theta = self.calculate_er_aom_theta(k)
-                        
-                            # Calculate r values
-                            r = {
-                                'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                'r2': k['k2'] * theta['theta*OH'] - k['k-2'] * theta['theta*O'],
-                                'r3': k['k3'] * theta['theta*O'] - k['k-3'] * theta['theta*OOH'],
-                                'r4': k['k4'] * theta['theta*OOH'] - k['k-4'] * theta['theta*']
-                            }
-                        
-                            # Store results
-                            k_values.append(k)
-                            theta_values.append(theta)
-                            r_values.append(r)
-                    
-                        # Prepare results for output
-                        for i in range(1, 5):
-                            results[f'k{i}'] = [k[f'k{i}'] for k in k_values]
-                            results[f'k-{i}'] = [k[f'k-{i}'] for k in k_values]
-                            results[f'lg(r{i})'] = [math.log10(abs(r[f'r{i}'])) if r[f'r{i}'] != 0 else -float('inf') for r in r_values]
-                    
-                        for theta_name in ['theta*', 'theta*OH', 'theta*O', 'theta*OOH']:
-                            results[theta_name] = [theta[theta_name] for theta in theta_values]
-            
-                    else:  # Marcus-Gerischer kinetics
-                        # Get step parameters
-                        steps = []
-                        for step_entry in self.er_aom_mg_entries:
-                            step = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'lambda': float(step_entry['lambda'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-                            steps.append(step)
-                    
-                        # Calculate for each variable value
-                        k_values = []
-                        theta_values = []
-                        r_values = []
-                    
-                        for var in variable:
-                            if self.variable_var.get() == "η":
-                                eta = var
-                                pH = fixed_value
-                            else:
-                                eta = fixed_value
-                                pH = var
-                        
-                            # Calculate all k values
-                            k = {}
-                            for i, step in enumerate(steps, start=1):
-                                # Marcus-Gerischer
-                                # Forward reaction (a)
-                                k[f'k{i}a'] = self.calculate_mg_ka(step, T, eta, pH)
-                                # Backward reaction (-a)
-                                k[f'k-{i}a'] = self.calculate_mg_k_minus_a(step, T, eta, pH)
-                                # Forward reaction (b)
-                                k[f'k{i}b'] = self.calculate_mg_kb(step, T, eta, pH)
-                                # Backward reaction (-b)
-                                k[f'k-{i}b'] = self.calculate_mg_k_minus_b(step, T, eta, pH)
-                        
-                            # Calculate combined k values
-                            k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - pH)
-                            k['k-1'] = k['k-1a'] * 10**-pH + k['k-1b']
-                            k['k2'] = k['k2a'] + k['k2b'] * 10**-(14 - pH)
-                            k['k-2'] = k['k-2a'] * 10**-pH + k['k-2b']
-                            k['k3'] = k['k3a'] + k['k3b'] * 10**-(14 - pH)
-                            k['k-3'] = k['k-3a'] * 10**-pH + k['k-3b']
-                            k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - pH)
-                            k['k-4'] = k['k-4a'] * 10**-pH + k['k-4b']
-                        
-                            # Calculate θ values
-                            theta = self.calculate_er_aom_theta(k)
-                        
-                            # Calculate r values
-                            r = {
-                                'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                'r2': k['k2'] * theta['theta*OH'] - k['k-2'] * theta['theta*O'],
-                                'r3': k['k3'] * theta['theta*O'] - k['k-3'] * theta['theta*OOH'],
-                                'r4': k['k4'] * theta['theta*OOH'] - k['k-4'] * theta['theta*']
-                            }
-                        
-                            # Store results
-                            k_values.append(k)
-                            theta_values.append(theta)
-                            r_values.append(r)
-                    
-                        # Prepare results for output
-                        for i in range(1, 5):
-                            results[f'k{i}'] = [k[f'k{i}'] for k in k_values]
-                            results[f'k-{i}'] = [k[f'k-{i}'] for k in k_values]
-                            results[f'lg(r{i})'] = [math.log10(abs(r[f'r{i}'])) if r[f'r{i}'] != 0 else -float('inf') for r in r_values]
-                    
-                        for theta_name in ['theta*', 'theta*OH', 'theta*O', 'theta*OOH']:
-                            results[theta_name] = [theta[theta_name] for theta in theta_values]
-            
-                else:  # LH-AOM model
-                    if kinetics == "Butler-Volmer kinetics":
-                        # Get parameters for LH-AOM with Butler-Volmer kinetics
-                        ea0 = float(self.ea0_entry.get())
-                    
-                        # Get step parameters
-                        steps = {}
-                        for step_entry in self.lh_aom_bv_entries:
-                            step_num = step_entry['step']
-                            steps[step_num] = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'gamma': float(step_entry['gamma'].get()),
-                                'beta': float(step_entry['beta'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-                        required_steps = [1,21,22,31,32,4,5]
-                        for step in required_steps:
-                            if step not in steps:
-                                raise ValueError(f"缺少步骤 {step} 的参数")
-                    
-                        # Calculate for each variable value
-                        k_values = []
-                        theta_values = []
-                        r_values = []
-                    
-                        for var in variable:
-                            if self.variable_var.get() == "η":
-                                eta = var
-                                pH = fixed_value
-                            else:
-                                eta = fixed_value
-                                pH = var
-                        
-                            # Calculate all k values
-                            k = {}
-                        
-                            # Step 1
-                            step = steps[1]
-                            k['k1a'] = self.calculate_bv_ka(step, ea0, T, eta, pH)
-                            k['k-1a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, pH)
-                            k['k1b'] = self.calculate_bv_kb(step, ea0, T, eta, pH)
-                            k['k-1b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, pH)
-                        
-                            # Step 21
-                            step = steps[21]
-                            k['k21a'] = self.calculate_bv_ka(step, ea0, T, eta, pH)
-                            k['k-21a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, pH)
-                            k['k21b'] = self.calculate_bv_kb(step, ea0, T, eta, pH)
-                            k['k-21b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, pH)
-                        
-                            # Step 22
-                            step = steps[22]
-                            k['k22a'] = self.calculate_bv_ka(step, ea0, T, eta, pH)
-                            k['k-22a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, pH)
-                            k['k22b'] = self.calculate_bv_kb(step, ea0, T, eta, pH)
-                            k['k-22b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, pH)
-                        
-                            # Step 31
-                            step = steps[31]
-                            k['k31a'] = self.calculate_bv_ka(step, ea0, T, eta, pH)
-                            k['k-31a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, pH)
-                            k['k31b'] = self.calculate_bv_kb(step, ea0, T, eta, pH)
-                            k['k-31b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, pH)
-                        
-                            # Step 32
-                            step = steps[32]
-                            k['k32a'] = self.calculate_bv_ka(step, ea0, T, eta, pH)
-                            k['k-32a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, pH)
-                            k['k32b'] = self.calculate_bv_kb(step, ea0, T, eta, pH)
-                            k['k-32b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, pH)
-                        
-                            # Step 4
-                            step = steps[4]
-                            k['k4a'] = self.calculate_bv_ka(step, ea0, T, eta, pH)
-                            k['k-4a'] = self.calculate_bv_k_minus_a(step, ea0, T, eta, pH)
-                            k['k4b'] = self.calculate_bv_kb(step, ea0, T, eta, pH)
-                            k['k-4b'] = self.calculate_bv_k_minus_b(step, ea0, T, eta, pH)
-                        
-                            # Step 5
-                            step = steps[5]
-                            gamma = step['gamma']
-                            deltaG = step['deltaG']
-                            if self.chem_method_var.get() == "BEP":
-                                k['k5'] = (kB * T / h) * math.exp(-(ea0 + step['gamma'] * step['deltaG']) / (kB * T))
-                                k['k-5'] = (kB * T / h) * math.exp(-(ea0 - step['gamma'] * step['deltaG']) / (kB * T))
-                            else:
-                                Ea5 = (1/gamma) * math.log(1 + (math.exp(gamma * deltaG)))
-                                Ea_minus5 = (1/gamma) * math.log(1 + (math.exp(-gamma * deltaG)))
-                                k['k5'] = (kB * T / h) * math.exp(-Ea5 / (kB * T))
-                                k['k-5'] = (kB * T / h) * math.exp(-Ea_minus5 / (kB * T))
-
-                            # Calculate combined k values
-                            k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - pH)
-                            k['k-1'] = k['k-1a'] * 10**-pH + k['k-1b']
-                            k['k21'] = k['k21a'] + k['k21b'] * 10**-(14 - pH)
-                            k['k-21'] = k['k-21a'] * 10**-pH + k['k-21b']
-                            k['k22'] = k['k22a'] + k['k22b'] * 10**-(14 - pH)
-                            k['k-22'] = k['k-22a'] * 10**-pH + k['k-22b']
-                            k['k31'] = k['k31a'] + k['k31b'] * 10**-(14 - pH)
-                            k['k-31'] = k['k-31a'] * 10**-pH + k['k-31b']
-                            k['k32'] = k['k32a'] + k['k32b'] * 10**-(14 - pH)
-                            k['k-32'] = k['k-32a'] * 10**-pH + k['k-32b']
-                            k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - pH)
-                            k['k-4'] = k['k-4a'] * 10**-pH + k['k-4b']
-                            
-                            # Calculate θ values
-                            theta = self.calculate_lh_aom_theta(k)
-                        
-                            # Calculate r values
-                            r = {
-                                'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                'r21': k['k21'] * theta['theta*OH'] - k['k-21'] * theta['theta*(OH)2'],
-                                'r22': k['k22'] * theta['theta*OH'] - k['k-22'] * theta['theta*O'],
-                                'r31': k['k31'] * theta['theta*(OH)2'] - k['k-31'] * theta['theta*O(OH)'],
-                                'r32': k['k32'] * theta['theta*O'] - k['k-32'] * theta['theta*O(OH)'],
-                                'r4': k['k4'] * theta['theta*O(OH)'] - k['k-4'] * theta['theta*O(O)'],
-                                'r5': k['k5'] * theta['theta*O(O)'] - k['k-5'] * theta['theta*']
-                            }
-                            # 在计算r值的代码块末尾添加：
-                            r['r2'] = r['r21'] + r['r22']
-                            r['r3'] = r['r31'] + r['r32']
-                            
-                            # Store results
-                            k_values.append(k)
-                            theta_values.append(theta)
-                            r_values.append(r)
-                    
-                        # Prepare results for output
-                        for step in ['1', '21', '22', '31', '32', '4', '5']:
-                            results[f'k{step}'] = [k[f'k{step}'] for k in k_values]
-                            results[f'k-{step}'] = [k[f'k-{step}'] for k in k_values]
-                    
-                        for r_step in ['1', '21', '22', '2', '31', '32','3',  '4', '5']:
-                            results[f'r{r_step}'] = [r[f'r{r_step}'] for r in r_values]  # 添加原始速率
-                            results['lg(r5)'] = [math.log10(abs(r['r5'])) if r['r5'] != 0 else -float('inf') for r in r_values]
-                            results['lg(r21)'] = [math.log10(abs(r['r21'])) if r['r21'] != 0 else -float('inf') for r in r_values]
-                            results['lg(r22)'] = [math.log10(abs(r['r22'])) if r['r22'] != 0 else -float('inf') for r in r_values]
-                     
-                        for theta_name in ['theta*', 'theta*OH', 'theta*(OH)2', 'theta*O', 'theta*O(OH)', 'theta*O(O)']:
-                            results[theta_name] = [theta[theta_name] for theta in theta_values]
-                
-                    elif kinetics == "Marcus kinetics":
-                        # 获取 Ea,0
-                        # Get parameters for LH-AOM with Butler-Volmer kinetics
-                        ea0 = float(self.ea0_entry.get())
-                    
-                        # Get step parameters
-                        steps = {}
-                        for step_entry in self.lh_aom_marcus_entries:
-                            step_num = step_entry['step']
-                            steps[step_num] = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'lambda': float(step_entry['lambda'].get()),
-                                'gamma': float(step_entry['gamma'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-                        required_steps = [1,21,22,31,32,4,5]
-                        for step in required_steps:
-                            if step not in steps:
-                                raise ValueError(f"缺少步骤 {step} 的参数")
-                    
-                        # Calculate for each variable value
-                        k_values = []
-                        theta_values = []
-                        r_values = []
-                    
-                        for var in variable:
-                            if self.variable_var.get() == "η":
-                                eta = var
-                                pH = fixed_value
-                            else:
-                                eta = fixed_value
-                                pH = var
-                        
-                            # Calculate all k values
-                            k = {}
-                        
-                            #"Marcus kinetics"
-                            # Step 1
-                            step = steps[1]                            
-                            k['k1a'] = self.calculate_marcus_ka(step, T, eta, pH)
-                            k['k-1a'] = self.calculate_marcus_k_minus_a(step, T, eta, pH)
-                            k['k1b'] = self.calculate_marcus_kb(step, T, eta, pH)
-                            k['k-1b'] = self.calculate_marcus_k_minus_b(step, T, eta, pH)
-                            
-                            # Step 21
-                            step = steps[21]
-                            k['k21a'] = self.calculate_marcus_ka(step, T, eta, pH)
-                            k['k-21a'] = self.calculate_marcus_k_minus_a(step, T, eta, pH)
-                            k['k21b'] = self.calculate_marcus_kb(step, T, eta, pH)
-                            k['k-21b'] = self.calculate_marcus_k_minus_b(step, T, eta, pH)
-                          
-                            # Step 22
-                            step = steps[22]
-                            k['k22a'] = self.calculate_marcus_ka(step, T, eta, pH)
-                            k['k-22a'] = self.calculate_marcus_k_minus_a(step, T, eta, pH)
-                            k['k22b'] = self.calculate_marcus_kb(step, T, eta, pH)
-                            k['k-22b'] = self.calculate_marcus_k_minus_b(step, T, eta, pH)
-                            
-                            # Step 31
-                            step = steps[31]
-                            k['k31a'] = self.calculate_marcus_ka(step, T, eta, pH)
-                            k['k-31a'] = self.calculate_marcus_k_minus_a(step, T, eta, pH)
-                            k['k31b'] = self.calculate_marcus_kb(step, T, eta, pH)
-                            k['k-31b'] = self.calculate_marcus_k_minus_b(step, T, eta, pH)
-                     
-                            # Step 32
-                            step = steps[32]                  
-                            k['k32a'] = self.calculate_marcus_ka(step, T, eta, pH)
-                            k['k-32a'] = self.calculate_marcus_k_minus_a(step, T, eta, pH)
-                            k['k32b'] = self.calculate_marcus_kb(step, T, eta, pH)
-                            k['k-32b'] = self.calculate_marcus_k_minus_b(step, T, eta, pH)
-                           
-                            # Step 4
-                            step = steps[4]                         
-                            k['k4a'] = self.calculate_marcus_ka(step, T, eta, pH)
-                            k['k-4a'] = self.calculate_marcus_k_minus_a(step, T, eta, pH)
-                            k['k4b'] = self.calculate_marcus_kb(step, T, eta, pH)
-                            k['k-4b'] = self.calculate_marcus_k_minus_b(step, T, eta, pH)
-                            
-                            # Step 5
-                            step = steps[5]
-                            gamma = step['gamma']
-                            deltaG = step['deltaG']
-                            if self.chem_method_var.get() == "BEP":
-                                k['k5'] = (kB * T / h) * math.exp(-(ea0 + step['gamma'] * step['deltaG']) / (kB * T))
-                                k['k-5'] = (kB * T / h) * math.exp(-(ea0 - step['gamma'] * step['deltaG']) / (kB * T))
-                            else:
-                                Ea5 = (1/gamma) * math.log(1 + (math.exp(gamma * deltaG)))
-                                Ea_minus5 = (1/gamma) * math.log(1 + (math.exp(-gamma * deltaG)))
-                                k['k5'] = (kB * T / h) * math.exp(-Ea5 / (kB * T))
-                                k['k-5'] = (kB * T / h) * math.exp(-Ea_minus5 / (kB * T))
-                 
-                            # Calculate combined k values
-                            k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - pH)
-                            k['k-1'] = k['k-1a'] * 10**-pH + k['k-1b']
-                            k['k21'] = k['k21a'] + k['k21b'] * 10**-(14 - pH)
-                            k['k-21'] = k['k-21a'] * 10**-pH + k['k-21b']
-                            k['k22'] = k['k22a'] + k['k22b'] * 10**-(14 - pH)
-                            k['k-22'] = k['k-22a'] * 10**-pH + k['k-22b']
-                            k['k31'] = k['k31a'] + k['k31b'] * 10**-(14 - pH)
-                            k['k-31'] = k['k-31a'] * 10**-pH + k['k-31b']
-                            k['k32'] = k['k32a'] + k['k32b'] * 10**-(14 - pH)
-                            k['k-32'] = k['k-32a'] * 10**-pH + k['k-32b']
-                            k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - pH)
-                            k['k-4'] = k['k-4a'] * 10**-pH + k['k-4b']
-                        
-                            # Calculate θ values
-                            theta = self.calculate_lh_aom_theta(k)
-                        
-                           # Calculate r values
-                            r = {
-                                'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                'r21': k['k21'] * theta['theta*OH'] - k['k-21'] * theta['theta*(OH)2'],
-                                'r22': k['k22'] * theta['theta*OH'] - k['k-22'] * theta['theta*O'],
-                                'r31': k['k31'] * theta['theta*(OH)2'] - k['k-31'] * theta['theta*O(OH)'],
-                                'r32': k['k32'] * theta['theta*O'] - k['k-32'] * theta['theta*O(OH)'],
-                                'r4': k['k4'] * theta['theta*O(OH)'] - k['k-4'] * theta['theta*O(O)'],
-                                'r5': k['k5'] * theta['theta*O(O)'] - k['k-5'] * theta['theta*']
-                            }
-                            # 在计算r值的代码块末尾添加：
-                            r['r2'] = r['r21'] + r['r22']
-                            r['r3'] = r['r31'] + r['r32']
-                        
-                            # Store results
-                            k_values.append(k)
-                            theta_values.append(theta)
-                            r_values.append(r)
-                    
-                        # Prepare results for output
-                        for step in ['1', '21', '22', '31', '32', '4', '5']:
-                            results[f'k{step}'] = [k[f'k{step}'] for k in k_values]
-                            results[f'k-{step}'] = [k[f'k-{step}'] for k in k_values]
-                    
-                        for r_step in ['1', '21', '22', '2', '31', '32','3',  '4', '5']:
-                            results[f'r{r_step}'] = [r[f'r{r_step}'] for r in r_values]  # 添加原始速率
-                            results['lg(r5)'] = [math.log10(abs(r['r5'])) if r['r5'] != 0 else -float('inf') for r in r_values]
-                            results['lg(r21)'] = [math.log10(abs(r['r21'])) if r['r21'] != 0 else -float('inf') for r in r_values]
-                            results['lg(r22)'] = [math.log10(abs(r['r22'])) if r['r22'] != 0 else -float('inf') for r in r_values]
-                     
-                        for theta_name in ['theta*', 'theta*OH', 'theta*(OH)2', 'theta*O', 'theta*O(OH)', 'theta*O(O)']:
-                            results[theta_name] = [theta[theta_name] for theta in theta_values]
-
-                    else:  # Marcus-Gerischer kinetics
-                        # 获取 Ea,0
-                        ea0 = float(self.ea0_entry.get())
-
-                        # Get step parameters
-                        steps = {}
-                        for step_entry in self.lh_aom_mg_entries:
-                            step_num = step_entry['step']
-                            steps[step_num] = {
-                                'deltaG': float(step_entry['deltaG'].get()),
-                                'lambda': float(step_entry['lambda'].get()),
-                                'gamma': float(step_entry['gamma'].get()),
-                                'z': float(step_entry['z'].get())
-                            }
-                        required_steps = [1,21,22,31,32,4,5]
-                        for step in required_steps:
-                            if step not in steps:
-                                raise ValueError(f"缺少步骤 {step} 的参数")
-                    
-                        # Calculate for each variable value
-                        k_values = []
-                        theta_values = []
-                        r_values = []
-                    
-                        for var in variable:
-                            if self.variable_var.get() == "η":
-                                eta = var
-                                pH = fixed_value
-                            else:
-                                eta = fixed_value
-                                pH = var
-                        
-                            # Calculate all k values
-                            k = {}
-                        
-                            # Step 1
-                            step = steps[1]                           
-                            k['k1a'] = self.calculate_mg_ka(step, T, eta, pH)
-                            k['k-1a'] = self.calculate_mg_k_minus_a(step, T, eta, pH)
-                            k['k1b'] = self.calculate_mg_kb(step, T, eta, pH)
-                            k['k-1b'] = self.calculate_mg_k_minus_b(step, T, eta, pH)
-                        
-                            # Step 21
-                            step = steps[21]
-                            k['k21a'] = self.calculate_mg_ka(step, T, eta, pH)
-                            k['k-21a'] = self.calculate_mg_k_minus_a(step, T, eta, pH)
-                            k['k21b'] = self.calculate_mg_kb(step, T, eta, pH)
-                            k['k-21b'] = self.calculate_mg_k_minus_b(step, T, eta, pH)
-                        
-                            # Step 22
-                            step = steps[22]
-                            k['k22a'] = self.calculate_mg_ka(step, T, eta, pH)
-                            k['k-22a'] = self.calculate_mg_k_minus_a(step, T, eta, pH)
-                            k['k22b'] = self.calculate_mg_kb(step, T, eta, pH)
-                            k['k-22b'] = self.calculate_mg_k_minus_b(step, T, eta, pH)
-                        
-                            # Step 31
-                            step = steps[31]
-                            k['k31a'] = self.calculate_mg_ka(step, T, eta, pH)
-                            k['k-31a'] = self.calculate_mg_k_minus_a(step, T, eta, pH)
-                            k['k31b'] = self.calculate_mg_kb(step, T, eta, pH)
-                            k['k-31b'] = self.calculate_mg_k_minus_b(step, T, eta, pH)
-                        
-                            # Step 32
-                            step = steps[32]
-                            k['k32a'] = self.calculate_mg_ka(step, T, eta, pH)
-                            k['k-32a'] = self.calculate_mg_k_minus_a(step, T, eta, pH)
-                            k['k32b'] = self.calculate_mg_kb(step, T, eta, pH)
-                            k['k-32b'] = self.calculate_mg_k_minus_b(step, T, eta, pH)
-                        
-                            # Step 4
-                            step = steps[4]
-                            k['k4a'] = self.calculate_mg_ka(step, T, eta, pH)
-                            k['k-4a'] = self.calculate_mg_k_minus_a(step, T, eta, pH)
-                            k['k4b'] = self.calculate_mg_kb(step, T, eta, pH)
-                            k['k-4b'] = self.calculate_mg_k_minus_b(step, T, eta, pH)
-                        
-                            # Step 5
-                            step = steps[5]
-                            gamma = step['gamma']
-                            deltaG = step['deltaG']
-                            if self.chem_method_var.get() == "BEP":
-                                k['k5'] = (kB * T / h) * math.exp(-(ea0 + step['gamma'] * step['deltaG']) / (kB * T))
-                                k['k-5'] = (kB * T / h) * math.exp(-(ea0 - step['gamma'] * step['deltaG']) / (kB * T))
-                            else:
-                                Ea5 = (1/gamma) * math.log(1 + (math.exp(gamma * deltaG)))
-                                Ea_minus5 = (1/gamma) * math.log(1 + (math.exp(-gamma * deltaG)))
-                                k['k5'] = (kB * T / h) * math.exp(-Ea5 / (kB * T))
-                                k['k-5'] = (kB * T / h) * math.exp(-Ea_minus5 / (kB * T))
-                
-                            # Calculate combined k values
-                            k['k1'] = k['k1a'] + k['k1b'] * 10**-(14 - pH)
-                            k['k-1'] = k['k-1a'] * 10**-pH + k['k-1b']
-                            k['k21'] = k['k21a'] + k['k21b'] * 10**-(14 - pH)
-                            k['k-21'] = k['k-21a'] * 10**-pH + k['k-21b']
-                            k['k22'] = k['k22a'] + k['k22b'] * 10**-(14 - pH)
-                            k['k-22'] = k['k-22a'] * 10**-pH + k['k-22b']
-                            k['k31'] = k['k31a'] + k['k31b'] * 10**-(14 - pH)
-                            k['k-31'] = k['k-31a'] * 10**-pH + k['k-31b']
-                            k['k32'] = k['k32a'] + k['k32b'] * 10**-(14 - pH)
-                            k['k-32'] = k['k-32a'] * 10**-pH + k['k-32b']
-                            k['k4'] = k['k4a'] + k['k4b'] * 10**-(14 - pH)
-                            k['k-4'] = k['k-4a'] * 10**-pH + k['k-4b']
-                        
-                            # Calculate θ values
-                            theta = self.calculate_lh_aom_theta(k)
-                        
-                           # Calculate r values
-                            r = {
-                                'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
-                                'r21': k['k21'] * theta['theta*OH'] - k['k-21'] * theta['theta*(OH)2'],
-                                'r22': k['k22'] * theta['theta*OH'] - k['k-22'] * theta['theta*O'],
-                                'r31': k['k31'] * theta['theta*(OH)2'] - k['k-31'] * theta['theta*O(OH)'],
-                                'r32': k['k32'] * theta['theta*O'] - k['k-32'] * theta['theta*O(OH)'],
-                                'r4': k['k4'] * theta['theta*O(OH)'] - k['k-4'] * theta['theta*O(O)'],
-                                'r5': k['k5'] * theta['theta*O(O)'] - k['k-5'] * theta['theta*']
-                            }
-                            # 在计算r值的代码块末尾添加：
-                            r['r2'] = r['r21'] + r['r22']
-                            r['r3'] = r['r31'] + r['r32']
-                        
-                            # Store results
-                            k_values.append(k)
-                            theta_values.append(theta)
-                            r_values.append(r)
-                    
-                        # Prepare results for output
-                        for step in ['1', '21', '22', '31', '32', '4', '5']:
-                            results[f'k{step}'] = [k[f'k{step}'] for k in k_values]
-                            results[f'k-{step}'] = [k[f'k-{step}'] for k in k_values]
-                    
-                        for r_step in ['1', '21', '22', '2', '31', '32','3',  '4', '5']:
-                            results[f'r{r_step}'] = [r[f'r{r_step}'] for r in r_values]  # 添加原始速率
-                            results['lg(r5)'] = [math.log10(abs(r['r5'])) if r['r5'] != 0 else -float('inf') for r in r_values]
-                            results['lg(r21)'] = [math.log10(abs(r['r21'])) if r['r21'] != 0 else -float('inf') for r in r_values]
-                            results['lg(r22)'] = [math.log10(abs(r['r22'])) if r['r22'] != 0 else -float('inf') for r in r_values]
-                     
-                        for theta_name in ['theta*', 'theta*OH', 'theta*(OH)2', 'theta*O', 'theta*O(OH)', 'theta*O(O)']:
-                            results[theta_name] = [theta[theta_name] for theta in theta_values]
-                            
-                # 获取当前参数
-                model = self.model_var.get()
-                kinetics = self.kinetics_var.get()
-                T = float(self.temp_entry.get())
-                parameters = {
-                    "Model": model,
-                    "Kinetics": kinetics,
-                    "Temperature (K)": T,
-                }
-
-                # 将参数添加到结果DataFrame中
-                for key, value in parameters.items():
-                    results[key] = [value] * len(var_range)
-
-                # 创建结果DataFrame
-                self.results_df = pd.DataFrame(results)
-                
-                # 更新主窗口的表格和图表
-                self.update_results_table()
-                self.update_plot()
-
-                # 在新窗口中显示图表
-                self.create_plot_window()
-                self.update_plot_in_new_window()
-
-            messagebox.showinfo("计算完成", "计算成功完成！")
-        except Exception as e:
-            messagebox.showerror("Calculation Error", f"An error occurred during calculation:\n{str(e)}")
-            traceback.print_exc()
-            
-    def create_contour_plot(self):
-        """创建二维等值线图"""
-        if not hasattr(self, 'results_2d'):
-            return
-        
-        # 创建新窗口
-        contour_window = tk.Toplevel(self.root)
-        contour_window.title("二维等值线图")
-        contour_window.geometry("800x600")
-        
-        fig = plt.figure(figsize=(8, 6))
-        ax = fig.add_subplot(111)
-        
-        # 提取数据
-        eta = self.results_2d['eta']
-        ph = self.results_2d['ph']
-        lgr = self.results_2d['lgr']
-        
-        # 绘制等值线图
-        contour = ax.contourf(eta, ph, lgr, levels=20, cmap='viridis')
-        fig.colorbar(contour, ax=ax, label='log(r5)')
-        
-        ax.set_xlabel('η (V)')
-        ax.set_ylabel('pH')
-        ax.set_title('log(r5) as function of η and pH')
-        
-        canvas = FigureCanvasTkAgg(fig, master=contour_window)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        toolbar = NavigationToolbar2Tk(canvas, contour_window)
-        toolbar.update()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-   # 辅助计算函数（完整实现）
-    def calculate_bv_ka(self, step, ea0, T, eta, pH):
-        """Calculate k for forward reaction (a) using Butler-Volmer kinetics"""
-        if self.bv_method_var.get() == "BEP":
-            # 原有BEP公式
-            ea0 = float(self.ea0_entry.get())
-            term1 = (kB * T / h) * math.exp(-(ea0 + step['gamma'] * step['deltaG']) / (kB * T))
-            term2 = math.exp(step['beta'] * (F / (R * T)) * (eta - (R * T / F) * (math.log(10)) * pH))
-            return term1 * term2
-        else:
-            # Softplus公式
-            gamma = step['gamma']
-            deltaG = step['deltaG']
-            # 计算Ea0
-            Ea0 = (1/gamma) * math.log(1 + math.exp(gamma * deltaG))
-            # 计算k_ia
-            term1 = (kB * T / h) * math.exp(-Ea0 / (kB * T))
-            term2 = math.exp(step['beta'] * (F / (R * T)) * (eta - (R * T / F) * (math.log(10)) * pH))
-            return term1 * term2
-
-    def calculate_bv_k_minus_a(self, step, ea0, T, eta, pH):
-        """Calculate k for backward reaction (-a) using Butler-Volmer kinetics"""
-        if self.bv_method_var.get() == "BEP":
-            # 原有BEP公式
-            ea0 = float(self.ea0_entry.get())
-            term1 = (kB * T / h) * math.exp(-(ea0 - step['gamma'] * step['deltaG']) / (kB * T))
-            term2 = math.exp(- ( 1 - step['beta']) * (F / (R * T)) * (eta - (R * T / F) * (math.log(10)) * pH))
-            return term1 * term2
-        else:
-            # Softplus公式
-            gamma = step['gamma']
-            deltaG = step['deltaG']
-            # 计算Ea0
-            Ea0 = (1/gamma) * math.log(1 + math.exp(gamma * deltaG))
-            # 计算k_minus_ia
-            term1 = (kB * T / h) * math.exp(-Ea0 / (kB * T))
-            term2 = math.exp(- ( 1 - step['beta']) * (F / (R * T)) * (eta - (R * T / F) * (math.log(10)) * pH))
-            return term1 * term2
-
-    def calculate_bv_kb(self, step, ea0, T, eta, pH):
-        """Calculate k for forward reaction (b) using Butler-Volmer kinetics"""
-        deltaGw = self.delta_gw_var.get()  # 获取用户输入
-        if self.bv_method_var.get() == "BEP":
-            # 原有BEP公式
-            ea0 = float(self.ea0_entry.get())
-            term1 = (kB * T / h) * math.exp((-(ea0 + step['gamma'] * (step['deltaG'] - step['z'] * deltaGw ))) / (kB * T))
-            term2 = math.exp(step['beta'] * (F / (R * T)) * (eta - (R * T / F) * (math.log(10)) * pH))
-            return term1 * term2
-        else:
-            # Softplus公式
-            gamma = step['gamma']
-            deltaG = step['deltaG']
-            # 计算Ea0
-            Ea0 = (1/gamma) * math.log(1 + math.exp(gamma * (deltaG + step['z'] * (R * T / F) * math.log(10) * (-14))))
-            # 计算k_ib
-            term1 = (kB * T / h) * math.exp(-Ea0 / (kB * T))
-            term2 = math.exp(step['beta'] * (F / (R * T)) * (eta - (R * T / F) * (math.log(10)) * pH))
-            return term1 * term2
-
-    def calculate_bv_k_minus_b(self, step, ea0, T, eta, pH):
-        """Calculate k for backward reaction (-b) using Butler-Volmer kinetics"""
-        deltaGw = self.delta_gw_var.get()  # 获取用户输入
-        if self.bv_method_var.get() == "BEP":
-            # 原有BEP公式
-            ea0 = float(self.ea0_entry.get())
-            term1 = (kB * T / h) * math.exp((-(ea0 - step['gamma'] * (step['deltaG'] - step['z'] * deltaGw))) / (kB * T))
-            term2 = math.exp(- ( 1 - step['beta']) * (F / (R * T)) * (eta - (R * T / F) * (math.log(10)) * pH))
-            return term1 * term2
-        else:
-            # Softplus公式
-            gamma = step['gamma']
-            deltaG = step['deltaG']
-            # 计算Ea0
-            Ea0 = (1/gamma) * math.log(1 + math.exp(gamma * ( - deltaG - step['z'] * (R * T / F) * (math.log(10)) * (-14))))
-            # 计算k_minus_ib
-            term1 = (kB * T / h) * math.exp(-Ea0 / (kB * T))
-            term2 = math.exp(- ( 1 - step['beta']) * (F / (R * T)) * (eta - (R * T / F) * (math.log(10)) * pH))
-            return term1 * term2
-
-    def calculate_marcus_ka(self, step, T, eta, pH):
-        """Calculate k for forward reaction (a) using Marcus kinetics"""
-        exponent = -(+step['deltaG'] - step['z'] * (eta - (R * T / F) * (math.log(10)) * pH) + step['lambda'])**2 / (4 * step['lambda'] * kB * T)
-        return (kB * T / h) * math.exp(exponent)
-
-    def calculate_marcus_k_minus_a(self, step, T, eta, pH):
-        """Calculate k for backward reaction (-a) using Marcus kinetics"""
-        exponent = -(-step['deltaG'] + step['z'] * (eta - (R * T / F) * (math.log(10)) * pH) + step['lambda'])**2 / (4 * step['lambda'] * kB * T)
-        return (kB * T / h) * math.exp(exponent)
-
-    def calculate_marcus_kb(self, step, T, eta, pH):
-        """Calculate k for forward reaction (b) using Marcus kinetics"""
-        deltaGw = self.delta_gw_var.get()  # 获取用户输入
-        exponent = -(+step['deltaG'] - step['z'] * (eta - (R * T / F) * (math.log(10)) * pH + deltaGw ) + step['lambda'])**2 / (4 * step['lambda'] * kB * T)
-        return (kB * T / h) * math.exp(exponent)
-
-    def calculate_marcus_k_minus_b(self, step, T, eta, pH):
-        """Calculate k for backward reaction (-b) using Marcus kinetics"""
-        deltaGw = self.delta_gw_var.get()  # 获取用户输入
-        exponent = -(-step['deltaG'] + step['z'] * (eta - (R * T / F) * (math.log(10)) * pH + deltaGw) + step['lambda'])**2 / (4 * step['lambda'] * kB * T)
-        return (kB * T / h) * math.exp(exponent)
-
-    def calculate_mg_ka(self, step, T, eta, pH):
-        """Calculate k for forward reaction (a) using Marcus-Gerischer kinetics"""    
-        deltaG = step['deltaG']    
-        z = step['z']
-        lambda_val = step['lambda']
-    
-        def integrand(epsilon):
-            term = deltaG - z * (eta - (R * T / F) * (math.log(10)) * pH) 
-            exponent = -( (term + epsilon + lambda_val) ** 2 ) / (4 * lambda_val * kB * T)
-            fermi = 1 / (1 + math.exp(-epsilon / (kB * T ))) 
-            return math.exp(exponent) * fermi
-        
-        int_low = -5 * lambda_val
-        int_high = 5 * lambda_val
-        integral, _ = quad(integrand, int_low, int_high)
-        return (kB * T / h) * integral
-
-    def calculate_mg_k_minus_a(self, step, T, eta, pH):
-        """Calculate k for backward reaction (-a) using Marcus-Gerischer kinetics"""
-        deltaG = step['deltaG']
-        z = step['z']
-        lambda_val = step['lambda']
-    
-        def integrand(epsilon):
-            term = -deltaG + z * (eta - (R * T / F) * (math.log(10)) * pH)
-            exponent = -( (term - epsilon + lambda_val) ** 2 ) / (4 * lambda_val * kB * T)
-            fermi = 1 / (1 + math.exp(epsilon / (kB * T )))
-            return math.exp(exponent) * fermi
-
-        int_low = -5 * lambda_val
-        int_high = 5 * lambda_val
-        integral, _ = quad(integrand, int_low, int_high)
-        return (kB * T / h) * integral
-
-    def calculate_mg_kb(self, step, T, eta, pH):
-        """Calculate k for forward reaction (b) using Marcus-Gerischer kinetics"""
-        deltaGw = self.delta_gw_var.get()  # 获取用户输入
-        deltaG = step['deltaG']
-        z = step['z']
-        lambda_val = step['lambda']
-    
-        def integrand(epsilon):
-            term = deltaG - z * (eta - (R * T / F) * (math.log(10)) * pH + deltaGw)
-            exponent = -( (term + epsilon + lambda_val) ** 2 ) / (4 * lambda_val * kB * T)
-            fermi = 1 / (1 + math.exp(-epsilon / (kB * T )))
-            return math.exp(exponent) * fermi
-    
-        int_low = -5 * lambda_val
-        int_high = 5 * lambda_val
-        integral, _ = quad(integrand, int_low, int_high)
-        return (kB * T / h) * integral
-
-    def calculate_mg_k_minus_b(self, step, T, eta, pH):
-        """Calculate k for backward reaction (-b) using Marcus-Gerischer kinetics"""
-        deltaGw = self.delta_gw_var.get()  # 获取用户输入
-        deltaG = step['deltaG']
-        z = step['z']
-        lambda_val = step['lambda']
-    
-        def integrand(epsilon):
-            term = - deltaG + z * (eta - (R * T / F) * (math.log(10)) * pH + deltaGw)
-            exponent = -( (term - epsilon + lambda_val) ** 2 ) / (4 * lambda_val * kB * T)
-            fermi = 1 / (1 + math.exp(epsilon / (kB * T )))
-            return math.exp(exponent) * fermi
-    
-        int_low = -5 * lambda_val
-        int_high = 5 * lambda_val
-        integral, _ = quad(integrand, int_low, int_high)
-        return (kB * T / h) * integral
-
-
-    def calculate_er_aom_theta(self, k):
-        """Calculate θ values for ER-AOM model"""
-        # Calculate numerator and denominator terms
-        term1 = k['k-1']*k['k-2']*k['k-3'] + k['k-1']*k['k-2']*k['k4'] + k['k-1']*k['k3']*k['k4'] + k['k2']*k['k3']*k['k4']
-        term2 = k['k1']*k['k-2']*k['k-3'] + k['k1']*k['k-2']*k['k4'] + k['k1']*k['k3']*k['k4'] + k['k-2']*k['k-3']*k['k-4']
-        term3 = k['k1']*k['k2']*k['k-3'] + k['k1']*k['k2']*k['k4'] + k['k-1']*k['k-3']*k['k-4'] + k['k2']*k['k-3']*k['k-4']
-        term4 = k['k1']*k['k2']*k['k3'] + k['k-1']*k['k-2']*k['k-4'] + k['k-1']*k['k3']*k['k-4'] + k['k2']*k['k3']*k['k-4']
-        
-        denominator = term1 + term2 + term3 + term4
-        if denominator <= 1e-30:  # 避免浮点精度问题
-           raise ValueError("分母为零，无法计算θ。请检查步骤参数是否导致速率常数（k）全为零。")
-        
-        # Calculate θ values
-        theta = {
-            'theta*': term1 / denominator,
-            'theta*OH': term2 / denominator,
-            'theta*O': term3 / denominator,
-            'theta*OOH': term4 / denominator
-        }
-        
-        return theta
-
-    def calculate_lh_aom_theta(self, k):
-        """Calculate θ values for LH-AOM model"""
-        # Calculate numerator and denominator terms
-        term1 = k['k-1']*k['k-21']*k['k-22']*k['k-31']*k['k-4'] + k['k-1']*k['k-21']*k['k-22']*k['k-31']*k['k5'] + k['k-1']*k['k-21']*k['k-22']*k['k-32']*k['k-4'] + k['k-1']*k['k-21']*k['k-22']*k['k-32']*k['k5'] + k['k-1']*k['k-21']*k['k-22']*k['k4']*k['k5'] + k['k-1']*k['k-21']*k['k-31']*k['k32']*k['k-4'] + k['k-1']*k['k-21']*k['k-31']*k['k32']*k['k5'] + k['k-1']*k['k-21']*k['k32']*k['k4']*k['k5'] + k['k-1']*k['k-22']*k['k31']*k['k-32']*k['k-4'] + k['k-1']*k['k-22']*k['k31']*k['k-32']*k['k5'] + k['k-1']*k['k-22']*k['k31']*k['k4']*k['k5'] + k['k-1']*k['k31']*k['k32']*k['k4']*k['k5'] + k['k21']*k['k-22']*k['k31']*k['k4']*k['k5'] + k['k21']*k['k31']*k['k32']*k['k4']*k['k5'] + k['k-21']*k['k22']*k['k32']*k['k4']*k['k5'] + k['k22']*k['k31']*k['k32']*k['k4']*k['k5']
-        term2 = k['k1']*k['k-21']*k['k-22']*k['k-31']*k['k-4'] + k['k1']*k['k-21']*k['k-22']*k['k-31']*k['k5'] + k['k1']*k['k-21']*k['k-22']*k['k-32']*k['k-4'] + k['k1']*k['k-21']*k['k-22']*k['k-32']*k['k5'] + k['k1']*k['k-21']*k['k-22']*k['k4']*k['k5'] + k['k1']*k['k-21']*k['k-31']*k['k32']*k['k-4'] + k['k1']*k['k-21']*k['k-31']*k['k32']*k['k5'] + k['k1']*k['k-21']*k['k32']*k['k4']*k['k5'] + k['k1']*k['k-22']*k['k31']*k['k-32']*k['k-4'] + k['k1']*k['k-22']*k['k31']*k['k-32']*k['k5'] + k['k1']*k['k-22']*k['k31']*k['k4']*k['k5'] + k['k1']*k['k31']*k['k32']*k['k4']*k['k5'] + k['k-21']*k['k-22']*k['k-31']*k['k-4']*k['k-5'] + k['k-21']*k['k-22']*k['k-32']*k['k-4']*k['k-5'] + k['k-21']*k['k-31']*k['k32']*k['k-4']*k['k-5'] + k['k-22']*k['k31']*k['k-32']*k['k-4']*k['k-5']
-        term3 = k['k1']*k['k21']*k['k-22']*k['k-31']*k['k-4'] + k['k1']*k['k21']*k['k-22']*k['k-31']*k['k5'] + k['k1']*k['k21']*k['k-22']*k['k-32']*k['k-4'] + k['k1']*k['k21']*k['k-22']*k['k-32']*k['k5'] + k['k1']*k['k21']*k['k-22']*k['k4']*k['k5'] + k['k1']*k['k21']*k['k-31']*k['k32']*k['k-4'] + k['k1']*k['k21']*k['k-31']*k['k32']*k['k5'] + k['k1']*k['k21']*k['k32']*k['k4']*k['k5'] + k['k1']*k['k22']*k['k-31']*k['k32']*k['k-4'] + k['k1']*k['k22']*k['k-31']*k['k32']*k['k5'] + k['k-1']*k['k-22']*k['k-31']*k['k-4']*k['k-5'] + k['k-1']*k['k-31']*k['k32']*k['k-4']*k['k-5'] + k['k21']*k['k-22']*k['k-31']*k['k-4']*k['k-5'] + k['k21']*k['k-22']*k['k-32']*k['k-4']*k['k-5'] + k['k21']*k['k-31']*k['k32']*k['k-4']*k['k-5'] + k['k22']*k['k-31']*k['k32']*k['k-4']*k['k-5']
-        term4 = k['k1']*k['k21']*k['k31']*k['k-32']*k['k-4'] + k['k1']*k['k21']*k['k31']*k['k-32']*k['k5'] + k['k1']*k['k-21']*k['k22']*k['k-31']*k['k-4'] + k['k1']*k['k-21']*k['k22']*k['k-31']*k['k5'] + k['k1']*k['k-21']*k['k22']*k['k-32']*k['k-4'] + k['k1']*k['k-21']*k['k22']*k['k-32']*k['k5'] + k['k1']*k['k-21']*k['k22']*k['k4']*k['k5'] + k['k1']*k['k22']*k['k31']*k['k-32']*k['k-4'] + k['k1']*k['k22']*k['k31']*k['k-32']*k['k5'] + k['k1']*k['k22']*k['k31']*k['k4']*k['k5'] + k['k-1']*k['k-21']*k['k-32']*k['k-4']*k['k-5'] + k['k-1']*k['k31']*k['k-32']*k['k-4']*k['k-5'] + k['k21']*k['k31']*k['k-32']*k['k-4']*k['k-5'] + k['k-21']*k['k22']*k['k-31']*k['k-4']*k['k-5'] + k['k-21']*k['k22']*k['k-32']*k['k-4']*k['k-5'] + k['k22']*k['k31']*k['k-32']*k['k-4']*k['k-5']
-        term5 = k['k1']*k['k21']*k['k-22']*k['k31']*k['k-4'] + k['k1']*k['k21']*k['k-22']*k['k31']*k['k5'] + k['k1']*k['k21']*k['k31']*k['k32']*k['k-4'] + k['k1']*k['k21']*k['k31']*k['k32']*k['k5'] + k['k1']*k['k-21']*k['k22']*k['k32']*k['k-4'] + k['k1']*k['k-21']*k['k22']*k['k32']*k['k5'] + k['k1']*k['k22']*k['k31']*k['k32']*k['k-4'] + k['k1']*k['k22']*k['k31']*k['k32']*k['k5'] + k['k-1']*k['k-21']*k['k-22']*k['k-4']*k['k-5'] + k['k-1']*k['k-21']*k['k32']*k['k-4']*k['k-5'] + k['k-1']*k['k-22']*k['k31']*k['k-4']*k['k-5'] + k['k-1']*k['k31']*k['k32']*k['k-4']*k['k-5'] + k['k21']*k['k-22']*k['k31']*k['k-4']*k['k-5'] + k['k21']*k['k31']*k['k32']*k['k-4']*k['k-5'] + k['k-21']*k['k22']*k['k32']*k['k-4']*k['k-5'] + k['k22']*k['k31']*k['k32']*k['k-4']*k['k-5']
-        term6 = k['k1']*k['k21']*k['k-22']*k['k31']*k['k4'] + k['k1']*k['k21']*k['k31']*k['k32']*k['k4'] + k['k1']*k['k-21']*k['k22']*k['k32']*k['k4'] + k['k1']*k['k22']*k['k31']*k['k32']*k['k4'] + k['k-1']*k['k-21']*k['k-22']*k['k-31']*k['k-5'] + k['k-1']*k['k-21']*k['k-22']*k['k-32']*k['k-5'] + k['k-1']*k['k-21']*k['k-22']*k['k4']*k['k-5'] + k['k-1']*k['k-21']*k['k-31']*k['k32']*k['k-5'] + k['k-1']*k['k-21']*k['k32']*k['k4']*k['k-5'] + k['k-1']*k['k-22']*k['k31']*k['k-32']*k['k-5'] + k['k-1']*k['k-22']*k['k31']*k['k4']*k['k-5'] + k['k-1']*k['k31']*k['k32']*k['k4']*k['k-5'] + k['k21']*k['k-22']*k['k31']*k['k4']*k['k-5'] + k['k21']*k['k31']*k['k32']*k['k4']*k['k-5'] + k['k-21']*k['k22']*k['k32']*k['k4']*k['k-5'] + k['k22']*k['k31']*k['k32']*k['k4']*k['k-5']
-     
-        denominator = term1 + term2 + term3 + term4 + term5 + term6
-        if denominator == 0:
-           raise ValueError("计算θ时分母为零！请检查输入的动力学参数（k值是否全为零）。")
-    
-        # Calculate θ values (simplified)
-        theta = {
-            'theta*': term1 / denominator,
-            'theta*OH': term2 / denominator,
-            'theta*(OH)2': term3 / denominator,
-            'theta*O': term4 / denominator,
-            'theta*O(OH)': term5 / denominator,
-            'theta*O(O)':term6 / denominator
-        }
-        
-        return theta
-     # 界面更新函数
-    def update_results_table(self):
-        self.tree.delete(*self.tree.get_children())
-        columns = list(self.results_df.columns)
-        self.tree["columns"] = columns
-        
-        # 设置列标题和初始宽度
-        for col in columns:
-            self.tree.heading(col, text=col)
-            self.tree.column(col, 
-                            width=tk.font.Font().measure(col[:15]) + 20,
-                            anchor=tk.CENTER,
-                            stretch=False)
-        
-        # 插入数据行
-        for _, row in self.results_df.iterrows():
-            formatted_row = [
-                f"{x:.4e}" if isinstance(x, float) else str(x)
-                for x in row
-            ]
-            self.tree.insert("", tk.END, values=list(row))
-        
-        # 动态调整列宽
-        for col in columns:
-            max_width = tk.font.Font().measure(col[:15])  # 限制标题显示长度
-            for item in self.results_df[col]:
-                item_str = f"{item:.4e}" if isinstance(item, float) else str(item)
-                item_width = tk.font.Font().measure(item_str[:15])  # 限制内容显示长度
-                if item_width > max_width:
-                    max_width = item_width
-            self.tree.column(col, width=max_width + 20)
-                    
-
-        # 添加滚动条自动隐藏功能（可选）
-        def check_scrollbars():
-            vsb_needed = self.tree.yview() != (0.0, 1.0)
-            hsb_needed = self.tree.xview() != (0.0, 1.0)
-    
-            vsb.grid_configure(column=1, sticky="ns" if vsb_needed else "")
-            hsb.grid_configure(row=1, sticky="ew" if hsb_needed else "")
-    
-            self.root.after(100, check_scrollbars)
-
-    def update_plot(self):
-        """优化后的绘图方法"""
-        self.fig.set_size_inches(8, 6 + len(self.results_df)*0.1)  # 动态调整高度
-        self.canvas.draw()
-        try:
-            # 清除旧数据
-            [ax.clear() for ax in [self.ax_k, self.ax_lgr, self.ax_theta]]
-            
-            # 获取变量数据
-            variable = self.results_df.columns[0]
-            x = self.results_df[variable]
-            
-            # 设置统一颜色主题
-            colors = plt.cm.tab10.colors
-            
-            # 绘制速率常数
-            k_cols = [c for c in self.results_df.columns if c.startswith('k')]
-            for idx, col in enumerate(k_cols):
-                self.ax_k.plot(x, self.results_df[col], 
-                              color=colors[idx%10],
-                              linewidth=1.5,
-                              label=col)
-            self.ax_k.set_title("Rate Constants", fontsize=10, pad=8)
-            self.ax_k.legend(fontsize=7, loc='upper right', framealpha=0.8)
-            
-            # 绘制对数速率
-            lgr_cols = [c for c in self.results_df.columns if c.startswith('lg(r')]
-            for idx, col in enumerate(lgr_cols):
-                self.ax_lgr.plot(x, self.results_df[col], 
-                                color=colors[idx%10],
-                                linewidth=1.5,
-                                label=col.replace('lg','log'))
-            self.ax_lgr.set_title("Reaction Rates (log scale)", fontsize=10, pad=8)
-            self.ax_lgr.legend(fontsize=7, loc='upper right', framealpha=0.8)
-            
-            # 绘制表面覆盖度
-            theta_cols = [c for c in self.results_df.columns if c.startswith('theta')]
-            for idx, col in enumerate(theta_cols):
-                self.ax_theta.plot(x, self.results_df[col], 
-                                  color=colors[idx%10],
-                                  linewidth=1.5,
-                                  label=col)
-            self.ax_theta.set_title("Surface Coverage", fontsize=10, pad=8)
-            self.ax_theta.legend(fontsize=7, loc='upper right', framealpha=0.8)
-            
-            # 统一设置坐标标签
-            for ax in [self.ax_k, self.ax_lgr]:
-                ax.set_xlabel("")
-                ax.tick_params(labelbottom=False)
-            self.ax_theta.set_xlabel(variable, fontsize=9)
-            
-            # 优化布局
-            self.canvas.draw()
-            
-        except Exception as e:
-            messagebox.showerror("绘图错误", f"图表生成失败：\n{str(e)}")
-            traceback.print_exc()
-
-    # 保存功能
-    def save_results(self):
-        try:
-            if hasattr(self, 'results_df'):
-                file_path = filedialog.asksaveasfilename(
-                    defaultextension=".xlsx",
-                    filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("All files", "*.*")],
-                    title="保存结果"
-                )
-                if file_path:
-                    if file_path.endswith('.csv'):
-                        self.results_df.to_csv(file_path, index=False)
-                    else:
-                        self.results_df.to_excel(file_path, index=False)
-                    messagebox.showinfo("保存成功", f"文件已保存至：\n{file_path}")
-            else:
-                messagebox.showwarning("无数据", "请先进行计算")
-        except Exception as e:
-            messagebox.showerror("保存错误", f"保存失败：\n{str(e)}")
-
-if __name__ == "__main__":
-    root = tk.Tk()
-    app = AOMKineticsGUI(root)
-    root.mainloop()
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import numpy as np
+import pandas as pd
+import scipy.constants as const
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import (
+    FigureCanvasTkAgg, NavigationToolbar2Tk
+)
+import os
+import math
+import traceback
+import queue
+import threading
+import time
+
+from aomkinetics.mg import set_table_directory
+from aomkinetics.params import BV_KINETICS, MARCUS_KINETICS, KINETICS, simulation_parameters
+from aomkinetics.engine import RATE_KEY, scan_points, scan_1d_points, scan_1d, mg_accuracy
+from aomkinetics.arrhenius import arrhenius_scan
+from aomkinetics.parallel import default_workers, parallel_scan_2d
+from aomkinetics.store import scan_2d_to_store, open_map
+from aomkinetics.screening import read_catalyst_table, screen_catalysts
+from aomkinetics.fitting import FitCancelled, read_polarization_data, fit_parameters
+from aomkinetics.uncertainty import MC_SAMPLES, default_distributions, parse_distributions, uncertainty_scan
+from aomkinetics.sobol import SOBOL_SAMPLES, default_ranges, format_ranges, parse_ranges, sobol_indices, sobol_table
+from aomkinetics.volcano import (
+    DESCRIPTORS, SCALING_RELATIONS, format_scaling_relations, parse_scaling_relations, volcano, volcano_table,
+)
+from aomkinetics.resultcache import RESULT_CACHE_BYTES, ResultCache, result_key
+from aomkinetics.adaptive import (
+    LGR_TOLERANCE, THETA_TOLERANCE, MAX_POINTS_1D, adaptive_scan_2d, adaptive_results_2d, adaptive_scan_1d,
+)
+
+# 物理常数
+from aomkinetics.constants import R, F, h, kB, eV_to_J, epsilon
+
+PROGRESS_POLL_MS = 100  # 主线程轮询计算进度的间隔
+SCREEN_TABLE_ROWS = 500  # 筛选结果表格中显示的行数（保存时写出全部行）
+SCAN_EXECUTION_KEYS = ('workers', 'chunk_rows', 'chunk', 'store')  # 只影响计算方式、不影响结果的扫描设置
+SOBOL_BARS = 12  # Sobol 条形图中的输入数
+SOBOL_LINES = 6  # Sobol 指数随 η 变化图中的输入数
+
+class AOMKineticsGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("AOM Kinetic Simulation")
+        self.root.geometry("1200x800")
+        self.style = ttk.Style()
+        self.style.configure('TFrame', background='#f0f0f0')
+        self.style.configure('TLabel', background='#f0f0f0', font=('Arial', 10))
+        self.style.configure('TButton', font=('Arial', 10))
+        self.style.configure('Header.TLabel', font=('Arial', 11, 'bold'))
+
+        # 初始化变量
+        self.model_var = tk.StringVar(value="ER-AOM")
+        self.kinetics_var = tk.StringVar(value="Butler-Volmer kinetics")
+        self.bv_method_var = tk.StringVar(value="BEP")  # 新增变量
+        self.chem_method_var = tk.StringVar(value="BEP")# 化学反应方法
+        self.chem_method_var.trace_add("write", self.update_parameters)  # 切换时更新参数界面
+        self.variable_var = tk.StringVar(value="η")
+        self.delta_gw_var = tk.DoubleVar(value=0.8277)  # 新增△G_w变量
+        self.start_var = tk.DoubleVar(value=-1.0)
+        self.end_var = tk.DoubleVar(value=1.0)
+        self.step_var = tk.DoubleVar(value=0.01)
+        self.fixed_eta_var = tk.DoubleVar(value=0.5)
+        self.fixed_ph_var = tk.DoubleVar(value=0)
+        
+        # 2D扫描参数
+        self.eta_start_var = tk.DoubleVar(value=-1.0)
+        self.eta_end_var = tk.DoubleVar(value=1.0)
+        self.eta_step_var = tk.DoubleVar(value=0.01)
+        self.ph_start_var = tk.DoubleVar(value=0)
+        self.ph_end_var = tk.DoubleVar(value=14)
+        self.ph_step_var = tk.DoubleVar(value=1)
+        # 温度扫描（与 η 范围组合，计算表观活化能）
+        self.t_start_var = tk.DoubleVar(value=280)
+        self.t_end_var = tk.DoubleVar(value=340)
+        self.t_step_var = tk.DoubleVar(value=5)
+        self.workers_var = tk.IntVar(value=default_workers())  # 2D扫描的并行进程数
+        self.chunk_rows_var = tk.IntVar(value=0)  # 每个任务的pH行数，0为自动
+        self.drc_var = tk.BooleanVar(value=False)  # 2D扫描同时计算速率控制度图
+        self.slopes_var = tk.BooleanVar(value=False)  # 2D扫描同时计算 Tafel 斜率与 pH 反应级数图
+        self.map_store_var = tk.StringVar(value="")  # 2D结果目录，非空时结果写入磁盘
+        self.adaptive_var = tk.BooleanVar(value=False)  # 自适应加密，步长为最细分辨率
+        self.max_points_var = tk.IntVar(value=MAX_POINTS_1D)  # 一维自适应扫描的点数上限
+        self.lgr_tol_var = tk.DoubleVar(value=LGR_TOLERANCE)
+        self.theta_tol_var = tk.DoubleVar(value=THETA_TOLERANCE)
+
+        # 火山图：描述符范围，标度关系在 volcano_text 中编辑
+        self.d1_name_var = tk.StringVar(value=DESCRIPTORS[0])
+        self.d1_start_var = tk.DoubleVar(value=-0.5)
+        self.d1_end_var = tk.DoubleVar(value=2.5)
+        self.d1_step_var = tk.DoubleVar(value=0.01)
+        self.volcano_2d_var = tk.BooleanVar(value=True)
+        self.d2_name_var = tk.StringVar(value=DESCRIPTORS[1])
+        self.d2_start_var = tk.DoubleVar(value=0.0)
+        self.d2_end_var = tk.DoubleVar(value=4.0)
+        self.d2_step_var = tk.DoubleVar(value=0.01)
+        # 一维扫描的 Monte Carlo 不确定度：分布在 mc_text 中编辑
+        self.mc_var = tk.BooleanVar(value=False)
+        self.mc_samples_var = tk.IntVar(value=MC_SAMPLES)
+        self.mc_seed_var = tk.IntVar(value=0)
+        # Sobol 全局灵敏度：输入区间在 sobol_text 中编辑（空为 default_ranges）
+        self.sobol_samples_var = tk.IntVar(value=SOBOL_SAMPLES)
+        self.sobol_seed_var = tk.IntVar(value=0)
+        # 拟合实验数据：待拟合参数（逗号分隔，空为全部步骤的 ΔG）
+        self.fit_names_var = tk.StringVar(value="")
+        
+        # 存储参数的Entry部件
+        self.er_aom_bv_entries = []
+        self.er_aom_marcus_entries = []
+        self.er_aom_mg_entries = []  # 初始化MG参数容器
+        self.lh_aom_bv_entries = []
+        self.lh_aom_marcus_entries = []
+        self.lh_aom_mg_entries = []  # 初始化MG参数容器
+
+        # 后台计算线程与进度队列
+        self.progress_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.worker_thread = None
+        self.progress_var = tk.DoubleVar(value=0)
+
+        # MG 积分插值表缓存到用户目录，相同 λ、T 的扫描再次运行时直接载入
+        set_table_directory(os.path.join(os.path.expanduser("~"), ".aomkinetics", "mg_tables"))
+        # 完成的扫描结果按全部输入的哈希缓存到磁盘，相同配置再次计算时直接载入
+        self.result_cache = ResultCache(os.path.join(os.path.expanduser("~"), ".aomkinetics", "results"))
+        self.cache_mb_var = tk.IntVar(value=RESULT_CACHE_BYTES // 2 ** 20)
+        self.from_cache = False
+        
+        # 创建界面
+        self.create_main_layout()
+        self.update_parameters()
+        self.update_variable_controls()
+        self.setup_plots()
+        self.plot_window = None  # 用于跟踪当前绘图窗口
+        self.current_fig = None  # 避免Matplotlib资源未释放
+                
+    def create_main_layout(self):
+        # 主容器使用Grid布局
+        main_container = ttk.Frame(self.root)
+        main_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # ===== 左侧控制面板 =====
+        left_panel = ttk.Frame(main_container, width=480)
+        left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=False)
+
+        # 参数框架
+        param_frame = ttk.LabelFrame(left_panel, text="Parameters", padding="10")
+        param_frame.pack(fill=tk.BOTH, expand=True)
+
+        # 配置区域
+        config_frame = ttk.Frame(param_frame)
+        config_frame.pack(fill=tk.X, pady=(0, 10))
+
+        # 模型选择
+        model_frame = ttk.LabelFrame(config_frame, text="1. Model Selection", padding="10")
+        model_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+        ttk.Radiobutton(model_frame, text="ER-AOM", variable=self.model_var,
+                       value="ER-AOM", command=self.update_parameters).pack(anchor=tk.W)
+        ttk.Radiobutton(model_frame, text="LH-AOM", variable=self.model_var,
+                       value="LH-AOM", command=self.update_parameters).pack(anchor=tk.W)
+
+        # 动力学公式选择
+        kinetics_frame = ttk.LabelFrame(config_frame, text="2.1 Kinetics Formula(ECR)", padding="10")
+        kinetics_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+
+        kinetics_options = KINETICS
+        for option in kinetics_options:
+            ttk.Radiobutton(kinetics_frame, text=option, variable=self.kinetics_var,
+                           value=option, command=self.update_parameters).pack(anchor=tk.W)
+        # 新增：B-V方法选择子框架（仅当选择B-V时显示）
+        self.bv_sub_frame = ttk.Frame(kinetics_frame)   
+        ttk.Radiobutton(self.bv_sub_frame, text="BEP", variable=self.bv_method_var,
+                        value="BEP", command=self.update_parameters).pack(side=tk.LEFT)
+        ttk.Radiobutton(self.bv_sub_frame, text="Softplus", variable=self.bv_method_var,
+                        value="Softplus", command=self.update_parameters).pack(side=tk.LEFT)
+        
+        # 在kinetics_frame下方添加新的化学反应方法选择框架
+        self.chem_frame = ttk.LabelFrame(config_frame, text="2.2 Chemical Reaction Method(CR)", padding="10")
+        self.chem_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+        self.chem_method_var = tk.StringVar(value="BEP")  # 新增变量
+        ttk.Radiobutton(self.chem_frame, text="BEP", variable=self.chem_method_var, value="BEP").pack(anchor=tk.W)
+        ttk.Radiobutton(self.chem_frame, text="Softplus", variable=self.chem_method_var, value="Softplus").pack(anchor=tk.W)
+
+        # 变量控制
+        var_frame = ttk.LabelFrame(config_frame, text="3. Variable Control", padding="10")
+        var_frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+        ttk.Label(var_frame, text="Variable:").pack(anchor=tk.W)
+        ttk.Radiobutton(var_frame, text="η (overpotential)", variable=self.variable_var,
+                       value="η", command=self.update_variable_controls).pack(anchor=tk.W)
+        ttk.Radiobutton(var_frame, text="pH", variable=self.variable_var,
+                       value="pH", command=self.update_variable_controls).pack(anchor=tk.W)
+        ttk.Radiobutton(var_frame, text="2D Scan (η & pH)", variable=self.variable_var,
+                       value="2D", command=self.update_variable_controls).pack(anchor=tk.W)
+        ttk.Radiobutton(var_frame, text="T (Arrhenius, η range)", variable=self.variable_var,
+                       value="T", command=self.update_variable_controls).pack(anchor=tk.W)
+        ttk.Radiobutton(var_frame, text="Volcano (descriptors)", variable=self.variable_var,
+                       value="Volcano", command=self.update_variable_controls).pack(anchor=tk.W)
+        ttk.Radiobutton(var_frame, text="Sobol (global sensitivity, η range)", variable=self.variable_var,
+                       value="Sobol", command=self.update_variable_controls).pack(anchor=tk.W)
+        
+        # 变量范围
+        ttk.Label(var_frame, text="Range:").pack(anchor=tk.W, pady=(10, 0))
+        range_frame = ttk.Frame(var_frame)
+        range_frame.pack(fill=tk.X)
+        ttk.Label(range_frame, text="Start:").pack(side=tk.LEFT)
+        ttk.Entry(range_frame, textvariable=self.start_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(range_frame, text="End:").pack(side=tk.LEFT)
+        ttk.Entry(range_frame, textvariable=self.end_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(range_frame, text="Step:").pack(side=tk.LEFT)
+        ttk.Entry(range_frame, textvariable=self.step_var, width=8).pack(side=tk.LEFT, padx=5)
+
+        # 固定值框架
+        self.fixed_frame = ttk.Frame(var_frame)
+        self.fixed_frame.pack(fill=tk.X, pady=5)
+        
+        # 固定η控制
+        self.fixed_eta_frame = ttk.Frame(self.fixed_frame)
+        ttk.Label(self.fixed_eta_frame, text="Fixed η:").pack(side=tk.LEFT)
+        ttk.Entry(self.fixed_eta_frame, textvariable=self.fixed_eta_var, width=8).pack(side=tk.LEFT, padx=5)
+        
+        # 固定pH控制
+        self.fixed_ph_frame = ttk.Frame(self.fixed_frame)
+        ttk.Label(self.fixed_ph_frame, text="Fixed pH:").pack(side=tk.LEFT)
+        ttk.Entry(self.fixed_ph_frame, textvariable=self.fixed_ph_var, width=8).pack(side=tk.LEFT, padx=5)
+
+        # 2D扫描范围框架
+        self.eta_2d_frame = ttk.Frame(var_frame)
+        ttk.Label(self.eta_2d_frame, text="η Range:").pack(side=tk.LEFT)
+        ttk.Entry(self.eta_2d_frame, textvariable=self.eta_start_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.eta_2d_frame, text="to").pack(side=tk.LEFT)
+        ttk.Entry(self.eta_2d_frame, textvariable=self.eta_end_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.eta_2d_frame, text="step").pack(side=tk.LEFT)
+        ttk.Entry(self.eta_2d_frame, textvariable=self.eta_step_var, width=8).pack(side=tk.LEFT, padx=5)
+
+        self.ph_2d_frame = ttk.Frame(var_frame)
+        ttk.Label(self.ph_2d_frame, text="pH Range:").pack(side=tk.LEFT)
+        ttk.Entry(self.ph_2d_frame, textvariable=self.ph_start_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.ph_2d_frame, text="to").pack(side=tk.LEFT)
+        ttk.Entry(self.ph_2d_frame, textvariable=self.ph_end_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.ph_2d_frame, text="step").pack(side=tk.LEFT)
+        ttk.Entry(self.ph_2d_frame, textvariable=self.ph_step_var, width=8).pack(side=tk.LEFT, padx=5)
+
+        self.t_range_frame = ttk.Frame(var_frame)
+        ttk.Label(self.t_range_frame, text="T Range (K):").pack(side=tk.LEFT)
+        ttk.Entry(self.t_range_frame, textvariable=self.t_start_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.t_range_frame, text="to").pack(side=tk.LEFT)
+        ttk.Entry(self.t_range_frame, textvariable=self.t_end_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.t_range_frame, text="step").pack(side=tk.LEFT)
+        ttk.Entry(self.t_range_frame, textvariable=self.t_step_var, width=8).pack(side=tk.LEFT, padx=5)
+
+        self.parallel_frame = ttk.Frame(var_frame)
+        ttk.Label(self.parallel_frame, text="Workers:").pack(side=tk.LEFT)
+        ttk.Entry(self.parallel_frame, textvariable=self.workers_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.parallel_frame, text="Rows/chunk (0=auto):").pack(side=tk.LEFT)
+        ttk.Entry(self.parallel_frame, textvariable=self.chunk_rows_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(self.parallel_frame, text="DRC maps", variable=self.drc_var).pack(side=tk.LEFT)
+        ttk.Checkbutton(self.parallel_frame, text="Tafel maps", variable=self.slopes_var).pack(side=tk.LEFT)
+
+        # 2D结果目录：大网格的全部 k、r、θ 写入磁盘，可中断续算、直接重新打开
+        self.map_store_frame = ttk.Frame(var_frame)
+        ttk.Label(self.map_store_frame, text="Map store:").pack(side=tk.LEFT)
+        ttk.Entry(self.map_store_frame, textvariable=self.map_store_var, width=24).pack(side=tk.LEFT, padx=5)
+        ttk.Button(self.map_store_frame, text="Browse", command=self.browse_map_store).pack(side=tk.LEFT)
+
+        # 自适应加密：只在 lg(r)、θ 变化剧烈处加密到上面的步长
+        self.adaptive_frame = ttk.Frame(var_frame)
+        ttk.Checkbutton(self.adaptive_frame, text="Adaptive", variable=self.adaptive_var).pack(side=tk.LEFT)
+        ttk.Label(self.adaptive_frame, text="lg r tol:").pack(side=tk.LEFT)
+        ttk.Entry(self.adaptive_frame, textvariable=self.lgr_tol_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Label(self.adaptive_frame, text="θ* tol:").pack(side=tk.LEFT)
+        ttk.Entry(self.adaptive_frame, textvariable=self.theta_tol_var, width=8).pack(side=tk.LEFT, padx=5)
+        self.max_points_frame = ttk.Frame(self.adaptive_frame)
+        ttk.Label(self.max_points_frame, text="Max points:").pack(side=tk.LEFT)
+        ttk.Entry(self.max_points_frame, textvariable=self.max_points_var, width=8).pack(side=tk.LEFT, padx=5)
+
+        # Monte Carlo：按分布抽样参数，图中画出 lg r 与 θ 的分位数带
+        self.mc_frame = ttk.Frame(var_frame)
+        ttk.Checkbutton(self.mc_frame, text="Uncertainty (MC)", variable=self.mc_var).grid(row=0, column=0, sticky=tk.W)
+        ttk.Label(self.mc_frame, text="Samples:").grid(row=0, column=1, sticky=tk.E)
+        ttk.Entry(self.mc_frame, textvariable=self.mc_samples_var, width=8).grid(row=0, column=2, padx=2)
+        ttk.Label(self.mc_frame, text="Seed:").grid(row=0, column=3, sticky=tk.E)
+        ttk.Entry(self.mc_frame, textvariable=self.mc_seed_var, width=6).grid(row=0, column=4, padx=2)
+        ttk.Label(self.mc_frame, text="每行 输入名: normal σ 或 uniform 半宽（空为全部 ΔG normal 0.15）").grid(
+            row=1, column=0, columnspan=5, sticky=tk.W, pady=(5, 0))
+        self.mc_text = tk.Text(self.mc_frame, width=30, height=4)
+        self.mc_text.grid(row=2, column=0, columnspan=5, sticky=tk.W)
+
+        # Sobol：全部步骤参数与 Ea0、ΔGw、T 在区间内均匀抽样，N·(d+2) 组输入多进程批量计算
+        self.sobol_frame = ttk.Frame(var_frame)
+        ttk.Label(self.sobol_frame, text="Samples N:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Entry(self.sobol_frame, textvariable=self.sobol_samples_var, width=8).grid(row=0, column=1, padx=2)
+        ttk.Label(self.sobol_frame, text="Seed:").grid(row=0, column=2, sticky=tk.E)
+        ttk.Entry(self.sobol_frame, textvariable=self.sobol_seed_var, width=6).grid(row=0, column=3, padx=2)
+        ttk.Label(self.sobol_frame, text="Workers:").grid(row=0, column=4, sticky=tk.E)
+        ttk.Entry(self.sobol_frame, textvariable=self.workers_var, width=6).grid(row=0, column=5, padx=2)
+        ttk.Label(self.sobol_frame, text="每行 输入名: 下限 上限（未列出的输入取默认区间）").grid(
+            row=1, column=0, columnspan=5, sticky=tk.W, pady=(5, 0))
+        ttk.Button(self.sobol_frame, text="Defaults", command=self.fill_sobol_ranges).grid(
+            row=1, column=5, sticky=tk.E, pady=(5, 0))
+        self.sobol_text = tk.Text(self.sobol_frame, width=30, height=4)
+        self.sobol_text.grid(row=2, column=0, columnspan=6, sticky=tk.W)
+
+        # 火山图：描述符 D1、D2 的范围与标度关系 ΔG_step = a + b1·D1 + b2·D2
+        self.volcano_frame = ttk.Frame(var_frame)
+        for row, (label, name_var, start_var, end_var, step_var) in enumerate((
+                ("D1", self.d1_name_var, self.d1_start_var, self.d1_end_var, self.d1_step_var),
+                ("D2", self.d2_name_var, self.d2_start_var, self.d2_end_var, self.d2_step_var))):
+            if row == 0:
+                ttk.Label(self.volcano_frame, text=f"{label}:").grid(row=row, column=0, sticky=tk.W)
+            else:
+                ttk.Checkbutton(self.volcano_frame, text=f"{label}:", variable=self.volcano_2d_var).grid(
+                    row=row, column=0, sticky=tk.W)
+            ttk.Entry(self.volcano_frame, textvariable=name_var, width=8).grid(row=row, column=1, padx=2)
+            ttk.Entry(self.volcano_frame, textvariable=start_var, width=6).grid(row=row, column=2, padx=2)
+            ttk.Label(self.volcano_frame, text="to").grid(row=row, column=3)
+            ttk.Entry(self.volcano_frame, textvariable=end_var, width=6).grid(row=row, column=4, padx=2)
+            ttk.Label(self.volcano_frame, text="step").grid(row=row, column=5)
+            ttk.Entry(self.volcano_frame, textvariable=step_var, width=6).grid(row=row, column=6, padx=2)
+        ttk.Label(self.volcano_frame, text="ΔG_step = a + b1·D1 + b2·D2（每行 步骤: a, b1, b2）").grid(
+            row=2, column=0, columnspan=7, sticky=tk.W, pady=(5, 0))
+        self.volcano_text = tk.Text(self.volcano_frame, width=30, height=7)
+        self.volcano_text.grid(row=3, column=0, columnspan=7, sticky=tk.W)
+        self.volcano_model = None  # volcano_text 中默认标度关系对应的模型，见 update_parameters
+
+        # 参数容器
+        self.param_frame_container = ttk.Frame(param_frame)
+        self.param_frame_container.pack(fill=tk.BOTH, expand=True)
+
+        # 按钮区域
+        button_frame = ttk.Frame(left_panel)
+        button_frame.pack(fill=tk.X, pady=10)
+        self.calculate_button = ttk.Button(button_frame, text="Calculate", command=self.calculate)
+        self.calculate_button.pack(side=tk.LEFT, padx=10)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel_calculation,
+                                        state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=10)
+        ttk.Button(button_frame, text="Save Results", command=self.save_results).pack(side=tk.LEFT, padx=10)
+        ttk.Button(button_frame, text="Open Map", command=self.open_map_store).pack(side=tk.LEFT, padx=10)
+        ttk.Button(button_frame, text="Screen Catalysts", command=self.import_catalyst_table).pack(side=tk.LEFT, padx=10)
+        ttk.Button(button_frame, text="Exit", command=self.root.quit).pack(side=tk.RIGHT, padx=10)
+
+        # 拟合实验极化曲线：以当前面板的参数为初值，结果写回面板
+        fit_frame = ttk.Frame(left_panel)
+        fit_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(fit_frame, text="Fit parameters:").pack(side=tk.LEFT)
+        ttk.Entry(fit_frame, textvariable=self.fit_names_var, width=40).pack(side=tk.LEFT, padx=5)
+        ttk.Button(fit_frame, text="Fit Data", command=self.import_fit_data).pack(side=tk.LEFT, padx=5)
+        ttk.Label(fit_frame, text="（如 deltaG_1, beta_2, ea0；空为全部 ΔG）").pack(side=tk.LEFT)
+
+        # 计算进度
+        progress_frame = ttk.Frame(left_panel)
+        progress_frame.pack(fill=tk.X)
+        ttk.Progressbar(progress_frame, variable=self.progress_var, maximum=100).pack(fill=tk.X)
+        self.progress_label = ttk.Label(progress_frame, text="")
+        self.progress_label.pack(anchor=tk.W)
+
+        # 结果缓存
+        cache_frame = ttk.Frame(left_panel)
+        cache_frame.pack(fill=tk.X)
+        ttk.Label(cache_frame, text="Result cache (MB):").pack(side=tk.LEFT)
+        ttk.Entry(cache_frame, textvariable=self.cache_mb_var, width=8).pack(side=tk.LEFT, padx=5)
+        ttk.Button(cache_frame, text="Clear Cache", command=self.clear_result_cache).pack(side=tk.LEFT, padx=5)
+        self.cache_label = ttk.Label(cache_frame, text="")
+        self.cache_label.pack(side=tk.LEFT, padx=5)
+
+        # 结果表格
+        results_frame = ttk.LabelFrame(left_panel, text="结果表格", padding="10")
+        results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+
+        # 创建带双滚动条的容器
+        tree_container = ttk.Frame(results_frame)
+        tree_container.pack(fill=tk.BOTH, expand=True)
+
+        # 创建Treeview组件
+        self.tree = ttk.Treeview(
+            tree_container,
+            columns=[],
+            show='headings',
+            height=8,
+            selectmode='extended'
+        )
+
+        # 创建垂直滚动条
+        vsb = ttk.Scrollbar(
+            tree_container,
+            orient="vertical",
+            command=self.tree.yview
+        )
+        self.tree.configure(yscrollcommand=vsb.set)
+
+        # 创建水平滚动条
+        hsb = ttk.Scrollbar(
+            tree_container,
+            orient="horizontal",
+            command=self.tree.xview
+        )
+        self.tree.configure(xscrollcommand=hsb.set)
+
+        # 使用grid布局管理器
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+
+        # 配置容器网格权重
+        tree_container.grid_rowconfigure(0, weight=1)
+        tree_container.grid_columnconfigure(0, weight=1)
+
+        # 添加自动调整列宽功能
+        def auto_resize_columns(event=None):
+            for col in self.tree["columns"]:
+                max_width = max(
+                    tk.font.Font().measure(str(self.tree.set(item, col))) 
+                    for item in self.tree.get_children()
+                )
+                self.tree.column(col, width=max_width + 20)
+
+        self.tree.bind("<Configure>", auto_resize_columns)
+
+        # ===== 右侧图表容器 =====
+        self.right_container = ttk.Frame(main_container)
+        self.right_container.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)        
+
+        # 配置权重分配
+        main_container.columnconfigure(0, weight=0)  # 左侧固定宽度
+        main_container.columnconfigure(1, weight=1)  # 右侧自适应
+                       
+    def setup_plots(self):
+        """初始化右侧的三个图表"""
+        # 创建滚动容器
+        canvas = tk.Canvas(self.right_container, borderwidth=0)
+        scrollbar = ttk.Scrollbar(self.right_container, 
+                                orient="vertical", 
+                                command=canvas.yview)
+        scroll_frame = ttk.Frame(canvas)
+
+        # 配置滚动区域
+        scroll_frame.bind("<Configure>", 
+                        lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.create_window((0,0), window=scroll_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # 布局滚动组件
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # 创建图表
+        self.fig = plt.figure(figsize=(8, 10), dpi=80, constrained_layout=True)  # 调整尺寸
+        gs = self.fig.add_gridspec(3, 1, height_ratios=[1,1,1.2], hspace=0.8)
+    
+        self.ax_k = self.fig.add_subplot(gs[0])
+        self.ax_lgr = self.fig.add_subplot(gs[1])
+        self.ax_theta = self.fig.add_subplot(gs[2])
+
+        # 嵌入图表
+        self.canvas = FigureCanvasTkAgg(self.fig, master=scroll_frame)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # 添加水平滚动条
+        h_scroll = ttk.Scrollbar(self.right_container,
+                               orient="horizontal",
+                               command=canvas.xview)
+        canvas.configure(xscrollcommand=h_scroll.set)
+        h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+
+    def create_plot_window(self):
+        """创建独立的绘图窗口"""
+        # 关闭旧窗口（如果存在）
+        if self.plot_window is not None:
+            try:
+                self.plot_window.destroy()
+                plt.close(self.current_fig)  # 显式关闭Figure
+            except:
+                pass
+
+        # 创建新窗口
+        self.plot_window = tk.Toplevel(self.root)
+        self.plot_window.title("仿真结果图表")
+        self.plot_window.geometry("1200x800")
+
+        # 创建Figure和Canvas（绑定到新窗口）
+        self.current_fig = plt.figure(figsize=(10, 15), dpi=100)
+        gs = self.current_fig.add_gridspec(3, 1, height_ratios=[1, 1, 1.5], hspace=0.7)
+        self.ax_k = self.current_fig.add_subplot(gs[0])
+        self.ax_lgr = self.current_fig.add_subplot(gs[1])
+        self.ax_theta = self.current_fig.add_subplot(gs[2])
+
+        # 嵌入Canvas到新窗口
+        self.canvas = FigureCanvasTkAgg(self.current_fig, master=self.plot_window)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+         # 添加工具栏（需先导入 NavigationToolbar2Tk）
+        toolbar = NavigationToolbar2Tk(self.canvas, self.plot_window)
+        toolbar.update()
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def update_plot_in_new_window(self):
+        """在新窗口中更新图表"""
+        try:
+            if not hasattr(self, 'results_df') or self.results_df.empty:
+                raise ValueError("无有效数据，请先进行计算")
+
+            # 绘制图表
+            self.draw_plots(self.ax_k, self.ax_lgr, self.ax_theta)
+            self.canvas.draw()
+
+        except Exception as e:
+            messagebox.showerror("绘图错误", f"图表生成失败：\n{str(e)}")
+            traceback.print_exc()
+
+    def draw_plots(self, ax_k, ax_lgr, ax_theta):
+        """通用绘图逻辑（无Figure依赖）"""
+        # 清除旧数据
+        ax_k.clear()
+        ax_lgr.clear()
+        ax_theta.clear()
+
+        # 获取变量数据
+        variable = self.results_df.columns[0]
+        x = self.results_df[variable]
+
+        # 设置颜色主题
+        colors = plt.cm.tab10.colors
+
+        # 绘制速率常数
+        k_cols = [c for c in self.results_df.columns if c.startswith('k') ]
+        for idx, col in enumerate(k_cols):
+            ax_k.plot(x, self.results_df[col], color=colors[idx%10], linewidth=1.5, label=col)
+        ax_k.set_title("Rate Constants", fontsize=12, pad=10)
+        ax_k.legend(fontsize=8, loc='upper right', framealpha=0.8)
+        ax_k.grid(True, linestyle='--', alpha=0.6)
+
+        # 绘制对数速率
+        lgr_cols = [c for c in self.results_df.columns if c.startswith(('lg(r1)', 'lg(r21)', 'lg(r22)', 'lg(r5)'))]
+        for idx, col in enumerate(lgr_cols):
+            ax_lgr.plot(x, self.results_df[col], color=colors[idx%10], linewidth=1.5, label=col.replace('lg', 'log'))
+        bands = self.quantile_bands()
+        for label in [label for label in bands if label.startswith('lg(r')]:
+            self.draw_band(ax_lgr, x, bands[label], 'gray', label.replace('lg', 'log'))
+        ax_lgr.set_title("Reaction Rates (log scale)", fontsize=12, pad=10)
+        ax_lgr.legend(fontsize=8, loc='upper right', framealpha=0.8)
+        ax_lgr.grid(True, linestyle='--', alpha=0.6)
+
+        # 绘制表面覆盖度
+        theta_cols = [c for c in self.results_df.columns if c.startswith('theta')]
+        for idx, col in enumerate(theta_cols):
+            ax_theta.plot(x, self.results_df[col], color=colors[idx%10], linewidth=1.5, label=col)
+            if col in bands:
+                self.draw_band(ax_theta, x, bands[col], colors[idx%10])
+        ax_theta.set_title("Surface Coverage", fontsize=12, pad=10)
+        ax_theta.legend(fontsize=8, loc='upper right', framealpha=0.8)
+        ax_theta.grid(True, linestyle='--', alpha=0.6)
+
+        # 设置公共坐标标签
+        ax_theta.set_xlabel(variable, fontsize=10)
+
+    def quantile_bands(self):
+        """结果表格中 Monte Carlo 分位数列（"p5 lg(r4)" 等）按量分组：{量: {分位数: 列名}}"""
+        bands = {}
+        for col in self.results_df.columns:
+            prefix, _, label = col.partition(' ')
+            if prefix[:1] == 'p' and label:
+                try:
+                    bands.setdefault(label, {})[float(prefix[1:])] = col
+                except ValueError:
+                    pass
+        return bands
+
+    def draw_band(self, ax, x, columns, color, label=None):
+        """对称分位数之间填色（越靠近中位数越深），中位数画虚线"""
+        percents = sorted(columns)
+        for low in [p for p in percents if p < 50]:
+            high = 100 - low
+            if high in columns:
+                ax.fill_between(x, self.results_df[columns[low]], self.results_df[columns[high]], color=color,
+                                alpha=0.15, linewidth=0, label=f"{label} p{low:g}–p{high:g}" if label else None)
+        if 50 in columns:
+            ax.plot(x, self.results_df[columns[50]], '--', color=color, linewidth=1.0,
+                    label=f"{label} median" if label else None)
+
+    def update_variable_controls(self):
+        current_var = self.variable_var.get()
+        self.fixed_eta_frame.pack_forget()
+        self.fixed_ph_frame.pack_forget()
+        self.eta_2d_frame.pack_forget()
+        self.ph_2d_frame.pack_forget()
+        self.parallel_frame.pack_forget()
+        self.map_store_frame.pack_forget()
+        self.adaptive_frame.pack_forget()
+        self.max_points_frame.pack_forget()
+        self.volcano_frame.pack_forget()
+        self.t_range_frame.pack_forget()
+        self.mc_frame.pack_forget()
+        self.sobol_frame.pack_forget()
+        
+        if current_var == "T":
+            # T × η 扫描，固定 pH
+            self.t_range_frame.pack(fill=tk.X, pady=5)
+            self.eta_2d_frame.pack(fill=tk.X, pady=5)
+            self.fixed_ph_frame.pack(anchor=tk.W)
+            return
+        if current_var == "Volcano":
+            # 固定 η、pH 下扫描描述符；自适应与并行设置不适用
+            self.fixed_eta_frame.pack(anchor=tk.W)
+            self.fixed_ph_frame.pack(anchor=tk.W)
+            self.volcano_frame.pack(fill=tk.X, pady=5)
+            return
+        if current_var == "Sobol":
+            # η 范围（起止相同时为单点）× 固定 pH
+            self.eta_2d_frame.pack(fill=tk.X, pady=5)
+            self.fixed_ph_frame.pack(anchor=tk.W)
+            self.sobol_frame.pack(fill=tk.X, pady=5)
+            return
+        if current_var == "η":
+            self.fixed_ph_frame.pack(anchor=tk.W)
+        elif current_var == "pH":
+            self.fixed_eta_frame.pack(anchor=tk.W)
+        elif current_var == "2D":
+            self.eta_2d_frame.pack(fill=tk.X, pady=5)
+            self.ph_2d_frame.pack(fill=tk.X, pady=5)
+            self.parallel_frame.pack(fill=tk.X, pady=5)
+            self.map_store_frame.pack(fill=tk.X, pady=5)
+        self.adaptive_frame.pack(fill=tk.X, pady=5)
+        if current_var != "2D":
+            self.max_points_frame.pack(side=tk.LEFT)
+            self.mc_frame.pack(fill=tk.X, pady=5)
+
+    def update_parameters(self):
+        if hasattr(self, 'current_param_frame'):
+            self.current_param_frame.destroy()
+            self.current_param_frame = None
+        
+        model = self.model_var.get()
+        kinetics = self.kinetics_var.get()
+        chem = self.chem_method_var.get()
+        if model != self.volcano_model:
+            # 标度关系的步骤号随模型变化，切换模型时换成该模型的默认关系
+            self.volcano_text.delete("1.0", tk.END)
+            self.volcano_text.insert("1.0", format_scaling_relations(SCALING_RELATIONS[model]))
+            self.volcano_model = model
+        self.current_param_frame = ttk.Frame(self.param_frame_container)
+        self.current_param_frame.pack(fill=tk.BOTH, expand=True)
+
+        # 滚动条
+        canvas = tk.Canvas(self.current_param_frame, borderwidth=0)
+        scrollbar = ttk.Scrollbar(self.current_param_frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = ttk.Frame(canvas)
+        scrollable_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # 标题
+        ttk.Label(scrollable_frame, text=f"Parameters for {model} with {kinetics}", 
+                 style='Header.TLabel').grid(row=0, column=0, columnspan=9, pady=5)
+
+        # 公共参数
+        ttk.Label(scrollable_frame, text="Temperature (T):").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+        self.temp_entry = ttk.Entry(scrollable_frame, width=12)
+        self.temp_entry.grid(row=1, column=1, sticky=tk.W, pady=2)
+        self.temp_entry.insert(0, "298.15")
+        ttk.Label(scrollable_frame, text="K").grid(row=1, column=2, sticky=tk.W, padx=5)
+
+        ttk.Label(scrollable_frame, text="ΔGw (eV):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+        delta_gw_entry = ttk.Entry(scrollable_frame, width=12, textvariable=self.delta_gw_var)
+        delta_gw_entry.grid(row=2, column=1, sticky=tk.W, pady=2)
+        ttk.Label(scrollable_frame, text="eV").grid(row=2, column=2, sticky=tk.W, padx=5)
+
+
+    
+        # 模型特定参数
+        if model == "ER-AOM":
+            if kinetics == "Butler-Volmer kinetics":
+                self.create_er_aom_bv_parameters(scrollable_frame)
+            elif kinetics == "Marcus kinetics":
+                self.create_er_aom_marcus_parameters(scrollable_frame)
+            else:
+                self.create_er_aom_mg_parameters(scrollable_frame)
+
+        else:
+            if kinetics == "Butler-Volmer kinetics":
+                self.create_lh_aom_bv_parameters(scrollable_frame)
+            elif kinetics == "Marcus kinetics":
+                self.create_lh_aom_marcus_parameters(scrollable_frame)
+            else:
+                self.create_lh_aom_mg_parameters(scrollable_frame)
+
+        if kinetics == "Butler-Volmer kinetics":
+            self.bv_sub_frame.pack(anchor=tk.W, pady=5)  # 显示子选项
+        else:
+            self.bv_sub_frame.pack_forget()  # 隐藏子选项 
+
+    # 以下是完整的参数创建函数
+    def create_er_aom_bv_parameters(self, frame):
+        self.er_aom_bv_entries.clear()
+        # Ea0
+        ttk.Label(frame, text="Ea,0:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
+        self.ea0_entry = ttk.Entry(frame, width=12)
+        self.ea0_entry.grid(row=3, column=1, sticky=tk.W, pady=2)
+        self.ea0_entry.insert(0, "0.5")
+        ttk.Label(frame, text="eV").grid(row=3, column=2, sticky=tk.W, padx=5)
+
+        # Headers
+        ttk.Label(frame, text="ΔG (eV)").grid(row=4, column=1, pady=5)
+        ttk.Label(frame, text="γ").grid(row=4, column=3, pady=5)
+        ttk.Label(frame, text="β").grid(row=4, column=5, pady=5)
+        ttk.Label(frame, text="z").grid(row=4, column=7, pady=5)
+
+        # ΔG, γ, β, z for steps 1-4
+        self.er_aom_bv_entries = []
+        for i, step in enumerate(range(1, 5), start=5):
+            step_entries = {}
+            
+            ttk.Label(frame, text=f"Step {step}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+            
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "0.1")
+            step_entries['deltaG'] = entry
+            
+            # γ
+            gamma_value = "1.3863" if self.bv_method_var.get() == "Softplus" else "0.5"  
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, gamma_value)
+            step_entries['gamma'] = entry
+            
+            # β
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "0.5")
+            step_entries['beta'] = entry
+            
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+            
+            self.er_aom_bv_entries.append(step_entries)
+
+    def create_er_aom_marcus_parameters(self, frame):
+        self.er_aom_marcus_entries.clear()
+        # Headers
+        ttk.Label(frame, text="ΔG (eV)").grid(row=3, column=1, pady=5)
+        ttk.Label(frame, text="λ (eV)").grid(row=3, column=3, pady=5)
+        ttk.Label(frame, text="z").grid(row=3, column=5, pady=5)
+
+        # ΔG, λ, z for steps 1-4
+        self.er_aom_marcus_entries = []
+        for i, step in enumerate(range(1, 5), start=4):
+            step_entries = {}
+            
+            ttk.Label(frame, text=f"Step {step}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+            
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "0.1")
+            step_entries['deltaG'] = entry
+            
+            # λ
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "2")
+            step_entries['lambda'] = entry
+            
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+            
+            self.er_aom_marcus_entries.append(step_entries)
+
+    def create_er_aom_mg_parameters(self, frame):
+        self.er_aom_mg_entries.clear()
+        # Headers
+        ttk.Label(frame, text="ΔG (eV)").grid(row=3, column=1, pady=5)
+        ttk.Label(frame, text="λ (eV)").grid(row=3, column=3, pady=5)
+        ttk.Label(frame, text="z").grid(row=3, column=5, pady=5)
+
+        # ΔG, λ, z for steps 1-4
+        self.er_aom_mag_entries = []
+        for i, step in enumerate(range(1, 5), start=4):
+            step_entries = {}
+            
+            ttk.Label(frame, text=f"Step {step}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+            
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "0.1")
+            step_entries['deltaG'] = entry
+            
+            # λ
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "2")
+            step_entries['lambda'] = entry
+            
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+            
+            self.er_aom_mg_entries.append(step_entries)
+
+    def create_lh_aom_bv_parameters(self, frame):
+        self.lh_aom_bv_entries.clear()
+        # Ea0
+        ttk.Label(frame, text="Ea,0:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
+        self.ea0_entry = ttk.Entry(frame, width=12)
+        self.ea0_entry.grid(row=3, column=1, sticky=tk.W, pady=2)
+        self.ea0_entry.insert(0, "0.5")
+        ttk.Label(frame, text="eV").grid(row=3, column=2, sticky=tk.W, padx=5)
+
+        # Headers
+        ttk.Label(frame, text="ΔG (eV)").grid(row=5, column=1, pady=5)
+        ttk.Label(frame, text="γ").grid(row=5, column=3, pady=5)
+        ttk.Label(frame, text="β").grid(row=5, column=5, pady=5)
+        ttk.Label(frame, text="z").grid(row=5, column=7, pady=5)
+        ttk.Separator(frame, orient='horizontal').grid(row=4, column=0, columnspan=8, pady=10, sticky='ew')
+        ttk.Label(frame, text="CHR", style='Header.TLabel').grid(row=4, column=0, columnspan=8, pady=5)
+        ttk.Separator(frame, orient='horizontal').grid(row=12, column=0, columnspan=8, pady=10, sticky='ew')
+        ttk.Label(frame, text="CR (Step 5)", style='Header.TLabel').grid(row=12, column=0, columnspan=8, pady=5)
+            
+        # Steps:1,21,22,31,32,4
+        steps = [1,21,22,31,32,4]
+        self.lh_aom_bv_entries = []
+        for i, step_num in enumerate(steps, start=6):
+            step_entries = {'step': step_num} 
+            
+            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+            
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "0.1")
+            step_entries['deltaG'] = entry
+            
+            # γ
+            gamma_value = "1.3863" if self.bv_method_var.get() == "Softplus" else "0.5"  
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, gamma_value)
+            step_entries['gamma'] = entry
+            
+            # β
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "0.5")
+            step_entries['beta'] = entry
+            
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+
+            self.lh_aom_bv_entries.append(step_entries)
+        
+        # Steps: 5
+        steps = [5]
+        for i, step_num in enumerate(steps, start=13):
+            step_entries = {'step': step_num} 
+            
+            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+            
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "-0.2")
+            step_entries['deltaG'] = entry
+            
+            # γ
+            gamma_value = "1.3863" if self.chem_method_var.get() == "Softplus" else "0.5"
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, gamma_value)
+            step_entries['gamma'] = entry
+
+            # β
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "0.5")
+            step_entries['beta'] = entry
+            
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+            
+            self.lh_aom_bv_entries.append(step_entries)
+            
+    def create_lh_aom_marcus_parameters(self, frame):
+        self.lh_aom_marcus_entries.clear()
+        # Ea,0 参数
+        ttk.Label(frame, text="Ea,0:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
+        self.ea0_entry = ttk.Entry(frame, width=12)
+        self.ea0_entry.grid(row=3, column=1, sticky=tk.W, pady=2)
+        self.ea0_entry.insert(0, "0.5")
+        ttk.Label(frame, text="eV").grid(row=3, column=2, sticky=tk.W, padx=5)
+
+        # Headers
+        ttk.Label(frame, text="ΔG (eV)").grid(row=5, column=1, pady=5)
+        ttk.Label(frame, text="λ (eV)").grid(row=5, column=3, pady=5)
+        ttk.Label(frame, text="γ").grid(row=5, column=5, pady=5)
+        ttk.Label(frame, text="z").grid(row=5, column=7, pady=5)
+        ttk.Separator(frame, orient='horizontal').grid(row=4, column=0, columnspan=8, pady=10, sticky='ew')
+        ttk.Label(frame, text="CHR", style='Header.TLabel').grid(row=4, column=0, columnspan=8, pady=5)
+        ttk.Separator(frame, orient='horizontal').grid(row=12, column=0, columnspan=8, pady=10, sticky='ew')
+        ttk.Label(frame, text="CR (Step 5)", style='Header.TLabel').grid(row=12, column=0, columnspan=8, pady=5)
+            
+        # Steps: 1, 21, 22, 31, 32, 4
+        steps = [1, 21, 22, 31, 32, 4]
+        self.lh_aom_marcus_entries = []
+        for i, step_num in enumerate(steps, start=6):
+            step_entries = {'step': step_num} 
+            
+            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "0.1")
+            step_entries['deltaG'] = entry
+            
+            # λ
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "2")
+            step_entries['lambda'] = entry
+
+            # γ
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "0.5")
+            step_entries['gamma'] = entry
+        
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+
+            self.lh_aom_marcus_entries.append(step_entries)
+
+        # Steps: 5
+        steps = [5]
+        for i, step_num in enumerate(steps, start=13):
+            step_entries = {'step': step_num} 
+            
+            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+            
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "-0.2")
+            step_entries['deltaG'] = entry
+            
+            # λ
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "2")
+            step_entries['lambda'] = entry
+
+            # γ
+            gamma_value = "1.3863" if self.chem_method_var.get() == "Softplus" else "0.5"
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, gamma_value)
+            step_entries['gamma'] = entry
+        
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+            
+            self.lh_aom_marcus_entries.append(step_entries)
+
+    def create_lh_aom_mg_parameters(self, frame):
+        self.lh_aom_mg_entries.clear()
+        # Ea,0 参数
+        ttk.Label(frame, text="Ea,0:").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
+        self.ea0_entry = ttk.Entry(frame, width=12)
+        self.ea0_entry.grid(row=3, column=1, sticky=tk.W, pady=2)
+        self.ea0_entry.insert(0, "0.5")
+        ttk.Label(frame, text="eV").grid(row=3, column=2, sticky=tk.W, padx=5)
+
+        # Headers
+        ttk.Label(frame, text="ΔG (eV)").grid(row=5, column=1, pady=5)
+        ttk.Label(frame, text="λ (eV)").grid(row=5, column=3, pady=5)
+        ttk.Label(frame, text="γ").grid(row=5, column=5, pady=5)
+        ttk.Label(frame, text="z").grid(row=5, column=7, pady=5)
+        ttk.Separator(frame, orient='horizontal').grid(row=4, column=0, columnspan=8, pady=10, sticky='ew')
+        ttk.Label(frame, text="CHR", style='Header.TLabel').grid(row=4, column=0, columnspan=8, pady=5)
+        ttk.Separator(frame, orient='horizontal').grid(row=12, column=0, columnspan=8, pady=10, sticky='ew')
+        ttk.Label(frame, text="CR (Step 5)", style='Header.TLabel').grid(row=12, column=0, columnspan=8, pady=5)
+            
+
+        # Steps: 1, 21, 22, 31, 32, 4
+        steps = [1, 21, 22, 31, 32, 4]
+        self.lh_aom_marcus_entries = []
+        for i, step_num in enumerate(steps, start=6):
+            step_entries = {'step': step_num} 
+            
+            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+            
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "0.1")
+            step_entries['deltaG'] = entry
+            
+            # λ
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "2")
+            step_entries['lambda'] = entry
+
+            # γ
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "0.5")
+            step_entries['gamma'] = entry
+        
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+            
+            self.lh_aom_mg_entries.append(step_entries)
+
+        # Steps: 5
+        steps = [5]
+        for i, step_num in enumerate(steps, start=13):
+            step_entries = {'step': step_num} 
+            
+            ttk.Label(frame, text=f"Step {step_num}:").grid(row=i, column=0, sticky=tk.E, padx=5, pady=2)
+            
+            # ΔG
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=1, sticky=tk.W, pady=2)
+            entry.insert(0, "-0.2")
+            step_entries['deltaG'] = entry
+            
+            # λ
+            entry = ttk.Entry(frame, width=12)
+            entry.grid(row=i, column=3, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "2")
+            step_entries['lambda'] = entry
+
+            # γ
+            gamma_value = "1.3863" if self.chem_method_var.get() == "Softplus" else "0.5"  
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=5, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, gamma_value)
+            step_entries['gamma'] = entry
+        
+            # z
+            entry = ttk.Entry(frame, width=8)
+            entry.grid(row=i, column=7, sticky=tk.W, pady=2, padx=5)
+            entry.insert(0, "1")
+            step_entries['z'] = entry
+            
+            self.lh_aom_mg_entries.append(step_entries)
+
+    # 以下是完整的计算函数
+    
+    def calculate(self):
+        if self.worker_thread is not None and self.worker_thread.is_alive():
+            return
+        try:
+            # 一次性读取界面参数，之后的计算只依赖这些不可变对象，在后台线程中进行
+            params = self.read_parameters()
+            scan = self.read_scan()
+        except Exception as e:
+            messagebox.showerror("Calculation Error", f"An error occurred during calculation:\n{str(e)}")
+            traceback.print_exc()
+            return
+
+        self.mg_report = None
+        self.cancel_event.clear()
+        self.from_cache = False
+        if not (scan['mode'] == "2D" and scan['store']):
+            # 磁盘结果目录本身即可重新打开，不再另行缓存
+            self.result_cache.max_bytes = max(self.cache_mb_var.get(), 0) * 2 ** 20
+            scan['cache_key'] = result_key(params, {name: value for name, value in scan.items()
+                                                    if name not in SCAN_EXECUTION_KEYS})
+            cached = self.result_cache.get(scan['cache_key'])
+            if cached is not None:
+                self.from_cache = True
+                self.show_cache_stats()
+                self.finish_scan(scan['mode'], *cached)
+                return
+        self.scan_started = time.perf_counter()
+        self.set_running(True)
+        self.worker_thread = threading.Thread(target=self.run_scan, args=(params, scan), daemon=True)
+        self.worker_thread.start()
+        self.root.after(PROGRESS_POLL_MS, self.poll_progress)
+
+    def read_scan(self):
+        """读取扫描范围与并行设置"""
+        scan_mode = self.variable_var.get()
+        if scan_mode == "T":
+            return {
+                'mode': scan_mode,
+                'T': scan_points(self.t_start_var.get(), self.t_end_var.get(), self.t_step_var.get()),
+                'eta': scan_points(self.eta_start_var.get(), self.eta_end_var.get(), self.eta_step_var.get()),
+                'ph': self.fixed_ph_var.get(),
+            }
+        if scan_mode == "Sobol":
+            return {
+                'mode': scan_mode,
+                'eta': scan_points(self.eta_start_var.get(), self.eta_end_var.get(), self.eta_step_var.get()),
+                'ph': self.fixed_ph_var.get(),
+                'ranges': parse_ranges(self.sobol_text.get("1.0", tk.END)),
+                'samples': max(self.sobol_samples_var.get(), 2),
+                'seed': self.sobol_seed_var.get(),
+                'workers': max(self.workers_var.get(), 1),
+            }
+        if scan_mode == "Volcano":
+            axes = [scan_points(self.d1_start_var.get(), self.d1_end_var.get(), self.d1_step_var.get())]
+            names = [self.d1_name_var.get().strip() or "D1"]
+            if self.volcano_2d_var.get():
+                axes.append(scan_points(self.d2_start_var.get(), self.d2_end_var.get(), self.d2_step_var.get()))
+                names.append(self.d2_name_var.get().strip() or "D2")
+            return {
+                'mode': scan_mode,
+                'axes': axes,
+                'descriptors': names,
+                'relations': parse_scaling_relations(self.volcano_text.get("1.0", tk.END)),
+                'eta': self.fixed_eta_var.get(),
+                'ph': self.fixed_ph_var.get(),
+            }
+        if scan_mode == "2D":
+            if self.adaptive_var.get() and (self.drc_var.get() or self.slopes_var.get()):
+                raise ValueError("自适应二维扫描只按 lg(r)、θ 加密，不能同时计算 DRC / Tafel 图；"
+                                 "请取消 Adaptive 或 DRC maps、Tafel maps")
+            return {
+                'mode': scan_mode,
+                'eta': scan_points(self.eta_start_var.get(), self.eta_end_var.get(), self.eta_step_var.get()),
+                'ph': scan_points(self.ph_start_var.get(), self.ph_end_var.get(), self.ph_step_var.get()),
+                'workers': max(self.workers_var.get(), 1),
+                'chunk_rows': max(self.chunk_rows_var.get(), 0),
+                'store': self.map_store_var.get().strip(),
+                'drc': self.drc_var.get(),
+                'slopes': self.slopes_var.get(),
+                'adaptive': self.adaptive_var.get(),
+                'lgr_tol': self.lgr_tol_var.get(),
+                'theta_tol': self.theta_tol_var.get(),
+            }
+        values = scan_points(self.start_var.get(), self.end_var.get(), self.step_var.get())
+        mc = None
+        if self.mc_var.get():
+            # 分布为空时在计算时取 default_distributions(params)
+            mc = {
+                'distributions': parse_distributions(self.mc_text.get("1.0", tk.END)) or None,
+                'samples': max(self.mc_samples_var.get(), 1),
+                'seed': self.mc_seed_var.get(),
+            }
+        return {
+            'mode': scan_mode,
+            'values': values,
+            'mc': mc,
+            'fixed': self.fixed_ph_var.get() if scan_mode == "η" else self.fixed_eta_var.get(),
+            'chunk': max(1, math.ceil(values.size / 20)),
+            'range': (self.start_var.get(), self.end_var.get(), self.step_var.get()),
+            'adaptive': self.adaptive_var.get(),
+            'lgr_tol': self.lgr_tol_var.get(),
+            'theta_tol': self.theta_tol_var.get(),
+            'max_points': max(self.max_points_var.get(), 2),
+        }
+
+    def run_scan(self, params, scan):
+        """后台线程：执行扫描，通过队列向主线程报告进度和结果（不访问任何 Tk 对象）"""
+        def progress(done, total):
+            self.progress_queue.put(('progress', done, total))
+
+        def level_progress(done, total):
+            self.progress_queue.put(('level', done, total))
+
+        try:
+            if scan['mode'] == "fit":
+                # 每次迭代在全部数据点上批量计算残差与 Jacobian
+                try:
+                    result = fit_parameters(params, scan['data'], scan['names'], progress=progress,
+                                            cancel=self.cancel_event)
+                except FitCancelled:
+                    result = None
+                if result is not None:
+                    # 拟合参数下第一个 pH 的 η 扫描，用于结果表格与三联图
+                    data = result['data']
+                    eta = np.linspace(data['η'].min(), data['η'].max(), 200)
+                    result['curve'] = scan_1d(result['params'], "η", eta, data['pH'].iloc[0])
+                self.progress_queue.put(('done', scan['mode'], result, None))
+                return
+            if scan['mode'] == "screen":
+                # 参数表中全部催化剂沿催化剂轴向量化计算
+                result = screen_catalysts(params, scan['table'], scan['eta'], scan['ph'],
+                                          progress=progress, cancel=self.cancel_event)
+                self.progress_queue.put(('done', scan['mode'], result, None))
+                return
+            if scan['mode'] == "Sobol":
+                # Saltelli 抽样的 N·(d+2) 组输入分块并行，每块内沿催化剂轴向量化
+                result = sobol_indices(params, scan['eta'], scan['ph'], {**default_ranges(params), **scan['ranges']},
+                                       n_samples=scan['samples'], seed=scan['seed'], max_workers=scan['workers'],
+                                       progress=progress, cancel=self.cancel_event)
+                # MG 插值表在 λ、T 抽样时改为闭式近似，精度对照按实际使用的动力学
+                params = params.replace(kinetics=result['kinetics'])
+                eta, pH = result['η'], result['pH']
+                result = sobol_table(result)
+            elif scan['mode'] == "Volcano":
+                # 描述符网格上的点沿催化剂轴分批向量化计算
+                result = volcano(params, scan['relations'], scan['axes'], scan['eta'], scan['ph'],
+                                 progress=progress, cancel=self.cancel_event)
+                result['descriptors'] = np.array(scan['descriptors'])
+                eta = pH = None  # ΔG 随描述符变化，不做 MG 积分精度对照
+            elif scan['mode'] == "T":
+                # 各温度分批向量化计算，E_app 由 ln r 对 1/T 的差分得到
+                result = arrhenius_scan(params, scan['T'], scan['eta'], scan['ph'],
+                                        progress=progress, cancel=self.cancel_event).to_frame()
+                result = result.rename(columns={'lgr': f"lg({RATE_KEY[params.model]})", 'E_app': "E_app (eV)"})
+                eta = pH = None  # 积分精度随温度变化，不做单一温度的对照
+            elif scan['mode'] == "2D" and scan['adaptive']:
+                # 自适应四叉树，结果插值回均匀网格绘图
+                tree = adaptive_scan_2d(params, scan['eta'], scan['ph'], lgr_tol=scan['lgr_tol'],
+                                        theta_tol=scan['theta_tol'], progress=level_progress,
+                                        cancel=self.cancel_event)
+                result = adaptive_results_2d(tree, scan['eta'], scan['ph'])
+                eta, pH = tree.points()
+            elif scan['mode'] == "2D" and scan['store']:
+                # 全部字段逐块写入结果目录；已有同一扫描的未完成结果时续算
+                store = scan_2d_to_store(params, scan['eta'], scan['ph'], scan['store'],
+                                         max_workers=scan['workers'], chunk_rows=scan['chunk_rows'],
+                                         progress=progress, cancel=self.cancel_event)
+                result = store.results_2d(drc=scan['drc'], slopes=scan['slopes'])
+                eta, pH = result['eta'], result['ph']
+            elif scan['mode'] == "2D":
+                # 按 pH 行分块，多进程并行计算
+                result = parallel_scan_2d(params, scan['eta'], scan['ph'],
+                                          max_workers=scan['workers'], chunk_rows=scan['chunk_rows'],
+                                          progress=progress, cancel=self.cancel_event, drc=scan['drc'],
+                                          slopes=scan['slopes'])
+                eta, pH = result['eta'], result['ph']
+            elif scan['mc']:
+                # 样本分批向量化计算，分位数流式更新，内存与样本数无关
+                mc = scan['mc']
+                result = uncertainty_scan(params, scan['mode'], scan['values'], scan['fixed'],
+                                          mc['distributions'] or default_distributions(params),
+                                          n_samples=mc['samples'], seed=mc['seed'], progress=progress,
+                                          cancel=self.cancel_event)
+                eta, pH = scan_1d_points(scan['mode'], scan['values'], scan['fixed'])
+            elif scan['adaptive']:
+                # 一维自适应扫描：只在曲线变化剧烈处加点，x 不等间距
+                start, end, step = scan['range']
+                result = adaptive_scan_1d(params, scan['mode'], start, end, scan['fixed'], min_step=step,
+                                          lgr_tol=scan['lgr_tol'], theta_tol=scan['theta_tol'],
+                                          max_points=scan['max_points'], progress=progress,
+                                          cancel=self.cancel_event)
+                eta, pH = scan_1d_points(scan['mode'], result[scan['mode']].to_numpy(), scan['fixed'])
+            else:
+                # 一维扫描：分批向量化计算，便于报告进度和取消
+                result = scan_1d(params, scan['mode'], scan['values'], scan['fixed'],
+                                 chunk=scan['chunk'], progress=progress, cancel=self.cancel_event)
+                eta, pH = scan_1d_points(scan['mode'], scan['values'], scan['fixed'])
+            report = None
+            if not self.cancel_event.is_set():
+                if eta is not None:
+                    report = self.mg_accuracy_message(params, eta, pH)
+                if scan.get('cache_key'):
+                    try:
+                        self.result_cache.put(scan['cache_key'], result, report)
+                    except OSError:
+                        traceback.print_exc()
+            self.progress_queue.put(('done', scan['mode'], result, report))
+        except Exception as e:
+            self.progress_queue.put(('error', e, traceback.format_exc()))
+
+    def poll_progress(self):
+        """主线程：处理后台线程发来的进度与结果"""
+        try:
+            while True:
+                message = self.progress_queue.get_nowait()
+                if message[0] == 'progress':
+                    self.show_progress(*message[1:])
+                elif message[0] == 'level':
+                    done, total = message[1:]
+                    self.progress_var.set(100.0 * done / total if total else 100.0)
+                    self.progress_label.config(text=f"自适应加密：第 {done}/{total} 层")
+                elif message[0] == 'done':
+                    self.set_running(False)
+                    self.show_cache_stats()
+                    self.finish_scan(*message[1:])
+                    return
+                else:
+                    self.set_running(False)
+                    error, details = message[1:]
+                    print(details)
+                    messagebox.showerror("Calculation Error", f"An error occurred during calculation:\n{str(error)}")
+                    return
+        except queue.Empty:
+            pass
+        self.root.after(PROGRESS_POLL_MS, self.poll_progress)
+
+    def show_progress(self, done, total):
+        """更新进度条、速度（点/秒）与预计剩余时间"""
+        elapsed = time.perf_counter() - self.scan_started
+        self.progress_var.set(100.0 * done / total if total else 100.0)
+        rate = done / elapsed if elapsed > 0 else 0.0
+        remaining = (total - done) / rate if rate > 0 else float('nan')
+        text = f"{done}/{total} 点  {rate:,.0f} 点/秒"
+        if math.isfinite(remaining):
+            text += f"  剩余约 {int(remaining // 60):02d}:{int(remaining % 60):02d}"
+        self.progress_label.config(text=text)
+
+    def set_running(self, running):
+        """计算期间禁用 Calculate、启用 Cancel"""
+        self.calculate_button.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.cancel_button.config(state=tk.NORMAL if running else tk.DISABLED)
+        if running:
+            self.progress_var.set(0)
+            self.progress_label.config(text="计算中…")
+
+    def cancel_calculation(self):
+        """请求取消；已完成部分的结果会保留"""
+        self.cancel_event.set()
+        self.progress_label.config(text="正在取消…")
+
+    def finish_scan(self, scan_mode, result, report):
+        """主线程：显示扫描结果"""
+        self.mg_report = report
+        cancelled = self.cancel_event.is_set()
+        if scan_mode == "fit":
+            if result is None:
+                messagebox.showinfo("拟合已取消", "参数面板保持不变。")
+                return
+            self.finish_fit(result)
+            return
+        if scan_mode == "screen":
+            self.results_df = result
+            self.update_results_table(max_rows=SCREEN_TABLE_ROWS)
+            n_catalysts = result['catalyst'].nunique()
+            title = "计算已取消" if cancelled else "筛选完成"
+            messagebox.showinfo(title, f"已计算 {n_catalysts} 个催化剂，结果按 lg(r) 排名"
+                                f"（表格显示前 {min(len(result), SCREEN_TABLE_ROWS)} 行，保存时写出全部结果）。")
+            return
+        if scan_mode == "T":
+            self.results_df = result
+            self.update_results_table(max_rows=SCREEN_TABLE_ROWS)
+            self.create_arrhenius_plot()
+            if cancelled:
+                messagebox.showinfo("计算已取消", "未完成的温度记为 NaN。")
+            else:
+                messagebox.showinfo("计算完成", self.completion_message(
+                    f"温度扫描完成：{result['T'].nunique()} 个温度 × {result['η'].nunique()} 个 η。"))
+            return
+        if scan_mode == "Sobol":
+            self.results_df = result
+            self.update_results_table(max_rows=SCREEN_TABLE_ROWS)
+            self.create_sobol_plot()
+            samples = int(result['samples'].min()) if len(result) else 0
+            note = ""
+            if len(result) and result['Kinetics'].iloc[0] != self.kinetics_var.get():
+                note = (f"\nλ 或 T 参与抽样时每组输入都需要单独的 MG 插值表，"
+                        f"本次改用 {result['Kinetics'].iloc[0]} 计算。")
+            if cancelled:
+                messagebox.showinfo("计算已取消", f"指数由已完成的 {samples} 个样本估计。{note}")
+            else:
+                messagebox.showinfo("计算完成", self.completion_message(
+                    f"Sobol 指数计算完成：{result['input'].nunique()} 个输入 × {result['η'].nunique()} 个 η，"
+                    f"每个条件至少 {samples} 个有效样本。{note}"))
+            return
+        if scan_mode == "Volcano":
+            self.results_volcano = result
+            self.results_df = volcano_table(result, [str(name) for name in result['descriptors']])
+            self.update_results_table(max_rows=SCREEN_TABLE_ROWS)
+            self.create_volcano_plot()
+            if cancelled:
+                messagebox.showinfo("计算已取消", "未完成的描述符点记为 NaN。")
+            else:
+                messagebox.showinfo("计算完成", self.completion_message(
+                    f"火山图计算完成，共 {result['lgr'].size} 个描述符点。"))
+            return
+        if scan_mode == "2D":
+            self.results_2d = result
+            rows_done = result['rows_done']
+            n_failed = int(np.isnan(result['theta'][rows_done]).sum())
+            if n_failed:
+                print(f"{n_failed} 个网格点无法计算θ，已记为 NaN")
+
+            # 绘制等值线图
+            self.create_contour_plot()
+            if any(name.startswith('DRC') for name in result):
+                self.create_drc_plot()
+            if 'tafel' in result:
+                self.create_slope_plot()
+            if cancelled:
+                messagebox.showinfo("计算已取消", f"已保留完成的 {int(rows_done.sum())}/{rows_done.size} 行 pH 结果。")
+            else:
+                text = "二维扫描计算成功完成！"
+                if 'tree' in result:
+                    tree = result['tree']
+                    text += (f"\n自适应网格计算了 {tree.n_points} 个点，"
+                             f"为相同分辨率均匀网格的 {tree.n_points / tree.lattice_points:.1%}。")
+                messagebox.showinfo("计算完成", self.completion_message(text))
+            return
+
+        if result.empty:
+            messagebox.showinfo("计算已取消", "尚未完成任何扫描点。")
+            return
+        self.results_df = result
+
+        # 更新主窗口的表格和图表
+        self.update_results_table()
+        self.update_plot()
+
+        # 在新窗口中显示图表
+        self.create_plot_window()
+        self.update_plot_in_new_window()
+
+        if cancelled:
+            messagebox.showinfo("计算已取消", f"已保留完成的 {len(result)} 个扫描点。")
+        else:
+            messagebox.showinfo("计算完成", self.completion_message("计算成功完成！"))
+
+    def completion_message(self, text):
+        """计算完成提示；MG 动力学附带积分精度的对照报告"""
+        if self.from_cache:
+            text += "\n（已从结果缓存载入）"
+        if self.mg_report is not None:
+            text += f"\n\n{self.mg_report}"
+        return text
+
+    def show_cache_stats(self):
+        stats = self.result_cache.stats()
+        self.cache_label.config(text=f"命中 {stats['hits']} / 未命中 {stats['misses']}，"
+                                     f"{stats['entries']} 项 {stats['bytes'] / 2 ** 20:.1f} MB")
+
+    def clear_result_cache(self):
+        self.result_cache.clear()
+        self.show_cache_stats()
+
+    def import_catalyst_table(self):
+        """导入参数表（每行一个催化剂），在 Fixed η、Fixed pH 条件下用当前面板的模型与参数筛选"""
+        if self.worker_thread is not None and self.worker_thread.is_alive():
+            return
+        path = filedialog.askopenfilename(
+            title="导入催化剂参数表",
+            filetypes=[("CSV files", "*.csv"), ("Parquet files", "*.parquet"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            params = self.read_parameters()
+            table = read_catalyst_table(path)
+        except Exception as e:
+            messagebox.showerror("Import Error", f"无法读取参数表:\n{str(e)}")
+            traceback.print_exc()
+            return
+
+        scan = {'mode': "screen", 'table': table, 'eta': self.fixed_eta_var.get(), 'ph': self.fixed_ph_var.get()}
+        self.cancel_event.clear()
+        self.scan_started = time.perf_counter()
+        self.set_running(True)
+        self.worker_thread = threading.Thread(target=self.run_scan, args=(params, scan), daemon=True)
+        self.worker_thread.start()
+        self.root.after(PROGRESS_POLL_MS, self.poll_progress)
+
+    def import_fit_data(self):
+        """导入实验 η–j 数据（可含 pH 列，没有时取 Fixed pH），以当前面板的参数为初值拟合"""
+        if self.worker_thread is not None and self.worker_thread.is_alive():
+            return
+        path = filedialog.askopenfilename(
+            title="导入实验极化曲线",
+            filetypes=[("CSV files", "*.csv"), ("Parquet files", "*.parquet"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            params = self.read_parameters()
+            data = read_polarization_data(path, pH=self.fixed_ph_var.get())
+            names = [name.strip() for name in self.fit_names_var.get().split(',') if name.strip()]
+            if not names:
+                names = [f"deltaG_{n}" for n in params.steps]
+        except Exception as e:
+            messagebox.showerror("Import Error", f"无法读取实验数据:\n{str(e)}")
+            traceback.print_exc()
+            return
+
+        scan = {'mode': "fit", 'data': data, 'names': names}
+        self.cancel_event.clear()
+        self.scan_started = time.perf_counter()
+        self.set_running(True)
+        self.worker_thread = threading.Thread(target=self.run_scan, args=(params, scan), daemon=True)
+        self.worker_thread.start()
+        self.root.after(PROGRESS_POLL_MS, self.poll_progress)
+
+    def set_parameters(self, params):
+        """把参数写回参数面板（read_parameters 的逆操作）"""
+        def set_entry(entry, value):
+            entry.delete(0, tk.END)
+            entry.insert(0, f"{value:.6g}")
+
+        set_entry(self.temp_entry, params.T)
+        self.delta_gw_var.set(params.delta_gw)
+        if params.ea0 is not None:
+            set_entry(self.ea0_entry, params.ea0)
+        for index, step_entry in enumerate(self.step_entries(params.model, params.kinetics), start=1):
+            step = params.steps[step_entry.get('step', index)]
+            for name, entry in step_entry.items():
+                if name != 'step':
+                    set_entry(entry, step[name])
+
+    def finish_fit(self, result):
+        """拟合结果写回参数面板，在图表窗口中叠加实验点与拟合曲线"""
+        self.fit_result = result
+        self.set_parameters(result['params'])
+        self.results_df = result['curve']
+        self.update_results_table()
+        self.update_plot()
+        self.create_plot_window()
+        self.update_plot_in_new_window()
+
+        # 实验 lg j 减去比例因子后与 lg r 同一坐标
+        data = result['data']
+        colors = plt.cm.tab10.colors
+        for idx, (pH, group) in enumerate(data.groupby('pH')):
+            group = group.sort_values('η')
+            color = colors[(idx + 3) % 10]
+            self.ax_lgr.plot(group['η'], group['lgj'] - result['lg_scale'], 'o', color=color, markersize=4,
+                             label=f"data (pH {pH:g})")
+            self.ax_lgr.plot(group['η'], group['lgj_fit'] - result['lg_scale'], '--', color=color, linewidth=1.2,
+                             label=f"fit (pH {pH:g})")
+        self.ax_lgr.legend(fontsize=8, loc='upper right', framealpha=0.8)
+        self.canvas.draw()
+
+        lines = [f"{row['parameter']}: {row['value']:.4g} ± {row['upper'] - row['value']:.2g}"
+                 + ("（在边界上）" if row['at bound'] else "") for _, row in result['table'].iterrows()]
+        title = "拟合完成" if result['success'] else "拟合未收敛"
+        messagebox.showinfo(title, f"{result['message']}\n迭代 {result['evaluations']} 次，"
+                            f"lg 残差 RMS = {result['rmse']:.3g}\n\n95% 置信区间：\n" + "\n".join(lines))
+
+    def fill_sobol_ranges(self):
+        """把当前参数面板对应的默认区间写入 sobol_text，便于在此基础上修改"""
+        try:
+            ranges = default_ranges(self.read_parameters())
+        except Exception as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        self.sobol_text.delete("1.0", tk.END)
+        self.sobol_text.insert("1.0", format_ranges(ranges))
+
+    def browse_map_store(self):
+        directory = filedialog.askdirectory(title="选择二维结果目录")
+        if directory:
+            self.map_store_var.set(directory)
+
+    def open_map_store(self):
+        """重新打开磁盘上的二维结果并绘制等值线图（不重新计算）"""
+        directory = filedialog.askdirectory(title="打开二维结果目录")
+        if not directory:
+            return
+        try:
+            store = open_map(directory)
+            self.results_2d = store.results_2d()
+        except Exception as e:
+            messagebox.showerror("Open Error", f"无法打开结果目录:\n{str(e)}")
+            traceback.print_exc()
+            return
+        self.map_store_var.set(directory)
+        self.create_contour_plot()
+        if not store.complete:
+            rows_done = self.results_2d['rows_done']
+            messagebox.showinfo("结果未完成", f"该结果只完成了 {int(rows_done.sum())}/{rows_done.size} 行 pH，"
+                                f"在 2D 模式下以相同参数重新计算即可续算。")
+
+    def create_contour_plot(self):
+        """创建二维等值线图"""
+        if not hasattr(self, 'results_2d'):
+            return
+        
+        # 创建新窗口
+        contour_window = tk.Toplevel(self.root)
+        contour_window.title("二维等值线图")
+        contour_window.geometry("800x600")
+        
+        fig = plt.figure(figsize=(8, 6))
+        ax = fig.add_subplot(111)
+        
+        # 提取数据
+        eta = self.results_2d['eta']
+        ph = self.results_2d['ph']
+        lgr = self.results_2d['lgr']
+        
+        # 绘制等值线图
+        contour = ax.contourf(eta, ph, lgr, levels=20, cmap='viridis')
+        fig.colorbar(contour, ax=ax, label='log(r5)')
+        if 'tree' in self.results_2d:
+            # 标出自适应网格实际计算的点
+            ax.plot(*self.results_2d['tree'].points(), ',', color='white', alpha=0.4)
+        
+        ax.set_xlabel('η (V)')
+        ax.set_ylabel('pH')
+        ax.set_title('log(r5) as function of η and pH')
+        
+        canvas = FigureCanvasTkAgg(fig, master=contour_window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        toolbar = NavigationToolbar2Tk(canvas, contour_window)
+        toolbar.update()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def create_drc_plot(self):
+        """各步骤速率控制度 X_i 的二维图，最后一幅为 X_i 最大的步骤（速率决定步骤）"""
+        fields = [name for name in self.results_2d if name.startswith('DRC')]
+        eta = self.results_2d['eta']
+        ph = self.results_2d['ph']
+
+        drc_window = tk.Toplevel(self.root)
+        drc_window.title("速率控制度")
+        drc_window.geometry("1000x800")
+        n_cols = 3
+        n_rows = math.ceil((len(fields) + 1) / n_cols)
+        fig = plt.figure(figsize=(4 * n_cols, 3.2 * n_rows), constrained_layout=True)
+        levels = np.linspace(-1, 1, 21)
+        for i, name in enumerate(fields):
+            ax = fig.add_subplot(n_rows, n_cols, i + 1)
+            contour = ax.contourf(eta, ph, self.results_2d[name], levels=levels, cmap='RdBu_r', extend='both')
+            ax.set_title(f"X (step {name[3:]})", fontsize=10)
+            ax.set_xlabel('η (V)')
+            ax.set_ylabel('pH')
+        fig.colorbar(contour, ax=fig.axes, label='degree of rate control')
+
+        drc = np.stack([self.results_2d[name] for name in fields])
+        valid = np.isfinite(drc).all(axis=0)
+        rds = np.where(valid, np.argmax(np.where(np.isfinite(drc), drc, -np.inf), axis=0), np.nan)
+        ax = fig.add_subplot(n_rows, n_cols, len(fields) + 1)
+        mesh = ax.pcolormesh(eta, ph, rds, cmap=plt.get_cmap('tab10').resampled(len(fields)),
+                             vmin=-0.5, vmax=len(fields) - 0.5, shading='auto')
+        colorbar = fig.colorbar(mesh, ax=ax, ticks=range(len(fields)))
+        colorbar.ax.set_yticklabels([name[3:] for name in fields])
+        ax.set_title("Rate-determining step", fontsize=10)
+        ax.set_xlabel('η (V)')
+        ax.set_ylabel('pH')
+
+        canvas = FigureCanvasTkAgg(fig, master=drc_window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        toolbar = NavigationToolbar2Tk(canvas, drc_window)
+        toolbar.update()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def create_slope_plot(self):
+        """Tafel 斜率与 pH 反应级数的二维图
+
+        速率饱和或 r 接近零处 Tafel 斜率发散，色标限定在 ±300 mV/dec；反应级数的色标取 5%–95% 分位数。
+        """
+        eta = self.results_2d['eta']
+        ph = self.results_2d['ph']
+
+        slope_window = tk.Toplevel(self.root)
+        slope_window.title("Tafel 斜率与 pH 反应级数")
+        slope_window.geometry("1100x500")
+        fig = plt.figure(figsize=(11, 4.5), constrained_layout=True)
+        ax = fig.add_subplot(1, 2, 1)
+        contour = ax.contourf(eta, ph, self.results_2d['tafel'], levels=np.linspace(-300, 300, 25),
+                              cmap='coolwarm', extend='both')
+        fig.colorbar(contour, ax=ax, label='Tafel slope (mV/dec)')
+        ax.set_title('Tafel slope (mV/dec)', fontsize=10)
+        ax.set_xlabel('η (V)')
+        ax.set_ylabel('pH')
+
+        order = self.results_2d['dlgr_dpH']
+        finite = order[np.isfinite(order)]
+        ax = fig.add_subplot(1, 2, 2)
+        if finite.size:
+            low, high = np.percentile(finite, [5, 95])
+            levels = np.linspace(low, high, 21) if high > low else 20
+            contour = ax.contourf(eta, ph, order, levels=levels, cmap='PuOr', extend='both')
+            fig.colorbar(contour, ax=ax, label='∂lg(r)/∂pH')
+        ax.set_title('pH reaction order ∂lg(r)/∂pH', fontsize=10)
+        ax.set_xlabel('η (V)')
+        ax.set_ylabel('pH')
+
+        canvas = FigureCanvasTkAgg(fig, master=slope_window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        toolbar = NavigationToolbar2Tk(canvas, slope_window)
+        toolbar.update()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def create_arrhenius_plot(self):
+        """左：若干 η 下 lg(r) 对 1000/T 的 Arrhenius 图；右：最低、中间、最高温度下 E_app 随 η 的变化"""
+        rate_column = self.results_df.columns[2]
+        lgr = self.results_df.pivot(index='T', columns='η', values=rate_column)
+        E_app = self.results_df.pivot(index='T', columns='η', values="E_app (eV)")
+
+        arrhenius_window = tk.Toplevel(self.root)
+        arrhenius_window.title("温度扫描与表观活化能")
+        arrhenius_window.geometry("1000x500")
+        fig = plt.figure(figsize=(10, 5))
+        ax_lgr = fig.add_subplot(121)
+        ax_E = fig.add_subplot(122)
+        colors = plt.cm.tab10.colors
+
+        n_eta = lgr.shape[1]
+        for idx, j in enumerate(np.unique(np.linspace(0, n_eta - 1, min(n_eta, 6)).round().astype(int))):
+            ax_lgr.plot(1000 / lgr.index, lgr.iloc[:, j], 'o-', color=colors[idx % 10], markersize=3,
+                        linewidth=1.5, label=f"η = {lgr.columns[j]:.3g} V")
+        ax_lgr.set_xlabel("1000/T (1/K)")
+        ax_lgr.set_ylabel(rate_column.replace('lg', 'log'))
+        ax_lgr.set_title("Arrhenius plot")
+        ax_lgr.legend(fontsize=8, framealpha=0.8)
+        ax_lgr.grid(True, linestyle='--', alpha=0.6)
+
+        n_T = E_app.shape[0]
+        for idx, i in enumerate(np.unique([0, n_T // 2, n_T - 1])):
+            ax_E.plot(E_app.columns, E_app.iloc[i], color=colors[idx % 10], linewidth=1.5,
+                      label=f"T = {E_app.index[i]:g} K")
+        ax_E.set_xlabel("η (V)")
+        ax_E.set_ylabel("E_app (eV)")
+        ax_E.set_title("Apparent activation energy")
+        ax_E.legend(fontsize=8, framealpha=0.8)
+        ax_E.grid(True, linestyle='--', alpha=0.6)
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=arrhenius_window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        toolbar = NavigationToolbar2Tk(canvas, arrhenius_window)
+        toolbar.update()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def create_sobol_plot(self):
+        """左：中间 η 处 ST 最大的若干输入的 S1、ST 条形图；右：其中前几个输入的 ST、S1 随 η 的变化"""
+        table = self.results_df
+        ST = table.pivot(index='η', columns='input', values='ST')
+        S1 = table.pivot(index='η', columns='input', values='S1')
+        row = len(ST) // 2
+        order = ST.iloc[row].sort_values(ascending=False).index[:SOBOL_BARS]
+        errors = table.pivot(index='η', columns='input', values='ST conf').iloc[row][order]
+
+        sobol_window = tk.Toplevel(self.root)
+        sobol_window.title("Sobol 全局灵敏度")
+        sobol_window.geometry("1000x500")
+        fig = plt.figure(figsize=(10, 5))
+        ax_bar = fig.add_subplot(121 if len(ST) > 1 else 111)
+        colors = plt.cm.tab10.colors
+
+        y = np.arange(len(order))
+        ax_bar.barh(y + 0.2, ST.iloc[row][order], height=0.4, xerr=errors, color=colors[0], label="ST")
+        ax_bar.barh(y - 0.2, S1.iloc[row][order], height=0.4, color=colors[1], label="S1")
+        ax_bar.set_yticks(y)
+        ax_bar.set_yticklabels(order)
+        ax_bar.invert_yaxis()
+        ax_bar.set_xlabel("Sobol index")
+        ax_bar.set_title(f"η = {ST.index[row]:.3g} V, pH = {table['pH'].iloc[0]:g}")
+        ax_bar.legend(fontsize=8, framealpha=0.8)
+        ax_bar.grid(True, axis='x', linestyle='--', alpha=0.6)
+
+        if len(ST) > 1:
+            ax_eta = fig.add_subplot(122)
+            leading = ST.max().sort_values(ascending=False).index[:SOBOL_LINES]
+            for idx, name in enumerate(leading):
+                ax_eta.plot(ST.index, ST[name], color=colors[idx % 10], linewidth=1.5, label=name)
+                ax_eta.plot(S1.index, S1[name], '--', color=colors[idx % 10], linewidth=1.0)
+            ax_eta.set_xlabel("η (V)")
+            ax_eta.set_ylabel("ST (solid) / S1 (dashed)")
+            rate = next(column for column in table.columns if column.startswith('var '))[4:]
+            ax_eta.set_title(f"Sensitivity of {rate.replace('lg', 'log')}")
+            ax_eta.legend(fontsize=8, framealpha=0.8)
+            ax_eta.grid(True, linestyle='--', alpha=0.6)
+        fig.tight_layout()
+
+        canvas = FigureCanvasTkAgg(fig, master=sobol_window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        toolbar = NavigationToolbar2Tk(canvas, sobol_window)
+        toolbar.update()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+    def create_volcano_plot(self):
+        """一维火山图为 lg(r)–描述符曲线，二维为等值线图；限速步骤的分界以虚线标出"""
+        result = self.results_volcano
+        names = [str(name) for name in result['descriptors']]
+        rate_label = self.results_df.columns[len(names)].replace('lg', 'log')
+
+        volcano_window = tk.Toplevel(self.root)
+        volcano_window.title("火山图")
+        volcano_window.geometry("800x600")
+        fig = plt.figure(figsize=(8, 6))
+        ax = fig.add_subplot(111)
+
+        stages = sorted(set(result['limiting'].ravel()) - {""})
+        if 'y' in result:
+            contour = ax.contourf(result['x'], result['y'], result['lgr'], levels=20, cmap='viridis')
+            fig.colorbar(contour, ax=ax, label=rate_label)
+            if len(stages) > 1:
+                index = np.vectorize(lambda stage: stages.index(stage) if stage in stages else -1)(result['limiting'])
+                ax.contour(result['x'], result['y'], index, levels=np.arange(len(stages) - 1) + 0.5,
+                           colors='white', linestyles='--', linewidths=1)
+            ax.set_ylabel(names[1])
+        else:
+            for stage in stages:
+                mask = result['limiting'] == stage
+                ax.plot(result['x'], np.where(mask, result['lgr'], np.nan), linewidth=1.5,
+                        label=f"step {stage} limiting")
+            ax.legend(fontsize=8, framealpha=0.8)
+            ax.grid(True, linestyle='--', alpha=0.6)
+            ax.set_ylabel(rate_label)
+        ax.set_xlabel(names[0])
+        ax.set_title(f"{rate_label} volcano")
+
+        canvas = FigureCanvasTkAgg(fig, master=volcano_window)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        toolbar = NavigationToolbar2Tk(canvas, volcano_window)
+        toolbar.update()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+   # 辅助计算函数（完整实现）
+    def step_entries(self, model, kinetics):
+        """当前模型与动力学对应的步骤参数输入框列表"""
+        if kinetics == BV_KINETICS:
+            family = 'bv'
+        elif kinetics == MARCUS_KINETICS:
+            family = 'marcus'
+        else:
+            family = 'mg'
+        return getattr(self, f"{model.lower().replace('-', '_')}_{family}_entries")
+
+    def read_parameters(self):
+        """从界面读取全部计算参数，返回不可变的 SimulationParameters"""
+        model = self.model_var.get()
+        kinetics = self.kinetics_var.get()
+        ea0 = None
+        if kinetics == BV_KINETICS or model == "LH-AOM":
+            ea0 = float(self.ea0_entry.get())
+
+        steps = {}
+        for index, step_entry in enumerate(self.step_entries(model, kinetics), start=1):
+            step_num = step_entry.get('step', index)
+            steps[step_num] = {name: float(entry.get()) for name, entry in step_entry.items() if name != 'step'}
+
+        return simulation_parameters(
+            model, kinetics, float(self.temp_entry.get()), steps,
+            delta_gw=self.delta_gw_var.get(),
+            ea0=ea0,
+            bv_method=self.bv_method_var.get(),
+            chem_method=self.chem_method_var.get(),
+        )
+
+    def mg_accuracy_message(self, params, eta, pH):
+        """MG 积分精度对照报告的提示文字；非 MG 动力学返回 None"""
+        accuracy = mg_accuracy(params, eta, pH)
+        if accuracy is None:
+            return None
+        if accuracy['method'] == "approximation":
+            x_min, x_max = accuracy['x_range']
+            return (f"MG 闭式近似与精确积分对照（驱动力 {x_min:.3f} ~ {x_max:.3f} eV）"
+                    f"的最大相对偏差：{accuracy['error']:.2e}")
+        return f"MG 积分与 quad 对照的最大相对偏差：{accuracy['error']:.2e}"
+
+     # 界面更新函数
+    def update_results_table(self, max_rows=None):
+        self.tree.delete(*self.tree.get_children())
+        columns = list(self.results_df.columns)
+        shown = self.results_df if max_rows is None else self.results_df.head(max_rows)
+        self.tree["columns"] = columns
+        
+        # 设置列标题和初始宽度
+        for col in columns:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, 
+                            width=tk.font.Font().measure(col[:15]) + 20,
+                            anchor=tk.CENTER,
+                            stretch=False)
+        
+        # 插入数据行
+        for _, row in shown.iterrows():
+            formatted_row = [
+                f"{x:.4e}" if isinstance(x, float) else str(x)
+                for x in row
+            ]
+            self.tree.insert("", tk.END, values=list(row))
+        
+        # 动态调整列宽
+        for col in columns:
+            max_width = tk.font.Font().measure(col[:15])  # 限制标题显示长度
+            for item in shown[col]:
+                item_str = f"{item:.4e}" if isinstance(item, float) else str(item)
+                item_width = tk.font.Font().measure(item_str[:15])  # 限制内容显示长度
+                if item_width > max_width:
+                    max_width = item_width
+            self.tree.column(col, width=max_width + 20)
+                    
+
+        # 添加滚动条自动隐藏功能（可选）
+        def check_scrollbars():
+            vsb_needed = self.tree.yview() != (0.0, 1.0)
+            hsb_needed = self.tree.xview() != (0.0, 1.0)
+    
+            vsb.grid_configure(column=1, sticky="ns" if vsb_needed else "")
+            hsb.grid_configure(row=1, sticky="ew" if hsb_needed else "")
+    
+            self.root.after(100, check_scrollbars)
+
+    def update_plot(self):
+        """优化后的绘图方法"""
+        self.fig.set_size_inches(8, 6 + len(self.results_df)*0.1)  # 动态调整高度
+        self.canvas.draw()
+        try:
+            # 清除旧数据
+            [ax.clear() for ax in [self.ax_k, self.ax_lgr, self.ax_theta]]
+            
+            # 获取变量数据
+            variable = self.results_df.columns[0]
+            x = self.results_df[variable]
+            
+            # 设置统一颜色主题
+            colors = plt.cm.tab10.colors
+            
+            # 绘制速率常数
+            k_cols = [c for c in self.results_df.columns if c.startswith('k')]
+            for idx, col in enumerate(k_cols):
+                self.ax_k.plot(x, self.results_df[col], 
+                              color=colors[idx%10],
+                              linewidth=1.5,
+                              label=col)
+            self.ax_k.set_title("Rate Constants", fontsize=10, pad=8)
+            self.ax_k.legend(fontsize=7, loc='upper right', framealpha=0.8)
+            
+            # 绘制对数速率
+            lgr_cols = [c for c in self.results_df.columns if c.startswith('lg(r')]
+            for idx, col in enumerate(lgr_cols):
+                self.ax_lgr.plot(x, self.results_df[col], 
+                                color=colors[idx%10],
+                                linewidth=1.5,
+                                label=col.replace('lg','log'))
+            self.ax_lgr.set_title("Reaction Rates (log scale)", fontsize=10, pad=8)
+            self.ax_lgr.legend(fontsize=7, loc='upper right', framealpha=0.8)
+            
+            # 绘制表面覆盖度
+            theta_cols = [c for c in self.results_df.columns if c.startswith('theta')]
+            for idx, col in enumerate(theta_cols):
+                self.ax_theta.plot(x, self.results_df[col], 
+                                  color=colors[idx%10],
+                                  linewidth=1.5,
+                                  label=col)
+            self.ax_theta.set_title("Surface Coverage", fontsize=10, pad=8)
+            self.ax_theta.legend(fontsize=7, loc='upper right', framealpha=0.8)
+            
+            # 统一设置坐标标签
+            for ax in [self.ax_k, self.ax_lgr]:
+                ax.set_xlabel("")
+                ax.tick_params(labelbottom=False)
+            self.ax_theta.set_xlabel(variable, fontsize=9)
+            
+            # 优化布局
+            self.canvas.draw()
+            
+        except Exception as e:
+            messagebox.showerror("绘图错误", f"图表生成失败：\n{str(e)}")
+            traceback.print_exc()
+
+    # 保存功能
+    def save_results(self):
+        try:
+            if hasattr(self, 'results_df'):
+                file_path = filedialog.asksaveasfilename(
+                    defaultextension=".xlsx",
+                    filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("All files", "*.*")],
+                    title="保存结果"
+                )
+                if file_path:
+                    if file_path.endswith('.csv'):
+                        self.results_df.to_csv(file_path, index=False)
+                    else:
+                        self.results_df.to_excel(file_path, index=False)
+                    messagebox.showinfo("保存成功", f"文件已保存至：\n{file_path}")
+            else:
+                messagebox.showwarning("无数据", "请先进行计算")
+        except Exception as e:
+            messagebox.showerror("保存错误", f"保存失败：\n{str(e)}")
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = AOMKineticsGUI(root)
+    root.mainloop()
@@ -0,0 +1,62 @@
+"""AOM 机理 OER/ORR 微观动力学的向量化计算核心"""
+from .constants import R, F, h, kB, DELTA_GW
+from .rates import (
+    prefactor, potential_term, softplus_barrier,
+    bv_rate_constants, chem_rate_constants, marcus_rate_constants,
+)
+from .mechanism import (
+    ER_AOM_STEPS, LH_AOM_STEPS, MODEL_STEPS, ER_AOM_THETA, LH_AOM_THETA, MODEL_THETA,
+    ER_AOM_GRAPH, LH_AOM_GRAPH, MODEL_GRAPH,
+    stack_step_parameters, unstack_rate_constants, combine_rate_constants,
+    er_aom_theta, lh_aom_theta, er_aom_rates, lh_aom_rates,
+    solve_steady_state, log_rate,
+)
+from .mg import (
+    mg_nodes, mg_log_integral, mg_integral, mg_integral_quad,
+    mg_driving_forces, mg_rate_constants, mg_quadrature_error,
+    fermi_expansion, mg_approx_log_integral, mg_approximation_error,
+    TABLE_DISK_BYTES, MGRateTable, MGTableCache, TABLE_CACHE, set_table_directory, mg_table_log_integral,
+)
+from .kernels import er_aom_theta_kernel, lh_aom_theta_kernel
+from .coverage import COVERAGE_METHODS, rate_matrices, coverage_theta, complex_step_theta
+from .params import (
+    BV_KINETICS, MARCUS_KINETICS, MG_KINETICS, KINETICS, MODELS, METHODS, CHEM_STEP,
+    SimulationParameters, simulation_parameters, step_parameter_names, required_steps,
+    parameters_to_dict, parameters_from_dict,
+)
+from .sensitivity import DRC_STEP, COMPLEX_STEP, drc_fields, degree_of_rate_control, log_rate_derivatives
+from .stepcache import STEP_CACHE_BYTES, StepRateCache, STEP_CACHE, grid_key, step_key
+from .engine import (
+    RATE_KEY, GRID_SOLVER, SWEEP_CHUNK_POINTS, SLOPE_FIELDS, SLOPE_COLUMNS, DERIVATIVE_STEP,
+    scan_points, scan_1d_points, kinetics_rate_constants, rate_constants, catalyst_rate_constants, rate_slopes,
+    mg_accuracy, one_d_columns, grid_fields, sweep_fields, SweepResult, sweep_axis, apply_inputs, sample_values,
+    sweep, scan_1d_frame, scan_1d, scan_2d_fields, map_values, scan_2d,
+)
+from .parallel import (
+    default_workers, get_executor, shutdown_executor, result_fields, row_chunks, run_row_chunks,
+    parallel_scan_2d, parallel_sample_values,
+)
+from .store import MapStore, open_map, scan_2d_to_store
+from .adaptive import QuadtreeMap, quadtree_levels, adaptive_scan_2d, adaptive_results_2d, adaptive_scan_1d
+from .screening import (
+    LIMITING_STAGES, step_column, parameter_columns, read_catalyst_table, catalyst_steps, limiting_step, evaluate_catalysts, screen_catalysts,
+)
+from .volcano import (
+    DESCRIPTORS, SCALING_RELATIONS, format_scaling_relations, parse_scaling_relations, scaling_table,
+    volcano, volcano_table,
+)
+from .arrhenius import ARRHENIUS_DT, arrhenius_scan, apparent_activation_energy
+from .fitting import (
+    FIT_STEP, FIT_CONFIDENCE, FIT_BOUNDS, SOFTPLUS_GAMMA_BOUNDS, FitCancelled, polarization_data,
+    read_polarization_data, default_bounds, parameter_bounds, fit_parameters,
+)
+from .uncertainty import (
+    MC_SAMPLES, MC_QUANTILES, DISTRIBUTIONS, DFT_UNCERTAINTY, default_distributions, format_distributions,
+    parse_distributions, draw_samples, StreamingQuantiles, quantile_column, uncertainty_scan,
+)
+from .sobol import (
+    SOBOL_SAMPLES, SOBOL_CONFIDENCE, SOBOL_WIDTHS, MG_SAMPLED_KINETICS, sobol_inputs, default_ranges, format_ranges,
+    parse_ranges, sobol_parameters, saltelli_samples, sobol_indices, sobol_table,
+)
+from .resultcache import RESULT_CACHE_BYTES, ResultCache, result_key, result_schema
+from .cli import load_config, config_parameters, run_config, run_configs
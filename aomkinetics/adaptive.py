@@ -0,0 +1,274 @@
+"""η-pH 扫描的自适应加密：二维图用四叉树，一维曲线用区间二分
+
+在与均匀扫描同样精细的格点上建四叉树：先用粗网格覆盖整个范围，再逐层检查每个单元的
+四条边中点和中心，把这些点上的 lg(r)、θ* 与由四个角双线性插值得到的值比较（层次盈余，
+反映局部曲率）；超过容差的单元分成四个子单元，直到达到最细格点。平坦区域只保留粗单元，
+反应区间的分界处加密到最细，所需计算点数只是均匀网格的一小部分。
+
+每层新增的点合在一起向量化计算；结果可用 resample 插值到任意均匀网格上绘图。
+
+一维扫描同理：在区间中点比较 lg(r)、各覆盖度与线性插值，只二分误差超过容差的区间，
+直到达到最小步长或点数上限，得到 x 不等间距的结果表格。
+"""
+import math
+
+import numpy as np
+import pandas as pd
+
+from .engine import map_values, scan_1d_frame
+from .mechanism import MODEL_THETA
+
+COARSE_CELLS = 16  # 初始粗网格在较长轴上的单元数（下限），避免完全漏掉小尺度结构
+LGR_TOLERANCE = 0.05  # lg(r) 的插值误差容差，单位为数量级
+THETA_TOLERANCE = 0.01  # θ* 的插值误差容差
+INITIAL_POINTS_1D = 21  # 一维自适应扫描的初始等间距点数
+MAX_POINTS_1D = 2000
+
+
+class QuadtreeMap:
+    """自适应扫描结果：格点上已计算的点与四叉树的叶单元
+
+    格点 (i, j) 对应 η = eta_axis[i]、pH = ph_axis[j]；叶单元 cells[:, :] 为 (i0, j0, size)，
+    覆盖格点 [i0, i0 + size] × [j0, j0 + size]。只有一个取值的轴长度为 1，整个范围是一个单元，
+    该方向的格点号都对应这一个值。
+    """
+
+    def __init__(self, eta_axis, ph_axis, keys, lgr, theta, cells, levels):
+        self.eta_axis = eta_axis
+        self.ph_axis = ph_axis
+        self.keys = keys
+        self.lgr = lgr
+        self.theta = theta
+        self.cells = cells
+        self.levels = levels
+
+    @property
+    def n_points(self):
+        """已计算的点数"""
+        return self.keys.size
+
+    @property
+    def lattice_points(self):
+        """相同分辨率的均匀网格点数"""
+        return self.eta_axis.size * self.ph_axis.size
+
+    def points(self):
+        """已计算点的 (η, pH) 坐标"""
+        j, i = np.divmod(self.keys, self.eta_axis.size)
+        return self.eta_axis[i], self.ph_axis[j]
+
+    def _lookup(self, i, j):
+        index = np.searchsorted(self.keys, _lattice_key(i, j, self.eta_axis, self.ph_axis))
+        return self.lgr[index], self.theta[index]
+
+    def resample(self, eta_values, ph_values):
+        """在 eta_values × ph_values 网格上按所在叶单元双线性插值，返回 (lgr, theta)"""
+        n_i, n_j = (axis.size - 1 if axis.size > 1 else 2 ** self.levels for axis in (self.eta_axis, self.ph_axis))
+        # 最细格点单元 → 所属叶单元
+        owner = np.empty((n_j, n_i), dtype=np.intp)
+        for size in np.unique(self.cells[:, 2]):
+            ids = np.flatnonzero(self.cells[:, 2] == size)
+            blocks = owner.reshape(n_j // size, size, n_i // size, size)
+            blocks[self.cells[ids, 1] // size, :, self.cells[ids, 0] // size, :] = ids[:, None, None]
+
+        eta_grid, ph_grid = np.meshgrid(eta_values, ph_values)
+        x = _lattice_coordinate(eta_grid, self.eta_axis)
+        y = _lattice_coordinate(ph_grid, self.ph_axis)
+        leaf = owner[np.clip(np.floor(y).astype(np.intp), 0, n_j - 1),
+                     np.clip(np.floor(x).astype(np.intp), 0, n_i - 1)]
+        i0, j0, size = np.moveaxis(self.cells[leaf], -1, 0)
+        u = np.clip((x - i0) / size, 0.0, 1.0)
+        v = np.clip((y - j0) / size, 0.0, 1.0)
+        weights = ((1 - u) * (1 - v), u * (1 - v), (1 - u) * v, u * v)
+        corners = ((i0, j0), (i0 + size, j0), (i0, j0 + size), (i0 + size, j0 + size))
+        lgr = np.zeros(leaf.shape)
+        theta = np.zeros(leaf.shape)
+        with np.errstate(invalid='ignore'):
+            for w, (ci, cj) in zip(weights, corners):
+                corner_lgr, corner_theta = self._lookup(ci, cj)
+                lgr += w * corner_lgr
+                theta += w * corner_theta
+        return lgr, theta
+
+
+def quadtree_levels(eta_values, ph_values, coarse_cells=COARSE_CELLS):
+    """加密层数：最细一层的间距不大于 eta_values、ph_values 的间距"""
+    n_cells = max(np.size(eta_values), np.size(ph_values)) - 1
+    if n_cells < 2 * coarse_cells:
+        return 0
+    return int(math.floor(math.log2(n_cells / coarse_cells)))
+
+
+def _lattice_axis(values, levels):
+    if np.size(values) == 1:
+        return np.asarray(values[:1], dtype=float), 1
+    n_coarse = max(1, math.ceil((np.size(values) - 1) / 2 ** levels))
+    return np.linspace(values[0], values[-1], n_coarse * 2 ** levels + 1), n_coarse
+
+
+def _lattice_key(i, j, eta_axis, ph_axis):
+    """格点 (i, j) 的键；长度为 1 的轴上全部格点号都对应第 0 个值"""
+    return np.minimum(j, ph_axis.size - 1) * eta_axis.size + np.minimum(i, eta_axis.size - 1)
+
+
+def _lattice_coordinate(values, axis):
+    """values 以最细格点间距为单位、相对 axis[0] 的坐标；长度为 1 的轴取 0"""
+    if axis.size == 1:
+        return np.zeros(np.shape(values))
+    return (values - axis[0]) / (axis[1] - axis[0])
+
+
+def _surplus(values, predicted):
+    """插值误差；部分点非有限（θ 无解、lg r 的零点）时记为无穷大以强制加密"""
+    with np.errstate(invalid='ignore'):
+        error = np.abs(values - predicted)
+    finite = np.isfinite(values)
+    mixed = ~finite & np.isfinite(predicted) | finite & ~np.isfinite(predicted)
+    return np.where(mixed, np.inf, np.where(np.isfinite(error), error, 0.0))
+
+
+def adaptive_scan_2d(params, eta_values, ph_values, lgr_tol=LGR_TOLERANCE, theta_tol=THETA_TOLERANCE,
+                     levels=None, progress=None, cancel=None):
+    """η-pH 自适应扫描，最细分辨率不低于 eta_values、ph_values 的均匀网格，返回 QuadtreeMap
+
+    单元内边中点或中心的 lg(r) 插值误差超过 lgr_tol（数量级）或 θ* 超过 theta_tol 时加密。
+    levels 默认由 quadtree_levels 决定；η 或 pH 只有一个取值时该方向视为一个单元，只沿另一轴加密。
+    progress(已完成层数, 总层数) 每层后回调；
+    cancel 置位后停止加密，返回当前的（较粗的）四叉树。
+    """
+    eta_values = np.asarray(eta_values, dtype=float)
+    ph_values = np.asarray(ph_values, dtype=float)
+    if levels is None:
+        levels = quadtree_levels(eta_values, ph_values)
+    eta_axis, n_eta = _lattice_axis(eta_values, levels)
+    ph_axis, n_ph = _lattice_axis(ph_values, levels)
+    width = eta_axis.size
+    size = 2 ** levels
+
+    keys = np.empty(0, dtype=np.intp)
+    lgr = np.empty(0)
+    theta = np.empty(0)
+
+    def evaluate(i, j):
+        # 计算尚未计算过的格点，合并到按键排序的数组中
+        nonlocal keys, lgr, theta
+        new = np.setdiff1d(_lattice_key(i, j, eta_axis, ph_axis), keys)
+        if new.size:
+            new_j, new_i = np.divmod(new, width)
+            new_lgr, new_theta = map_values(params, eta_axis[new_i], ph_axis[new_j])
+            keys = np.concatenate([keys, new])
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            lgr = np.concatenate([lgr, new_lgr])[order]
+            theta = np.concatenate([theta, new_theta])[order]
+
+    def lookup(i, j):
+        index = np.searchsorted(keys, _lattice_key(i, j, eta_axis, ph_axis))
+        return lgr[index], theta[index]
+
+    i0, j0 = np.meshgrid(np.arange(n_eta) * size, np.arange(n_ph) * size)
+    i0, j0 = i0.ravel(), j0.ravel()
+    evaluate(*(a.ravel() for a in np.meshgrid(np.arange(n_eta + 1) * size, np.arange(n_ph + 1) * size)))
+    leaves = []
+    for level in range(levels):
+        if cancel is not None and cancel.is_set():
+            break
+        half = size // 2
+        corners = [lookup(i0 + di, j0 + dj) for di, dj in ((0, 0), (size, 0), (0, size), (size, size))]
+        # 四条边中点与中心；对应的双线性插值为相关角点的平均
+        probes = (((half, 0), (0, 1)), ((half, size), (2, 3)), ((0, half), (0, 2)),
+                  ((size, half), (1, 3)), ((half, half), (0, 1, 2, 3)))
+        evaluate(np.concatenate([i0 + di for (di, _), _ in probes]),
+                 np.concatenate([j0 + dj for (_, dj), _ in probes]))
+        indicator = np.zeros(i0.size)
+        for (di, dj), around in probes:
+            probe_lgr, probe_theta = lookup(i0 + di, j0 + dj)
+            with np.errstate(invalid='ignore'):
+                predicted_lgr = np.mean([corners[c][0] for c in around], axis=0)
+                predicted_theta = np.mean([corners[c][1] for c in around], axis=0)
+            indicator = np.maximum(indicator, _surplus(probe_lgr, predicted_lgr) / lgr_tol)
+            indicator = np.maximum(indicator, _surplus(probe_theta, predicted_theta) / theta_tol)
+
+        split = indicator > 1.0
+        leaves.append(np.column_stack([i0[~split], j0[~split], np.full((~split).sum(), size)]))
+        i0 = np.concatenate([i0[split] + di for di in (0, half, 0, half)])
+        j0 = np.concatenate([j0[split] + dj for dj in (0, 0, half, half)])
+        size = half
+        if progress:
+            progress(level + 1, levels)
+        if not i0.size:
+            break
+    leaves.append(np.column_stack([i0, j0, np.full(i0.size, size)]))
+    cells = np.concatenate(leaves).astype(np.intp)
+    return QuadtreeMap(eta_axis, ph_axis, keys, lgr, theta, cells, levels)
+
+
+def adaptive_results_2d(tree, eta_values, ph_values):
+    """重采样到 eta_values × ph_values，返回与 scan_2d 相同格式的结果（另含 'tree'）"""
+    eta_grid, ph_grid = np.meshgrid(eta_values, ph_values)
+    lgr, theta = tree.resample(eta_values, ph_values)
+    return {
+        'eta': eta_grid,
+        'ph': ph_grid,
+        'lgr': lgr,
+        'theta': theta,
+        'rows_done': np.ones(np.size(ph_values), dtype=bool),
+        'tree': tree,
+    }
+
+
+def _curve_values(model, frame):
+    """一维结果表格中参与误差判断的列：全部 lg(r) 列（数量级）与覆盖度列"""
+    lg_columns = [name for name in frame.columns if name.startswith('lg(')]
+    return frame[lg_columns].to_numpy(dtype=float).T, frame[list(MODEL_THETA[model])].to_numpy(dtype=float).T
+
+
+def adaptive_scan_1d(params, variable, start, end, fixed_value, min_step=0.0, lgr_tol=LGR_TOLERANCE,
+                     theta_tol=THETA_TOLERANCE, max_points=MAX_POINTS_1D, initial_points=INITIAL_POINTS_1D,
+                     progress=None, cancel=None):
+    """一维自适应扫描，返回与 scan_1d 相同列、按 variable 升序排列的 DataFrame
+
+    从 initial_points 个等间距点开始，每轮在误差估计超过容差的区间中点加点
+    （误差大的区间优先），区间宽度不小于 2·min_step 才继续二分，总点数不超过 max_points。
+    progress(已计算点数, max_points) 每轮后回调；cancel 置位后停止加密。
+    """
+    n_start = max(2, min(initial_points, max_points))
+    if min_step > 0:
+        n_start = max(2, min(n_start, int(abs(end - start) / min_step) + 1))
+    x = np.linspace(start, end, n_start)
+    frames = [scan_1d_frame(params, variable, x, fixed_value)]
+    lg_values, theta_values = _curve_values(params.model, frames[0])
+    # priority[i] 为区间 [x[i], x[i+1]] 的误差估计（相对容差），初始区间全部待检查
+    priority = np.full(x.size, np.inf)
+    if progress:
+        progress(x.size, max_points)
+
+    while x.size < max_points:
+        if cancel is not None and cancel.is_set():
+            break
+        width = np.diff(x)
+        candidates = np.flatnonzero((priority[:-1] > 1.0) & (np.abs(width) >= 2 * min_step))
+        if not candidates.size:
+            break
+        candidates = candidates[np.argsort(-priority[candidates], kind='stable')][:max_points - x.size]
+        candidates.sort()
+        mid = x[candidates] + width[candidates] / 2
+        frame = scan_1d_frame(params, variable, mid, fixed_value)
+        frames.append(frame)
+        mid_lg, mid_theta = _curve_values(params.model, frame)
+        predicted_lg = (lg_values[:, candidates] + lg_values[:, candidates + 1]) / 2
+        predicted_theta = (theta_values[:, candidates] + theta_values[:, candidates + 1]) / 2
+        error = np.maximum(np.max(_surplus(mid_lg, predicted_lg) / lgr_tol, axis=0, initial=0.0),
+                           np.max(_surplus(mid_theta, predicted_theta) / theta_tol, axis=0, initial=0.0))
+
+        # 被二分的区间的两半都继承中点的误差估计
+        priority[candidates] = error
+        x = np.insert(x, candidates + 1, mid)
+        priority = np.insert(priority, candidates + 1, error)
+        lg_values = np.insert(lg_values, candidates + 1, mid_lg, axis=1)
+        theta_values = np.insert(theta_values, candidates + 1, mid_theta, axis=1)
+        if progress:
+            progress(x.size, max_points)
+
+    result = pd.concat(frames, ignore_index=True)
+    return result.sort_values(variable, kind='stable', ignore_index=True)
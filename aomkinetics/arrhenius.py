@@ -0,0 +1,43 @@
+"""温度扫描与表观活化能
+
+E_app = -kB·∂ln r/∂(1/T)，r 为 RATE_KEY 对应的总反应速率。温度扫描沿 T 轴用
+np.gradient 对 1/T 求导（内点二阶精度，可以不等间距）；单一温度下用 T ± dT 的中心差分，
+两个温度在同一次 sweep 中计算。r 改变方向（r = 0）附近 ln|r| 发散，E_app 没有意义。
+"""
+import numpy as np
+
+from .constants import kB
+from .rates import LN10
+from .engine import SweepResult, sweep
+
+ARRHENIUS_DT = 0.5  # K，单一温度下中心差分的步长
+
+
+def _axes(T_values, eta, pH):
+    return {'T': T_values, 'pH': pH, 'η': eta}
+
+
+def arrhenius_scan(params, T_values, eta, pH, progress=None, cancel=None):
+    """T ×（pH ×）η 扫描，返回含 lgr、theta* 与 E_app（eV）的 SweepResult
+
+    eta、pH 为标量（固定）或一维数组（扫描轴）；T_values 至少两个点。
+    """
+    T_values = np.asarray(T_values, dtype=float)
+    if T_values.size < 2:
+        raise ValueError("温度扫描至少需要两个温度")
+    result = sweep(params, _axes(T_values, eta, pH), progress=progress, cancel=cancel)
+    with np.errstate(invalid='ignore'):
+        slope = np.gradient(result['lgr'] * LN10, 1 / T_values, axis=result.dims.index('T'))
+    result.data['E_app'] = -kB * slope
+    return result
+
+
+def apparent_activation_energy(params, eta, pH, dT=ARRHENIUS_DT):
+    """params.T 处的 E_app（eV），返回 dims 为 η、pH 中扫描轴的 SweepResult"""
+    T_values = np.array([params.T - dT, params.T + dT])
+    result = sweep(params, _axes(T_values, eta, pH), fields=('lgr',))
+    low, high = result['lgr'] * LN10
+    with np.errstate(invalid='ignore'):
+        E_app = -kB * (high - low) / (1 / T_values[1] - 1 / T_values[0])
+    dims = result.dims[1:]
+    return SweepResult(dims, {dim: result.coords[dim] for dim in dims}, {'E_app': E_app})
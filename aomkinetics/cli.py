@@ -0,0 +1,284 @@
+"""命令行批量计算：python -m aomkinetics run config.yaml [config2.json ...]
+
+配置文件（YAML 或 JSON）示例：
+
+    model: LH-AOM
+    kinetics: Marcus-Gerischer kinetics
+    T: 298.15
+    delta_gw: 0.8277          # 可省略
+    ea0: 0.5                  # BV 动力学或 LH-AOM 需要
+    bv_method: BEP            # 可省略
+    chem_method: BEP          # 可省略
+    steps:
+      1:  {deltaG: 0.3, lambda: 0.8, z: 1}
+      ...
+      5:  {deltaG: -0.2, gamma: 0.5}
+    scans:
+      - {name: tafel, variable: η, start: -1, end: 1, step: 0.01, fixed: 7}
+      - {name: map, variable: 2D, eta: [-1, 1, 0.01], ph: [0, 14, 0.1], adaptive: true}
+      - {name: eapp, variable: arrhenius, T: [280, 340, 5], eta: [0, 1, 0.01], ph: 7}
+      - {name: nd, variable: sweep, axes: {T: [280, 340, 20], deltaG_1: [0, 1, 0.1], η: [0, 1, 0.01], pH: 7}}
+      - {name: gsa, variable: sobol, eta: [0, 1, 0.05], ph: 13, samples: 1024, ranges: {deltaG_1: [0.1, 0.5]}}
+    output: {directory: results, format: csv}
+
+一维扫描的 fixed 为固定的 pH（variable: η）或 η（variable: pH）；adaptive、lgr_tol、theta_tol、
+max_points 与界面的自适应选项相同。二维扫描设 drc: true 时另输出各步骤的速率控制度，设 slopes: true
+时另输出 Tafel 斜率（mV/dec）与 pH 反应级数 ∂lg r/∂pH（一维结果总是包含这些列）；drc、slopes 都不能
+与 adaptive 同时使用。设 store: true 时写入 store 模块的结果目录（不能与 adaptive 同时使用），
+drc、slopes 由结果目录计算后另写一个结果文件。
+variable: sweep 为 engine.sweep 的 N 维扫描：axes 中 [start, end, step] 为扫描轴、单个数值为固定值，
+fields 可省略（默认 lg r 与 θ*），结果写为每个点一行的长表。variable: arrhenius 为温度扫描，
+另输出表观活化能 E_app；eta、ph 为 [start, end, step] 或固定值。variable: sobol 为 lg r 的 Sobol 全局
+灵敏度分析（sobol 模块），eta、ph 同上，也可以是等长的条件列表（长度不为 3），ranges 覆盖 default_ranges 中的
+区间，samples、seed、workers 可省略；结果为每个 (条件, 输入) 一行的长表。MG 插值表动力学下
+λ 或 T 参与抽样时改用闭式近似（结果的 Kinetics 列与 mg_accuracy 记录实际使用的方式）。
+输出格式为 csv、parquet（需要 pyarrow 或 fastparquet）或 npz；每个扫描另写一个 .json 记录输入与耗时。
+多个配置文件在进程池中并行计算。
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import as_completed
+
+import numpy as np
+import pandas as pd
+
+from .constants import DELTA_GW
+from .params import simulation_parameters, parameters_to_dict
+from .engine import SLOPE_FIELDS, SLOPE_COLUMNS, scan_points, scan_1d, scan_2d, sweep, mg_accuracy, scan_1d_points
+from .adaptive import (
+    LGR_TOLERANCE, THETA_TOLERANCE, MAX_POINTS_1D, adaptive_scan_1d, adaptive_scan_2d, adaptive_results_2d,
+)
+from .arrhenius import arrhenius_scan
+from .store import scan_2d_to_store
+from .parallel import default_workers, get_executor
+from .sobol import SOBOL_SAMPLES, default_ranges, sobol_indices, sobol_table
+
+OUTPUT_FORMATS = ("csv", "parquet", "npz")
+VARIABLES = {"η": "η", "eta": "η", "pH": "pH", "ph": "pH", "2D": "2D", "2d": "2D", "sweep": "sweep",
+             "arrhenius": "arrhenius", "sobol": "sobol"}
+
+
+def load_config(path):
+    """读取 YAML / JSON 配置文件"""
+    with open(path, encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            return json.load(f)
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("读取 YAML 配置需要 PyYAML（pip install pyyaml），或改用 JSON 配置") from None
+        return yaml.safe_load(f)
+
+
+def config_parameters(config):
+    """配置中的模型与动力学参数 → SimulationParameters"""
+    missing = [name for name in ('model', 'kinetics', 'steps') if name not in config]
+    if missing:
+        raise ValueError(f"配置缺少 {', '.join(missing)}")
+    steps = config['steps']
+    if isinstance(steps, dict):
+        steps = {int(n): step for n, step in steps.items()}
+    return simulation_parameters(
+        config['model'], config['kinetics'], float(config.get('T', 298.15)), steps,
+        delta_gw=float(config.get('delta_gw', DELTA_GW)), ea0=config.get('ea0'),
+        bv_method=config.get('bv_method', "BEP"), chem_method=config.get('chem_method', "BEP"),
+    )
+
+
+def _scan_axis(values):
+    start, end, step = (float(value) for value in values)
+    return scan_points(start, end, step)
+
+
+def _axis_or_value(value):
+    return _scan_axis(value) if isinstance(value, (list, tuple)) else float(value)
+
+
+def _conditions(value):
+    """[start, end, step]、条件列表或固定值"""
+    if isinstance(value, (list, tuple)) and len(value) != 3:
+        return np.asarray(value, dtype=float)
+    return _axis_or_value(value)
+
+
+def run_scan(params, scan):
+    """执行一个扫描定义，返回 (结果, 积分精度对照或 None)；一维结果为 DataFrame，二维为字典"""
+    variable = VARIABLES[str(scan['variable'])]
+    lgr_tol = float(scan.get('lgr_tol', LGR_TOLERANCE))
+    theta_tol = float(scan.get('theta_tol', THETA_TOLERANCE))
+    if variable == "sweep":
+        axes = {name: _axis_or_value(value) for name, value in scan['axes'].items()}
+        return sweep(params, axes, fields=tuple(scan.get('fields', ('lgr', 'theta*')))).to_frame(), None
+    if variable == "arrhenius":
+        result = arrhenius_scan(params, _scan_axis(scan['T']), _axis_or_value(scan['eta']),
+                                _axis_or_value(scan['ph']))
+        return result.to_frame(), None
+    if variable == "sobol":
+        ranges = {**default_ranges(params),
+                  **{name: tuple(float(v) for v in bounds) for name, bounds in scan.get('ranges', {}).items()}}
+        result = sobol_indices(params, _conditions(scan['eta']), _conditions(scan['ph']), ranges,
+                               n_samples=int(scan.get('samples', SOBOL_SAMPLES)), seed=int(scan.get('seed', 0)),
+                               max_workers=int(scan.get('workers', 1)))
+        # MG 插值表可能已改为闭式近似，精度对照按实际使用的动力学
+        report = mg_accuracy(params.replace(kinetics=result['kinetics']), result['η'], result['pH'])
+        return sobol_table(result), report
+    if variable == "2D":
+        eta, ph = _scan_axis(scan['eta']), _scan_axis(scan['ph'])
+        if scan.get('adaptive'):
+            requested = [name for name in ('drc', 'slopes') if scan.get(name)]
+            if requested:
+                # 四叉树只按 lg r、θ 加密，插值得到的速率控制度与 Tafel 斜率没有误差控制
+                raise ValueError(f"二维自适应扫描不能同时输出 {'、'.join(requested)}，请去掉 adaptive 或这些选项")
+            tree = adaptive_scan_2d(params, eta, ph, lgr_tol=lgr_tol, theta_tol=theta_tol)
+            return adaptive_results_2d(tree, eta, ph), mg_accuracy(params, *tree.points())
+        result = scan_2d(params, eta, ph, drc=bool(scan.get('drc')), slopes=bool(scan.get('slopes')))
+        return result, mg_accuracy(params, result['eta'], result['ph'])
+
+    fixed = float(scan['fixed'])
+    if scan.get('adaptive'):
+        result = adaptive_scan_1d(params, variable, float(scan['start']), float(scan['end']), fixed,
+                                  min_step=float(scan['step']), lgr_tol=lgr_tol, theta_tol=theta_tol,
+                                  max_points=int(scan.get('max_points', MAX_POINTS_1D)))
+        values = result[variable].to_numpy()
+    else:
+        values = scan_points(float(scan['start']), float(scan['end']), float(scan['step']))
+        result = scan_1d(params, variable, values, fixed)
+    return result, mg_accuracy(params, *scan_1d_points(variable, values, fixed))
+
+
+def result_table(result):
+    """二维结果展平为 (η, pH, lg(r), θ*, DRC*, Tafel 斜率 ...) 长表；一维结果原样返回"""
+    if isinstance(result, pd.DataFrame):
+        return result
+    table = pd.DataFrame({
+        'η': result['eta'].ravel(),
+        'pH': result['ph'].ravel(),
+        'lg(r)': result['lgr'].ravel(),
+        'theta*': result['theta'].ravel(),
+    })
+    for name in result:
+        if name.startswith('DRC'):
+            table[name] = result[name].ravel()
+        elif name in SLOPE_FIELDS:
+            table[SLOPE_COLUMNS[name]] = result[name].ravel()
+    return table
+
+
+def write_result(result, path, output_format):
+    """按格式写出结果，返回文件路径"""
+    if output_format == "npz":
+        path += ".npz"
+        if isinstance(result, pd.DataFrame):
+            arrays = {name: result[name].to_numpy() for name in result.columns}
+            arrays = {name: values.astype(str) if values.dtype == object else values
+                      for name, values in arrays.items()}
+        else:
+            arrays = {name: result[name] for name in result
+                      if name in ('eta', 'ph', 'lgr', 'theta', *SLOPE_FIELDS) or name.startswith('DRC')}
+        np.savez(path, **arrays)
+    elif output_format == "parquet":
+        path += ".parquet"
+        result_table(result).to_parquet(path, index=False)
+    else:
+        path += ".csv"
+        result_table(result).to_csv(path, index=False)
+    return path
+
+
+def run_config(path, directory=None, output_format=None):
+    """计算一个配置文件中的全部扫描，返回写出的文件列表"""
+    config = load_config(path)
+    params = config_parameters(config)
+    output = config.get('output') or {}
+    directory = directory or output.get('directory') or os.path.dirname(os.path.abspath(path))
+    if not os.path.isabs(directory):
+        directory = os.path.join(os.path.dirname(os.path.abspath(path)), directory)
+    output_format = output_format or output.get('format', "csv")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"未知输出格式: {output_format}")
+    os.makedirs(directory, exist_ok=True)
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    scans = config.get('scans') or [config['scan']]
+    written = []
+    for i, scan in enumerate(scans, start=1):
+        name = f"{stem}_{scan.get('name', i)}"
+        started = time.perf_counter()
+        if scan.get('store') and VARIABLES[str(scan['variable'])] == "2D":
+            if scan.get('adaptive'):
+                raise ValueError("二维扫描的 store 不能与 adaptive 同时使用")
+            store_path = os.path.join(directory, name + "_map")
+            store = scan_2d_to_store(params, _scan_axis(scan['eta']), _scan_axis(scan['ph']), store_path)
+            outputs = [store_path]
+            report = None
+            if scan.get('drc') or scan.get('slopes'):
+                # 结果目录只保存 k、r、θ；速率控制度与斜率由其按行块计算后另写一个结果文件
+                result = store.results_2d(drc=bool(scan.get('drc')), slopes=bool(scan.get('slopes')))
+                outputs.append(write_result(result, os.path.join(directory, name), output_format))
+        else:
+            result, report = run_scan(params, scan)
+            outputs = [write_result(result, os.path.join(directory, name), output_format)]
+        written.extend(outputs)
+        summary = {
+            'config': os.path.abspath(path),
+            'params': parameters_to_dict(params),
+            'scan': scan,
+            'output': outputs[0] if len(outputs) == 1 else outputs,
+            'elapsed': time.perf_counter() - started,
+            'mg_accuracy': report,
+        }
+        with open(os.path.join(directory, name + ".json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2, default=float)
+        written.append(os.path.join(directory, name + ".json"))
+    return written
+
+
+def _run_config_task(path, directory, output_format):
+    """进程池任务：异常转为文本返回，一个配置出错不影响其余配置"""
+    try:
+        return path, run_config(path, directory, output_format), None
+    except Exception:
+        return path, [], traceback.format_exc()
+
+
+def run_configs(paths, directory=None, output_format=None, max_workers=None, log=print):
+    """并行计算多个配置文件，返回 {配置文件: 错误信息或 None}"""
+    max_workers = min(max_workers or default_workers(), max(len(paths), 1))
+    if max_workers == 1:
+        outcomes = (_run_config_task(path, directory, output_format) for path in paths)
+    else:
+        executor = get_executor(max_workers)
+        futures = [executor.submit(_run_config_task, path, directory, output_format) for path in paths]
+        outcomes = (future.result() for future in as_completed(futures))
+
+    errors = {}
+    for done, (path, written, error) in enumerate(outcomes, start=1):
+        errors[path] = error
+        if error is None:
+            log(f"[{done}/{len(paths)}] {path} → {', '.join(written)}")
+        else:
+            log(f"[{done}/{len(paths)}] {path} 失败：\n{error}")
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aomkinetics",
+                                     description="AOM 微观动力学的无界面批量计算")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="计算一个或多个 YAML/JSON 配置文件")
+    run.add_argument("configs", nargs="+", help="配置文件")
+    run.add_argument("-o", "--output", help="输出目录（默认为配置中的 output.directory 或配置文件所在目录）")
+    run.add_argument("-f", "--format", choices=OUTPUT_FORMATS, help="输出格式（默认为配置中的 output.format 或 csv）")
+    run.add_argument("-j", "--jobs", type=int, default=None, help="并行进程数（默认为 CPU 核数）")
+    args = parser.parse_args(argv)
+
+    errors = run_configs(args.configs, args.output, args.format, args.jobs)
+    failed = [path for path, error in errors.items() if error is not None]
+    if failed:
+        print(f"{len(failed)}/{len(errors)} 个配置失败", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,204 @@
+"""由机理图生成稳态覆盖度的 NumPy 计算核（aomkinetics/kernels.py）
+
+King-Altman 方法：物种 j 的覆盖度分子是以 j 为根的全部有向生成树（其余每个物种
+恰好沿一条转移指向根）上速率常数的乘积之和，分母为全部分子之和。生成器先枚举生成树
+得到多线性多项式，再按出现次数最多的速率常数逐层提取公因子（多元 Horner 形式），
+相同的子多项式只计算一次（公共子表达式消除），最后写出只含局部变量和数组乘加的函数。
+
+重新生成并与 mechanism 中的展开公式核对：
+
+    python -m aomkinetics.codegen
+"""
+import importlib
+import itertools
+import os
+
+import numpy as np
+
+from .mechanism import MODEL_GRAPH, MODEL_THETA, er_aom_theta, lh_aom_theta
+
+KERNEL_PATH = os.path.join(os.path.dirname(__file__), "kernels.py")
+REFERENCE_THETA = {"ER-AOM": er_aom_theta, "LH-AOM": lh_aom_theta}
+# 与 mechanism 中闭式解一致的分母有效性判据
+DENOMINATOR_CHECK = {
+    "ER-AOM": "np.isfinite(denominator) & (denominator > 1e-30)",
+    "LH-AOM": "np.isfinite(denominator) & (denominator != 0)",
+}
+
+
+def rate_symbol(key):
+    """k 字典键名对应的局部变量名：'k-21' → 'km21'"""
+    return key.replace('-', 'm')
+
+
+def transitions(model):
+    """{物种: [(目标物种, k 键名), ...]}"""
+    out = {name: [] for name in MODEL_THETA[model]}
+    for step, source, product in MODEL_GRAPH[model]:
+        out[source].append((product, f'k{step}'))
+        out[product].append((source, f'k-{step}'))
+    return out
+
+
+def king_altman_numerators(model):
+    """{物种: 多项式}，多项式为单项式（速率常数键名的 frozenset）的 frozenset"""
+    species = MODEL_THETA[model]
+    moves = transitions(model)
+    numerators = {}
+    for root in species:
+        others = [name for name in species if name != root]
+        monomials = set()
+        for choice in itertools.product(*(moves[name] for name in others)):
+            target = dict(zip(others, (product for product, _ in choice)))
+            if all(_reaches(name, root, target) for name in others):
+                monomials.add(frozenset(key for _, key in choice))
+        numerators[root] = frozenset(monomials)
+    return numerators
+
+
+def _reaches(name, root, target):
+    """沿 target 指针能否到达 root（无环）"""
+    seen = set()
+    while name != root:
+        if name in seen:
+            return False
+        seen.add(name)
+        name = target[name]
+    return True
+
+
+class _Emitter:
+    """多项式因式分解与公共子表达式消除"""
+
+    def __init__(self):
+        self.lines = []
+        self.names = {}
+        self.multiplications = 0
+        self.additions = 0
+
+    def temp(self, poly):
+        """返回代表 poly 的表达式；多于一项的子多项式存为临时变量，重复出现时直接复用"""
+        if len(poly) == 1:
+            return self.product(next(iter(poly)))
+        if poly not in self.names:
+            expr = self.factor(poly)
+            name = f"t{len(self.names)}"
+            self.lines.append(f"{name} = {expr}")
+            self.names[poly] = name
+        return self.names[poly]
+
+    def product(self, monomial):
+        symbols = sorted(rate_symbol(key) for key in monomial)
+        self.multiplications += len(symbols) - 1
+        return "*".join(symbols) if symbols else "1.0"
+
+    def factor(self, poly):
+        """poly = s·Q + P：s 为出现次数最多的速率常数，Q、P 递归处理"""
+        counts = {}
+        for monomial in poly:
+            for key in monomial:
+                counts[key] = counts.get(key, 0) + 1
+        if not counts or max(counts.values()) == 1:
+            parts = [self.product(monomial) for monomial in sorted(poly, key=sorted)]
+            self.additions += len(parts) - 1
+            return " + ".join(parts)
+
+        key = min(counts, key=lambda name: (-counts[name], name))
+        quotient = frozenset(monomial - {key} for monomial in poly if key in monomial)
+        remainder = frozenset(monomial for monomial in poly if key not in monomial)
+        if frozenset() in quotient:
+            # s·(1 + ...) 不再展开，保持多线性
+            inner = self.temp(quotient - {frozenset()})
+            self.additions += 1
+            term = f"{rate_symbol(key)}*({inner} + 1.0)"
+        else:
+            term = f"{rate_symbol(key)}*{self.temp(quotient)}"
+        self.multiplications += 1
+        if not remainder:
+            return term
+        self.additions += 1
+        return f"{term} + {self.temp(remainder)}"
+
+
+def generate_kernel(model):
+    """返回 (函数源码, 乘法次数, 加法次数, 原始展开式的乘法次数)"""
+    numerators = king_altman_numerators(model)
+    species = MODEL_THETA[model]
+    emitter = _Emitter()
+    terms = [emitter.temp(numerators[name]) for name in species]
+    emitter.additions += len(terms) - 1
+    expanded = sum(len(poly) * (len(next(iter(poly))) - 1) for poly in numerators.values())
+
+    keys = sorted({key for poly in numerators.values() for monomial in poly for key in monomial},
+                  key=lambda key: (int(key.lstrip('k-')), key.startswith('k-')))
+    name = model.lower().replace('-', '_')
+    body = [
+        f"def {name}_theta_kernel(k):",
+        f'    """{model} 稳态覆盖度（生成代码：{emitter.multiplications} 次乘法、{emitter.additions} 次加法，'
+        f'展开式为 {expanded} 次乘法）"""',
+    ]
+    body += [f"    {rate_symbol(key)} = k['{key}']" for key in keys]
+    body += [f"    {line}" for line in emitter.lines]
+    body.append(f"    denominator = {' + '.join(terms)}")
+    body += [
+        "    with np.errstate(invalid='ignore'):",
+        f"        valid = {DENOMINATOR_CHECK[model]}",
+        "    denominator = np.where(valid, denominator, np.nan)",
+        "    return {",
+    ]
+    body += [f"        '{theta}': {term} / denominator," for theta, term in zip(species, terms)]
+    body.append("    }")
+    return "\n".join(body) + "\n", emitter.multiplications, emitter.additions, expanded
+
+
+def generate_module():
+    """kernels.py 的完整源码"""
+    header = [
+        '"""稳态覆盖度计算核',
+        '',
+        '本文件由 aomkinetics.codegen 根据 mechanism.MODEL_GRAPH 自动生成，请勿手工修改；',
+        '修改机理后运行 python -m aomkinetics.codegen 重新生成并核对。',
+        '"""',
+        'import numpy as np',
+        '',
+        '',
+    ]
+    functions = [generate_kernel(model)[0] for model in MODEL_GRAPH]
+    return "\n".join(header) + "\n" + "\n\n".join(functions)
+
+
+def check_kernels(n_points=20000, decades=(-8, 12), seed=0, rtol=1e-12):
+    """在随机 k（对数均匀分布）上比较生成的计算核与 mechanism 中的展开公式，返回最大相对偏差"""
+    from . import kernels
+
+    rng = np.random.default_rng(seed)
+    worst = {}
+    for model in MODEL_GRAPH:
+        k = {f'k{sign}{step}': 10 ** rng.uniform(*decades, n_points)
+             for step, _, _ in MODEL_GRAPH[model] for sign in ('', '-')}
+        fast = getattr(kernels, f"{model.lower().replace('-', '_')}_theta_kernel")(k)
+        reference = REFERENCE_THETA[model](k)
+        worst[model] = max(float(np.nanmax(np.abs(fast[name] - reference[name]) / reference[name]))
+                           for name in MODEL_THETA[model])
+        if worst[model] > rtol:
+            raise AssertionError(f"{model} 计算核与展开公式不一致：最大相对偏差 {worst[model]:.2e}")
+    return worst
+
+
+def main():
+    source = generate_module()
+    # 与仓库中其他源文件一致使用 CRLF 换行
+    with open(KERNEL_PATH, "w", encoding="utf-8", newline="\r\n") as f:
+        f.write(source)
+    for model in MODEL_GRAPH:
+        _, multiplications, additions, expanded = generate_kernel(model)
+        print(f"{model}: {multiplications} 次乘法、{additions} 次加法（展开式 {expanded} 次乘法）")
+    # 重新载入刚写出的计算核后核对
+    from . import kernels
+    importlib.reload(kernels)
+    for model, error in check_kernels().items():
+        print(f"{model}: 与展开公式的最大相对偏差 {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
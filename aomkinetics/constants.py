@@ -0,0 +1,10 @@
+"""物理常数（与 AOMKineticsGUI 保持一致）"""
+
+R = 8.314  # 气体常数，J/(mol·K)
+F = 96485.33289  # 法拉第常数，C/mol
+h = 4.13568e-15  # 普朗克常数，eV·s
+kB = 8.61689e-5  # 玻尔兹曼常数，eV/K
+eV_to_J = 1.60218e-19  # 电子伏特到焦耳的转换因子
+epsilon = 1e-6
+
+DELTA_GW = 0.8277  # △G_w 默认值，eV
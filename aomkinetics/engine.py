@@ -0,0 +1,527 @@
+"""无界面的计算核心：一维 / 二维扫描都是 SimulationParameters 的纯函数
+
+sweep 对任意输入（η、pH、T、ΔGw、Ea0 与各步骤参数）的笛卡尔积做 N 维扫描，
+一维、二维扫描是它只含 η、pH 两个轴时的特例。
+
+Tafel 斜率与 pH 反应级数（rate_slopes）按链式法则求导：各通道速率常数只经
+U = η - (RT/F)·ln10·pH 依赖 η、pH，∂ln k/∂U 由 U ± h 的中心差分得到（BV 的 ln k 对 U 线性、
+Marcus 为二次式，中心差分是精确的），组合通道的 10^-pH 因子解析求导，稳态覆盖度部分
+用复步长微分（sensitivity.log_rate_derivatives）。
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from .constants import R, F
+from .rates import LN10, bv_rate_constants, chem_rate_constants, marcus_rate_constants
+from .mg import mg_rate_constants, mg_quadrature_error, mg_approximation_error
+from .mechanism import (
+    ER_AOM_STEPS, LH_AOM_STEPS, MODEL_STEPS, ER_AOM_THETA, LH_AOM_THETA,
+    stack_step_parameters, unstack_rate_constants, combine_rate_constants,
+    solve_steady_state, log_rate,
+)
+from .params import BV_KINETICS, MARCUS_KINETICS, CHEM_STEP, step_parameter_names, required_steps
+from .stepcache import STEP_CACHE, grid_key, step_key
+from .sensitivity import drc_fields, degree_of_rate_control, log_rate_derivatives
+
+RATE_KEY = {"ER-AOM": 'r4', "LH-AOM": 'r5'}  # 二维图中 lg(r) 对应的总反应速率
+GRID_SOLVER = "gth"  # 二维网格的稳态覆盖度用批量线性求解，一维曲线仍用闭式解
+FIXED_LABEL = {"η": "Fixed pH", "pH": "Fixed η"}
+SWEEP_CHUNK_POINTS = 2 ** 18  # N 维扫描每批计算的点数
+GLOBAL_AXES = ('T', 'delta_gw', 'ea0')  # SimulationParameters 中的标量输入
+CONDITION_AXES = ('η', 'pH')
+AXIS_ALIASES = {'eta': 'η', 'ph': 'pH', 'ΔGw': 'delta_gw', 'Ea0': 'ea0'}
+SLOPE_FIELDS = ('tafel', 'dlgr_dpH')  # Tafel 斜率 ∂η/∂lg r（mV/dec）与 pH 反应级数 ∂lg r/∂pH
+SLOPE_COLUMNS = {'tafel': 'Tafel slope (mV/dec)', 'dlgr_dpH': 'dlg(r)/dpH'}  # 一维结果表格中的列名
+DERIVATIVE_STEP = 1e-5  # V，∂ln k/∂U 中心差分的步长
+
+
+def scan_points(start, end, step):
+    """含终点的等间距扫描点"""
+    return np.arange(start, end + step / 2, step)
+
+
+def scan_1d_points(variable, values, fixed_value):
+    """一维扫描对应的 (η, pH) 数组"""
+    if variable == "η":
+        eta, pH = values, fixed_value
+    else:
+        eta, pH = fixed_value, values
+    return np.broadcast_arrays(np.asarray(eta, dtype=float), np.asarray(pH, dtype=float))
+
+
+def _stacked_parameters(params, ndim):
+    step_nums = MODEL_STEPS[params.model]
+    return stack_step_parameters(params.steps, step_nums, step_parameter_names(params.kinetics), ndim)
+
+
+def kinetics_rate_constants(params, stacked, eta, pH):
+    """按 params 的动力学类型与方法计算 (k_a, k_-a, k_b, k_-b)
+
+    stacked 为 step_parameter_names(params.kinetics) 顺序的步骤参数数组，与 η、pH 广播。
+    """
+    if params.kinetics == BV_KINETICS:
+        return bv_rate_constants(*stacked, params.ea0, params.T, eta, pH,
+                                 method=params.bv_method, delta_gw=params.delta_gw)
+    if params.kinetics == MARCUS_KINETICS:
+        return marcus_rate_constants(*stacked, params.T, eta, pH, delta_gw=params.delta_gw)
+    return mg_rate_constants(*stacked, params.T, eta, pH, delta_gw=params.delta_gw, method=params.mg_method)
+
+
+def _step_rate_constants(params, step_nums, eta, pH):
+    """step_nums 各步骤的 (k_a, k_-a, k_b, k_-b)，形状 (len(step_nums), *grid)"""
+    stacked = stack_step_parameters(params.steps, step_nums, step_parameter_names(params.kinetics), eta.ndim)
+    return kinetics_rate_constants(params, stacked, eta, pH)
+
+
+def rate_constants(params, eta, pH, cache=STEP_CACHE):
+    """全部步骤的组合速率常数字典（η、pH 可为数组或 meshgrid）
+
+    各电化学步骤的速率常数经 cache（stepcache.StepRateCache）按步骤缓存，
+    只改动部分步骤的参数后再计算时其余步骤直接复用；cache=None 时不缓存。
+    """
+    eta, pH = np.broadcast_arrays(np.asarray(eta, dtype=float), np.asarray(pH, dtype=float))
+    step_nums = MODEL_STEPS[params.model]
+    T = params.T
+    if cache is None:
+        k = unstack_rate_constants(step_nums, *_step_rate_constants(params, step_nums, eta, pH))
+    else:
+        grid = grid_key(eta, pH)
+        k = {}
+        for n in step_nums:
+            constants = cache.get(step_key(params, n, grid),
+                                  lambda n=n: _step_rate_constants(params, (n,), eta, pH))
+            k.update(unstack_rate_constants((n,), *constants))
+    if params.model == "LH-AOM":
+        step = params.steps[CHEM_STEP]
+        k5, k_minus5 = chem_rate_constants(step['deltaG'], step['gamma'], params.ea0, T, params.chem_method)
+        k['k5'] = np.full(eta.shape, k5)
+        k['k-5'] = np.full(eta.shape, k_minus5)
+    return combine_rate_constants(k, step_nums, pH)
+
+
+def catalyst_rate_constants(params, steps, eta, pH):
+    """逐催化剂参数下的组合速率常数
+
+    steps 为 {步骤号: {参数名: (n_catalysts,) 数组}}（含全部 required_steps），η、pH 为长度 n_conditions
+    的一维数组，每个值的形状为 (n_catalysts, n_conditions)。
+    """
+    step_nums = MODEL_STEPS[params.model]
+    stacked = [np.stack([steps[n][name] for n in step_nums])[:, :, None]
+               for name in step_parameter_names(params.kinetics)]
+    k = unstack_rate_constants(step_nums, *kinetics_rate_constants(params, stacked, eta, pH))
+    if params.model == "LH-AOM":
+        chem = steps[CHEM_STEP]
+        k5, k_minus5 = chem_rate_constants(chem['deltaG'][:, None], chem['gamma'][:, None], params.ea0,
+                                           params.T, params.chem_method)
+        shape = np.broadcast_shapes(k5.shape, np.shape(eta))
+        k['k5'] = np.broadcast_to(k5, shape)
+        k['k-5'] = np.broadcast_to(k_minus5, shape)
+    return combine_rate_constants(k, step_nums, pH)
+
+
+def _log_slope(k, k_plus, k_minus, step):
+    """(ln k₊ - ln k₋)/2h；k 为零（下溢）的点导数取 0"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (np.log(k_plus) - np.log(k_minus)) / (2 * step)
+    return np.where((k > 0) & np.isfinite(slope), slope, 0.0)
+
+
+def _ratio(numerator, k):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(k > 0, numerator / k, 0.0)
+
+
+def rate_slopes(params, eta, pH, steps=None, k=None, step=DERIVATIVE_STEP):
+    """RATE_KEY 对应速率的 Tafel 斜率与 pH 反应级数，返回 {'tafel', 'dlgr_dpH'}
+
+    steps 为 None 时使用 params 的步骤参数（形状同 η、pH 广播），否则为 catalyst_steps 形式的
+    逐催化剂参数（形状 (n_catalysts, n_conditions)）；k 为已算好的组合速率常数（可省略）。
+    r 改变方向（r = 0）处 Tafel 斜率为 0、反应级数发散。
+    """
+    def constants(eta, pH, cache=STEP_CACHE):
+        if steps is None:
+            return rate_constants(params, eta, pH, cache=cache)
+        return catalyst_rate_constants(params, steps, eta, pH)
+
+    eta, pH = np.asarray(eta, dtype=float), np.asarray(pH, dtype=float)
+    if k is None:
+        k = constants(eta, pH)
+    k_plus, k_minus = constants(eta + step, pH, cache=None), constants(eta - step, pH, cache=None)
+    dU_dpH = -(R * params.T / F) * LN10
+    c_a, c_b = 10.0 ** -pH, 10.0 ** -(14 - pH)
+
+    d_eta, d_pH = {}, {}
+    for n in MODEL_STEPS[params.model]:
+        dk = {name: k[name] * _log_slope(k[name], k_plus[name], k_minus[name], step)
+              for name in (f'k{n}a', f'k-{n}a', f'k{n}b', f'k-{n}b')}
+        forward = dk[f'k{n}a'] + dk[f'k{n}b'] * c_b  # ∂k_i/∂U
+        backward = dk[f'k-{n}a'] * c_a + dk[f'k-{n}b']
+        d_eta[f'k{n}'] = _ratio(forward, k[f'k{n}'])
+        d_eta[f'k-{n}'] = _ratio(backward, k[f'k-{n}'])
+        d_pH[f'k{n}'] = _ratio(dU_dpH * forward + LN10 * k[f'k{n}b'] * c_b, k[f'k{n}'])
+        d_pH[f'k-{n}'] = _ratio(dU_dpH * backward - LN10 * k[f'k-{n}a'] * c_a, k[f'k-{n}'])
+
+    dln_eta, dln_pH = log_rate_derivatives(params.model, k, [d_eta, d_pH], RATE_KEY[params.model])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {'tafel': 1000 * LN10 / dln_eta, 'dlgr_dpH': dln_pH / LN10}
+
+
+def mg_accuracy(params, eta, pH):
+    """MG 积分精度对照；非 MG 动力学返回 None
+
+    插值表与原有 quad 对照，闭式近似与精确积分对照（附扫描到的驱动力范围）。
+    返回 {'method', 'error', 'x_range'}。
+    """
+    if params.mg_method is None:
+        return None
+    eta, pH = np.broadcast_arrays(np.asarray(eta, dtype=float), np.asarray(pH, dtype=float))
+    stacked = _stacked_parameters(params, eta.ndim)
+    if params.mg_method == "approximation":
+        error, x_min, x_max = mg_approximation_error(*stacked, params.T, eta, pH, delta_gw=params.delta_gw)
+        return {'method': params.mg_method, 'error': error, 'x_range': (x_min, x_max)}
+    error = mg_quadrature_error(*stacked, params.T, eta, pH, delta_gw=params.delta_gw)
+    return {'method': params.mg_method, 'error': error, 'x_range': None}
+
+
+def one_d_columns(model, k, theta, r):
+    """按结果表格的列顺序排列 k、lg(r)、r 与 θ"""
+    columns = {}
+    if model == "ER-AOM":
+        for i in ER_AOM_STEPS:
+            columns[f'k{i}'] = k[f'k{i}']
+            columns[f'k-{i}'] = k[f'k-{i}']
+            columns[f'lg(r{i})'] = log_rate(r[f'r{i}'])
+        for theta_name in ER_AOM_THETA:
+            columns[theta_name] = theta[theta_name]
+    else:
+        for step in LH_AOM_STEPS + (CHEM_STEP,):
+            columns[f'k{step}'] = k[f'k{step}']
+            columns[f'k-{step}'] = k[f'k-{step}']
+        columns['r1'] = r['r1']  # 原始速率
+        for r_step in ['5', '21', '22']:
+            columns[f'lg(r{r_step})'] = log_rate(r[f'r{r_step}'])
+        for r_step in ['21', '22', '2', '31', '32', '3', '4', '5']:
+            columns[f'r{r_step}'] = r[f'r{r_step}']
+        for theta_name in LH_AOM_THETA:
+            columns[theta_name] = theta[theta_name]
+    return columns
+
+
+def grid_fields(model):
+    """scan_2d_fields 返回的全部字段名：组合速率常数、各步净速率与覆盖度"""
+    steps = MODEL_STEPS[model] + ((CHEM_STEP,) if model == "LH-AOM" else ())
+    k_fields = [f'k{sign}{step}' for step in steps for sign in ('', '-')]
+    if model == "ER-AOM":
+        r_fields = [f'r{step}' for step in ER_AOM_STEPS]
+        theta_fields = list(ER_AOM_THETA)
+    else:
+        r_fields = ['r1', 'r21', 'r22', 'r2', 'r31', 'r32', 'r3', 'r4', 'r5']
+        theta_fields = list(LH_AOM_THETA)
+    return k_fields + r_fields + theta_fields
+
+
+def sweep_fields(model):
+    """sweep 可返回的字段：'lgr'（RATE_KEY 的 lg r）、grid_fields 的全部字段、速率控制度 DRC*
+    与 SLOPE_FIELDS"""
+    return ['lgr'] + grid_fields(model) + drc_fields(model) + list(SLOPE_FIELDS)
+
+
+class SweepResult:
+    """N 维扫描结果
+
+    dims 为维度名，coords 为 {维度名: 取值}，data 为 {字段名: 形状为各维长度的数组}。
+    """
+
+    def __init__(self, dims, coords, data):
+        self.dims = tuple(dims)
+        self.coords = coords
+        self.data = data
+
+    @property
+    def shape(self):
+        return tuple(self.coords[dim].size for dim in self.dims)
+
+    def __getitem__(self, field):
+        return self.data[field]
+
+    def sel(self, **values):
+        """按最接近的坐标取出若干维上的一个截面，这些维度从结果中去掉"""
+        index = [slice(None)] * len(self.dims)
+        for dim, value in values.items():
+            dim = AXIS_ALIASES.get(dim, dim)
+            index[self.dims.index(dim)] = int(np.argmin(np.abs(self.coords[dim] - value)))
+        dims = [dim for dim in self.dims if dim not in {AXIS_ALIASES.get(d, d) for d in values}]
+        return SweepResult(dims, {dim: self.coords[dim] for dim in dims},
+                           {name: array[tuple(index)] for name, array in self.data.items()})
+
+    def to_frame(self):
+        """展平为每个点一行的长表，维度在前、字段在后"""
+        grids = np.meshgrid(*(self.coords[dim] for dim in self.dims), indexing='ij')
+        columns = {dim: grid.ravel() for dim, grid in zip(self.dims, grids)}
+        columns.update((name, array.ravel()) for name, array in self.data.items())
+        return pd.DataFrame(columns)
+
+
+def sweep_axis(params, name):
+    """规范化的轴名与类别（'global'、'step'、'condition'）；步骤参数的轴名同参数表列名，如 deltaG_1"""
+    name = AXIS_ALIASES.get(name, name)
+    if name in CONDITION_AXES:
+        return name, 'condition'
+    if name in GLOBAL_AXES:
+        return name, 'global'
+    parameter, _, step = name.rpartition('_')
+    if step.isdigit() and int(step) in required_steps(params.model):
+        names = ('deltaG', 'gamma') if int(step) == CHEM_STEP else step_parameter_names(params.kinetics)
+        if parameter in names:
+            return name, 'step'
+    raise ValueError(f"无法扫描 {name}：可用的轴为 η、pH、{'、'.join(GLOBAL_AXES)} 与 "
+                     f"{params.model}/{params.kinetics} 的步骤参数（如 deltaG_1）")
+
+
+def _sweep_values(params, steps, eta, pH, fields, solver):
+    """一批点上的字段；steps 为 None 时使用 params 的步骤参数（经 STEP_CACHE），形状同 η，
+    否则形状为 (n_catalysts, n_conditions)"""
+    if steps is None:
+        k = rate_constants(params, eta, pH)
+    else:
+        k = catalyst_rate_constants(params, steps, eta, pH)
+    theta, r = solve_steady_state(params.model, k, solver=solver)
+    values = {**k, **r, **theta}
+    if 'lgr' in fields:
+        values['lgr'] = log_rate(r[RATE_KEY[params.model]])
+    if any(name in fields for name in drc_fields(params.model)):
+        values.update(degree_of_rate_control(params.model, k, RATE_KEY[params.model], solver))
+    if any(name in fields for name in SLOPE_FIELDS):
+        values.update(rate_slopes(params, eta, pH, steps, k))
+    return {name: values[name] for name in fields}
+
+
+def apply_inputs(params, values):
+    """把 {轴名: 标量}（T、delta_gw、ea0 与 deltaG_1 形式的步骤参数）写入参数，返回新的参数对象"""
+    steps = {n: dict(step) for n, step in params.steps.items()}
+    changes = {}
+    for name, value in values.items():
+        name, kind = sweep_axis(params, name)
+        if kind == 'global':
+            changes[name] = float(value)
+        elif kind == 'step':
+            parameter, _, step = name.rpartition('_')
+            steps[int(step)][parameter] = float(value)
+        else:
+            raise ValueError(f"{name} 是扫描条件，不是参数")
+    return params.replace(steps=steps, **changes)
+
+
+def _chunk_points(model, fields, chunk_points):
+    if any(name in fields for name in drc_fields(model)):
+        # 每个点要求解 2 × 步骤数组扰动后的稳态
+        return max(1, chunk_points // (2 * len(drc_fields(model))))
+    return chunk_points
+
+
+def sample_values(params, samples, eta, pH, fields=('lgr',), solver=GRID_SOLVER, chunk_points=SWEEP_CHUNK_POINTS,
+                  progress=None, cancel=None):
+    """逐组输入的批量计算，返回 {字段名: (n_samples, n_conditions) 数组}
+
+    samples 为 {轴名: (n_samples,) 数组}（轴名同 sweep），同一下标的值为一组输入；η、pH 为标量或
+    可广播为同一长度的一维数组。步骤参数与 T、ΔGw、Ea0 都沿催化剂轴向量化（MG 插值表仍按
+    (λ, T) 的不同取值分别建表）。progress(已完成组数, 总组数) 每批后回调，cancel 置位后停止，
+    未完成的组为 NaN。
+    """
+    eta, pH = np.broadcast_arrays(np.atleast_1d(np.asarray(eta, dtype=float)),
+                                  np.atleast_1d(np.asarray(pH, dtype=float)))
+    arrays, kinds = {}, {}
+    for name, values in samples.items():
+        name, kind = sweep_axis(params, name)
+        if kind == 'condition':
+            raise ValueError(f"{name} 是扫描条件，应作为 eta / pH 给出")
+        arrays[name] = np.asarray(values, dtype=float).ravel()
+        kinds[name] = kind
+    n_samples = np.broadcast_shapes(*(array.shape for array in arrays.values()))[0] if arrays else 1
+    arrays = {name: np.broadcast_to(array, (n_samples,)) for name, array in arrays.items()}
+    global_names = [name for name in arrays if kinds[name] == 'global']
+    step_names = [name for name in arrays if kinds[name] == 'step']
+
+    data = {name: np.full((n_samples, eta.size), np.nan) for name in fields}
+    chunk = max(1, _chunk_points(params.model, fields, chunk_points) // eta.size)
+    for start in range(0, n_samples, chunk):
+        if cancel is not None and cancel.is_set():
+            break
+        rows = slice(start, min(start + chunk, n_samples))
+        size = rows.stop - rows.start
+        # 速率常数对 T、ΔGw、Ea0 逐元素广播：以 (n_catalysts, 1) 数组直接放进参数对象
+        #（_replace 不经 simulation_parameters 的标量校验）
+        chunk_params = params._replace(**{name: arrays[name][rows][:, None] for name in global_names})
+        steps = {n: {name: np.full(size, float(value)) for name, value in step.items()}
+                 for n, step in params.steps.items()}
+        for name in step_names:
+            parameter, _, step = name.rpartition('_')
+            steps[int(step)][parameter] = arrays[name][rows]
+        values = _sweep_values(chunk_params, steps, eta, pH, fields, solver)
+        for name in fields:
+            data[name][rows] = values[name]
+        if progress:
+            progress(rows.stop, n_samples)
+    return data
+
+
+def sweep(params, axes, fields=('lgr', 'theta*'), solver=GRID_SOLVER, chunk_points=SWEEP_CHUNK_POINTS,
+          progress=None, cancel=None):
+    """对 axes 的笛卡尔积做 N 维扫描，返回 SweepResult
+
+    axes 为有序的 {轴名: 取值}：η（或 eta）、pH、T、delta_gw、ea0，以及参数表列名形式的步骤参数
+    （deltaG_1、lambda_21、gamma_5 ...）。取值为标量时只固定该输入、不作为维度；η、pH 必须给出。
+    fields 取自 sweep_fields(params.model)。η、pH 沿点轴、步骤参数沿催化剂轴向量化，
+    T、ΔGw、Ea0 的每个组合单独计算；每批不超过 chunk_points 个点（含 DRC 字段时按扰动组数
+    相应减少），每批后回调
+    progress(已完成点数, 总点数)，cancel 置位后停止，未完成的点为 NaN。
+    """
+    unknown = [name for name in fields if name not in sweep_fields(params.model)]
+    if unknown:
+        raise ValueError(f"未知字段: {', '.join(unknown)}")
+    fixed, coords, kinds = {}, {}, {}
+    for name, values in axes.items():
+        name, kind = sweep_axis(params, name)
+        if name in fixed or name in coords:
+            raise ValueError(f"轴 {name} 重复")
+        if np.ndim(values) == 0:
+            fixed[name] = float(values)
+        else:
+            coords[name] = np.asarray(values, dtype=float).ravel()
+            kinds[name] = kind
+    missing = [name for name in CONDITION_AXES if name not in fixed and name not in coords]
+    if missing:
+        raise ValueError(f"需要给出 {'、'.join(missing)}")
+
+    # 标量输入直接写入参数
+    params = apply_inputs(params, {name: value for name, value in fixed.items() if name not in CONDITION_AXES})
+
+    dims = list(coords)
+    global_dims = [dim for dim in dims if kinds[dim] == 'global']
+    step_dims = [dim for dim in dims if kinds[dim] == 'step']
+    condition_dims = [dim for dim in dims if kinds[dim] == 'condition']
+    order = global_dims + step_dims + condition_dims
+    n_global, n_catalysts, n_conditions = (int(np.prod([coords[dim].size for dim in group]))
+                                           for group in (global_dims, step_dims, condition_dims))
+
+    conditions = dict(zip(condition_dims, (grid.ravel() for grid in np.meshgrid(
+        *(coords[dim] for dim in condition_dims), indexing='ij'))))
+    eta = conditions.get('η', np.full(n_conditions, fixed.get('η', np.nan)))
+    pH = conditions.get('pH', np.full(n_conditions, fixed.get('pH', np.nan)))
+    catalysts = None
+    if step_dims:
+        grids = np.meshgrid(*(coords[dim] for dim in step_dims), indexing='ij')
+        catalysts = {n: {name: np.full(n_catalysts, float(value)) for name, value in step.items()}
+                     for n, step in params.steps.items()}
+        for dim, grid in zip(step_dims, grids):
+            parameter, _, step = dim.rpartition('_')
+            catalysts[int(step)][parameter] = grid.ravel()
+
+    data = {name: np.full((n_global, n_catalysts, n_conditions), np.nan) for name in fields}
+    chunk_points = _chunk_points(params.model, fields, chunk_points)
+    catalyst_chunk = max(1, chunk_points // max(n_conditions, 1))
+    condition_chunk = max(1, min(n_conditions, chunk_points))
+    total = n_global * n_catalysts * n_conditions
+    done = 0
+    global_values = itertools.product(*(coords[dim] for dim in global_dims))
+    for g, values in enumerate(global_values):
+        point_params = params.replace(**dict(zip(global_dims, (float(value) for value in values))))
+        for c0 in range(0, n_catalysts, catalyst_chunk):
+            c1 = min(c0 + catalyst_chunk, n_catalysts)
+            for p0 in range(0, n_conditions, condition_chunk):
+                if cancel is not None and cancel.is_set():
+                    break
+                p1 = min(p0 + condition_chunk, n_conditions)
+                if catalysts is None:
+                    chunk_steps = None
+                else:
+                    chunk_steps = {n: {name: array[c0:c1] for name, array in step.items()}
+                                   for n, step in catalysts.items()}
+                values = _sweep_values(point_params, chunk_steps, eta[p0:p1], pH[p0:p1], fields, solver)
+                for name in fields:
+                    data[name][g, c0:c1, p0:p1] = values[name]
+                done += (c1 - c0) * (p1 - p0)
+                if progress:
+                    progress(done, total)
+
+    shape = [coords[dim].size for dim in order]
+    permutation = [order.index(dim) for dim in dims]
+    data = {name: array.reshape(shape).transpose(permutation) for name, array in data.items()}
+    return SweepResult(dims, coords, data)
+
+
+def scan_1d_frame(params, variable, values, fixed_value):
+    """一维扫描中 values 各点的结果表格（values 可以不等间距）"""
+    other = "pH" if variable == "η" else "η"
+    values = np.asarray(values, dtype=float)
+    extra = drc_fields(params.model) + list(SLOPE_FIELDS)
+    fields = sweep(params, {variable: values, other: fixed_value},
+                   fields=grid_fields(params.model) + extra, solver="closed_form").data
+    k = r = theta = fields
+    if np.isnan(theta['theta*']).any():
+        raise ValueError("计算θ时分母为零或溢出！请检查输入的动力学参数（k值是否全为零）。")
+
+    results = {
+        variable: values,
+        FIXED_LABEL[variable]: [fixed_value] * len(values),
+    }
+    results.update(one_d_columns(params.model, k, theta, r))
+    results.update((name, fields[name]) for name in drc_fields(params.model))
+    results.update((SLOPE_COLUMNS[name], fields[name]) for name in SLOPE_FIELDS)
+    results["Model"] = [params.model] * len(values)
+    results["Kinetics"] = [params.kinetics] * len(values)
+    results["Temperature (K)"] = [params.T] * len(values)
+    return pd.DataFrame(results)
+
+
+def scan_1d(params, variable, values, fixed_value, chunk=None, progress=None, cancel=None):
+    """一维扫描（variable 为 "η" 或 "pH"），返回与界面结果表格相同列的 DataFrame
+
+    给定 chunk 时按每 chunk 个点分批计算，每批后调用 progress(已完成点数, 总点数)；
+    cancel（threading.Event 等带 is_set() 的对象）置位后停止，只返回已完成的行。
+    """
+    values = np.asarray(values, dtype=float)
+    chunk = chunk or max(values.size, 1)
+    frames = []
+    for start in range(0, values.size, chunk):
+        if cancel is not None and cancel.is_set():
+            break
+        frames.append(scan_1d_frame(params, variable, values[start:start + chunk], fixed_value))
+        if progress:
+            progress(min(start + chunk, values.size), values.size)
+    if not frames:
+        return scan_1d_frame(params, variable, values[:0], fixed_value)
+    return pd.concat(frames, ignore_index=True)
+
+
+def scan_2d_fields(params, eta_values, ph_values):
+    """η × pH 网格上的全部字段 {字段名: (n_pH, n_η) 数组}，字段见 grid_fields"""
+    return sweep(params, {'pH': ph_values, 'η': eta_values}, fields=grid_fields(params.model)).data
+
+
+def map_values(params, eta, pH):
+    """任意 (η, pH) 点上二维图的 lg(r) 与 θ*，返回 (lgr, theta)"""
+    k = rate_constants(params, eta, pH)
+    theta, r = solve_steady_state(params.model, k, solver=GRID_SOLVER)
+    return log_rate(r[RATE_KEY[params.model]]), theta['theta*']
+
+
+def scan_2d(params, eta_values, ph_values, drc=False, slopes=False):
+    """η × pH 二维扫描，返回 {'eta', 'ph', 'lgr', 'theta'}；无法计算 θ 的点为 NaN
+
+    drc=True 时另含各步骤的速率控制度图（键名见 sensitivity.drc_fields），slopes=True 时
+    另含 Tafel 斜率与 pH 反应级数图（键名见 SLOPE_FIELDS）。
+    """
+    eta_grid, ph_grid = np.meshgrid(eta_values, ph_values)
+    extra = (drc_fields(params.model) if drc else []) + (list(SLOPE_FIELDS) if slopes else [])
+    result = sweep(params, {'pH': ph_values, 'η': eta_values}, fields=['lgr', 'theta*'] + extra)
+    lgr, theta = result['lgr'], result['theta*']
+    return {
+        'eta': eta_grid,
+        'ph': ph_grid,
+        'lgr': lgr,
+        'theta': theta,
+        **{name: result[name] for name in extra},
+    }
@@ -0,0 +1,240 @@
+"""动力学参数对实验极化曲线（LSV / Tafel 数据）的拟合
+
+实验数据为 η–j（可含多个 pH），模型量为 RATE_KEY 对应速率的 lg r。两者只差一个未知的
+比例因子（电子数、位点密度、电极面积），残差取
+
+    lg r(η, pH; p) + lg_scale - lg|j|
+
+p 为待拟合参数，命名同 sweep 的轴（deltaG_1、lambda_21、beta_3、ea0 ...）；lg_scale 一并拟合，
+也可以固定。每次迭代把 p 与 p ± h·e_i 共 2m+1 组参数交给 engine.sample_values，在全部数据点上
+一次批量计算残差与中心差分 Jacobian。scipy.optimize.least_squares（trf）处理参数边界，
+置信区间由协方差 s²·(JᵀJ)⁻¹ 与 t 分布给出（线性化近似，参数贴近边界时偏窄）。
+"""
+import numpy as np
+import pandas as pd
+from scipy.optimize import least_squares
+from scipy.stats import t as t_distribution
+
+from .params import CHEM_STEP
+from .engine import RATE_KEY, sweep_axis, apply_inputs, sample_values
+from .screening import read_catalyst_table
+
+FIT_STEP = 1e-5  # 中心差分 Jacobian 的步长（参数自身的单位）
+FIT_CONFIDENCE = 0.95
+SCALE_PARAMETER = 'lg_scale'
+# 各类参数的默认边界；T、delta_gw 一般固定，需要时可在 bounds 中给出
+FIT_BOUNDS = {
+    'deltaG': (-3.0, 3.0),
+    'gamma': (0.0, 1.0),
+    'beta': (0.0, 1.0),
+    'lambda': (0.05, 5.0),
+    'z': (0.1, 4.0),
+    'ea0': (0.0, 3.0),
+    'delta_gw': (0.0, 3.0),
+    'T': (200.0, 500.0),
+}
+# Softplus 公式中 γ 是平滑参数而不是 BEP 的传递系数（界面默认 1.3863），只要求为正
+SOFTPLUS_GAMMA_BOUNDS = (0.01, 10.0)
+DATA_COLUMNS = {
+    'η': ('η', 'eta', 'overpotential'),
+    'pH': ('pH', 'ph'),
+    'j': ('j', 'current', 'current density'),
+    'lgj': ('lgj', 'lg(j)', 'log_j', 'log10(j)'),
+}
+
+
+class FitCancelled(Exception):
+    """拟合中途被取消"""
+
+
+def _column(table, name):
+    for column in DATA_COLUMNS[name]:
+        if column in table.columns:
+            return table[column].to_numpy(dtype=float)
+    return None
+
+
+def polarization_data(table, pH=None):
+    """整理实验数据为 η、pH、lgj 三列
+
+    table 需要 η（或 eta）列，以及 j（电流密度）或 lgj（lg|j|）列；没有 pH 列时全部数据取 pH。
+    j = 0 等无法取对数的行被去掉。
+    """
+    eta = _column(table, 'η')
+    if eta is None:
+        raise ValueError("实验数据中没有 η（或 eta）列")
+    lgj = _column(table, 'lgj')
+    if lgj is None:
+        j = _column(table, 'j')
+        if j is None:
+            raise ValueError("实验数据中没有 j 或 lgj 列")
+        with np.errstate(divide='ignore'):
+            lgj = np.log10(np.abs(j))
+    ph = _column(table, 'pH')
+    if ph is None:
+        if pH is None:
+            raise ValueError("实验数据中没有 pH 列，需要给出固定的 pH")
+        ph = np.full(eta.size, float(pH))
+    data = pd.DataFrame({'η': eta, 'pH': ph, 'lgj': lgj})
+    return data[np.isfinite(data).all(axis=1)].reset_index(drop=True)
+
+
+def read_polarization_data(path, pH=None):
+    """读取 CSV / Parquet 实验数据，见 polarization_data"""
+    return polarization_data(read_catalyst_table(path), pH)
+
+
+def _softplus_gamma(params, name):
+    """name 是否为用 Softplus 公式的步骤的 γ"""
+    name, kind = sweep_axis(params, name)
+    if kind == 'global':
+        return False
+    parameter, _, step = name.rpartition('_')
+    method = params.chem_method if int(step) == CHEM_STEP else params.bv_method
+    return parameter == 'gamma' and method == "Softplus"
+
+
+def default_bounds(params, name):
+    """参数 name 的默认边界：按类别取 FIT_BOUNDS；所在步骤用 Softplus 公式时 γ 取 SOFTPLUS_GAMMA_BOUNDS"""
+    if _softplus_gamma(params, name):
+        return SOFTPLUS_GAMMA_BOUNDS
+    name, kind = sweep_axis(params, name)
+    return FIT_BOUNDS[name if kind == 'global' else name.rpartition('_')[0]]
+
+
+def parameter_bounds(params, names, bounds=None):
+    """names 各参数的 (下界, 上界)；bounds 中给出的值优先，其余见 default_bounds
+
+    bounds 中的区间须满足下界 < 上界（固定的参数不要放进 names），Softplus 的 γ 下界须为正。
+    """
+    bounds = bounds or {}
+    result = []
+    for name in names:
+        if name not in bounds:
+            result.append(default_bounds(params, name))
+            continue
+        low, high = (float(value) for value in bounds[name])
+        if not low < high:
+            raise ValueError(f"{name} 的边界 ({low:g}, {high:g}) 下界须小于上界")
+        if low <= 0 and _softplus_gamma(params, name):
+            raise ValueError(f"{name} 为 Softplus 的平滑参数，下界须为正")
+        result.append((low, high))
+    return result
+
+
+def _initial_values(params, names):
+    values = []
+    for name in names:
+        name, kind = sweep_axis(params, name)
+        if kind == 'global':
+            values.append(getattr(params, name))
+        else:
+            parameter, _, step = name.rpartition('_')
+            values.append(params.steps[int(step)][parameter])
+    return np.array(values, dtype=float)
+
+
+def fit_parameters(params, data, names, bounds=None, lg_scale=None, confidence=FIT_CONFIDENCE,
+                   max_evaluations=200, progress=None, cancel=None):
+    """以 params 为初值，对 data（polarization_data 的格式）拟合 names 中的参数
+
+    lg_scale 为 None 时一并拟合比例因子，否则固定为给定值。返回字典：params（拟合后的
+    SimulationParameters）、lg_scale、table（各参数的初值、拟合值、标准误差与置信区间）、
+    data（附 lgj_fit 列）、rmse、success、message、evaluations。progress(已用迭代数, 上限)
+    每次残差计算后回调；cancel 置位后抛出 FitCancelled。
+    """
+    names = [sweep_axis(params, name)[0] for name in names]
+    if not names:
+        raise ValueError("没有需要拟合的参数")
+    eta = data['η'].to_numpy(dtype=float)
+    pH = data['pH'].to_numpy(dtype=float)
+    lgj = data['lgj'].to_numpy(dtype=float)
+    fit_scale = lg_scale is None
+    m = len(names)
+    n_free = m + fit_scale
+    if eta.size <= n_free:
+        raise ValueError(f"数据点（{eta.size}）少于待拟合参数（{n_free}）")
+
+    p0 = _initial_values(params, names)
+    lower, upper = (np.array(values) for values in zip(*parameter_bounds(params, names, bounds)))
+    if np.any(p0 < lower) or np.any(p0 > upper):
+        outside = [name for name, value, low, high in zip(names, p0, lower, upper) if not low <= value <= high]
+        raise ValueError(f"初值超出边界: {', '.join(outside)}")
+    with np.errstate(invalid='ignore'):
+        scale0 = float(np.nanmedian(lgj - sample_values(params, {}, eta, pH)['lgr'][0])) if fit_scale else 0.0
+    if not np.isfinite(scale0):
+        scale0 = 0.0
+    x0 = np.append(p0, scale0) if fit_scale else p0
+    if fit_scale:
+        lower, upper = np.append(lower, -np.inf), np.append(upper, np.inf)
+
+    evaluations = [0]
+    cache = {}
+
+    def evaluate(x):
+        """x 处的 lg r 与中心差分 ∂lg r/∂p（一次批量计算）"""
+        key = x.tobytes()
+        if key not in cache:
+            if cancel is not None and cancel.is_set():
+                raise FitCancelled()
+            p = x[:m]
+            # p 与 p ± h·e_i，贴近边界时改为单侧差分
+            h = np.full(m, FIT_STEP)
+            plus = np.minimum(p + h, upper[:m])
+            minus = np.maximum(p - h, lower[:m])
+            sets = np.vstack([p, p + np.diag(plus - p), p + np.diag(minus - p)])
+            lgr = sample_values(params, dict(zip(names, sets.T)), eta, pH)['lgr']
+            jacobian = (lgr[1:m + 1] - lgr[m + 1:]) / (plus - minus)[:, None]
+            cache.clear()
+            cache[key] = (lgr[0], jacobian.T)
+            evaluations[0] += 1
+            if progress:
+                progress(evaluations[0], max_evaluations)
+        return cache[key]
+
+    def residuals(x):
+        lgr, _ = evaluate(x)
+        scale = x[m] if fit_scale else lg_scale
+        # 无法计算（θ 分母为零、r = 0）的点给一个大残差，把优化推离这些区域
+        return np.where(np.isfinite(lgr), lgr + scale - lgj, 1e3)
+
+    def jacobian(x):
+        lgr, J = evaluate(x)
+        J = np.where(np.isfinite(lgr)[:, None] & np.isfinite(J), J, 0.0)
+        return np.hstack([J, np.ones((lgr.size, 1))]) if fit_scale else J
+
+    solution = least_squares(residuals, x0, jac=jacobian, bounds=(lower, upper), x_scale='jac',
+                             max_nfev=max_evaluations)
+
+    # 线性化的协方差：s²·(JᵀJ)⁻¹，自由度 n - 参数数
+    dof = eta.size - n_free
+    s2 = 2 * solution.cost / dof
+    covariance = np.linalg.pinv(solution.jac.T @ solution.jac) * s2
+    stderr = np.sqrt(np.clip(np.diag(covariance), 0.0, None))
+    half_width = t_distribution.ppf(0.5 + confidence / 2, dof) * stderr
+    table_names = names + ([SCALE_PARAMETER] if fit_scale else [])
+    table = pd.DataFrame({
+        'parameter': table_names,
+        'initial': x0,
+        'value': solution.x,
+        'stderr': stderr,
+        'lower': solution.x - half_width,
+        'upper': solution.x + half_width,
+        'at bound': solution.active_mask != 0,
+    })
+
+    fitted = apply_inputs(params, dict(zip(names, solution.x[:m])))
+    scale = float(solution.x[m]) if fit_scale else float(lg_scale)
+    result_data = data.copy()
+    result_data['lgj_fit'] = evaluate(solution.x)[0] + scale
+    return {
+        'params': fitted,
+        'lg_scale': scale,
+        'table': table,
+        'data': result_data,
+        'rate': RATE_KEY[params.model],
+        'rmse': float(np.sqrt(np.mean(solution.fun ** 2))),
+        'success': bool(solution.success),
+        'message': solution.message,
+        'evaluations': evaluations[0],
+    }
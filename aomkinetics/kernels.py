@@ -0,0 +1,140 @@
+"""稳态覆盖度计算核
+
+本文件由 aomkinetics.codegen 根据 mechanism.MODEL_GRAPH 自动生成，请勿手工修改；
+修改机理后运行 python -m aomkinetics.codegen 重新生成并核对。
+"""
+import numpy as np
+
+
+def er_aom_theta_kernel(k):
+    """ER-AOM 稳态覆盖度（生成代码：20 次乘法、15 次加法，展开式为 32 次乘法）"""
+    k1 = k['k1']
+    km1 = k['k-1']
+    k2 = k['k2']
+    km2 = k['k-2']
+    k3 = k['k3']
+    km3 = k['k-3']
+    k4 = k['k4']
+    km4 = k['k-4']
+    t0 = km3 + k4
+    t1 = km2*t0 + k3*k4
+    t2 = km1*t1 + k2*k3*k4
+    t3 = km4 + k1
+    t4 = km3*t3 + k1*k4
+    t5 = km2*t4 + k1*k3*k4
+    t6 = km1 + k2
+    t7 = km4*t6 + k1*k2
+    t8 = km3*t7 + k1*k2*k4
+    t9 = km2 + k3
+    t10 = km1*t9 + k2*k3
+    t11 = km4*t10 + k1*k2*k3
+    denominator = t2 + t5 + t8 + t11
+    with np.errstate(invalid='ignore'):
+        valid = np.isfinite(denominator) & (denominator > 1e-30)
+    denominator = np.where(valid, denominator, np.nan)
+    return {
+        'theta*': t2 / denominator,
+        'theta*OH': t5 / denominator,
+        'theta*O': t8 / denominator,
+        'theta*OOH': t11 / denominator,
+    }
+
+
+def lh_aom_theta_kernel(k):
+    """LH-AOM 稳态覆盖度（生成代码：83 次乘法、53 次加法，展开式为 384 次乘法）"""
+    k1 = k['k1']
+    km1 = k['k-1']
+    k4 = k['k4']
+    km4 = k['k-4']
+    k5 = k['k5']
+    km5 = k['k-5']
+    k21 = k['k21']
+    km21 = k['k-21']
+    k22 = k['k22']
+    km22 = k['k-22']
+    k31 = k['k31']
+    km31 = k['k-31']
+    k32 = k['k32']
+    km32 = k['k-32']
+    t0 = km31 + km32 + k4
+    t1 = km31 + km32
+    t2 = km4*t1
+    t3 = k5*t0 + t2
+    t4 = km4 + k5
+    t5 = km31*t4 + k4*k5
+    t6 = k32*t5
+    t7 = km22*t3 + t6
+    t8 = km32*t4 + k4*k5
+    t9 = km22*t8 + k32*k4*k5
+    t10 = k31*t9
+    t11 = km21*t7 + t10
+    t12 = km22 + k32
+    t13 = k21*t12 + k22*k32
+    t14 = k31*t13 + k22*k32*km21
+    t15 = k5*t14
+    t16 = k4*t15
+    t17 = km1*t11 + t16
+    t18 = km22*t1 + k32*km31
+    t19 = km21*t18 + k31*km22*km32
+    t20 = km5*t19
+    t21 = km4*t20
+    t22 = k1*t11 + t21
+    t23 = km1 + k21 + k22
+    t24 = km1 + k21
+    t25 = km22*t24
+    t26 = k32*t23 + t25
+    t27 = k1*t13
+    t28 = km5*t26 + t27
+    t29 = k5*t13
+    t30 = k1*t29
+    t31 = km4*t28 + t30
+    t32 = km5 + k1
+    t33 = km4*t32 + k1*k5
+    t34 = km32*t33 + k1*k4*k5
+    t35 = km22*t34 + k1*k32*k4*k5
+    t36 = k21*t35
+    t37 = km31*t31 + t36
+    t38 = km1 + k22
+    t39 = km21*t38
+    t40 = k31*t23 + t39
+    t41 = km21 + k31
+    t42 = k22*t41 + k21*k31
+    t43 = k1*t42
+    t44 = km5*t40 + t43
+    t45 = k5*t42
+    t46 = k1*t45
+    t47 = km4*t44 + t46
+    t48 = km31*t33 + k1*k4*k5
+    t49 = km21*t48 + k1*k31*k4*k5
+    t50 = k22*t49
+    t51 = km32*t47 + t50
+    t52 = km1*t12 + k22*k32
+    t53 = km21*t52
+    t54 = k31*t26 + t53
+    t55 = k1*t14
+    t56 = km5*t54 + t55
+    t57 = k1*t15
+    t58 = km4*t56 + t57
+    t59 = km31 + k4
+    t60 = k32*t59
+    t61 = km22*t0 + t60
+    t62 = km32 + k4
+    t63 = km22*t62 + k32*k4
+    t64 = k31*t63
+    t65 = km21*t61 + t64
+    t66 = k4*t14
+    t67 = km1*t65 + t66
+    t68 = k1*t66
+    t69 = km5*t67 + t68
+    denominator = t17 + t22 + t37 + t51 + t58 + t69
+    with np.errstate(invalid='ignore'):
+        valid = np.isfinite(denominator) & (denominator != 0)
+    denominator = np.where(valid, denominator, np.nan)
+    return {
+        'theta*': t17 / denominator,
+        'theta*OH': t22 / denominator,
+        'theta*(OH)2': t37 / denominator,
+        'theta*O': t51 / denominator,
+        'theta*O(OH)': t58 / denominator,
+        'theta*O(O)': t69 / denominator,
+    }
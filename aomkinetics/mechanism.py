@@ -0,0 +1,161 @@
+"""ER-AOM / LH-AOM 机理：速率常数组合、稳态覆盖度与反应速率（数组版本）
+
+k 字典沿用 AOMKineticsGUI 的键名（'k1a'、'k-1a'、'k1'、'k-1' ...），
+字典中的值可以是标量或任意形状的数组，所有运算逐点广播。
+"""
+import numpy as np
+
+from .kernels import er_aom_theta_kernel, lh_aom_theta_kernel
+
+ER_AOM_STEPS = (1, 2, 3, 4)
+LH_AOM_STEPS = (1, 21, 22, 31, 32, 4)  # 电化学步骤；步骤5为化学步骤
+MODEL_STEPS = {"ER-AOM": ER_AOM_STEPS, "LH-AOM": LH_AOM_STEPS}
+
+ER_AOM_THETA = ('theta*', 'theta*OH', 'theta*O', 'theta*OOH')
+LH_AOM_THETA = ('theta*', 'theta*OH', 'theta*(OH)2', 'theta*O', 'theta*O(OH)', 'theta*O(O)')
+MODEL_THETA = {"ER-AOM": ER_AOM_THETA, "LH-AOM": LH_AOM_THETA}
+
+# 机理图：(步骤号, 反应物种, 产物种)，正向速率常数 k{步骤号}，逆向 k-{步骤号}
+ER_AOM_GRAPH = (
+    (1, 'theta*', 'theta*OH'),
+    (2, 'theta*OH', 'theta*O'),
+    (3, 'theta*O', 'theta*OOH'),
+    (4, 'theta*OOH', 'theta*'),
+)
+LH_AOM_GRAPH = (
+    (1, 'theta*', 'theta*OH'),
+    (21, 'theta*OH', 'theta*(OH)2'),
+    (22, 'theta*OH', 'theta*O'),
+    (31, 'theta*(OH)2', 'theta*O(OH)'),
+    (32, 'theta*O', 'theta*O(OH)'),
+    (4, 'theta*O(OH)', 'theta*O(O)'),
+    (5, 'theta*O(O)', 'theta*'),
+)
+MODEL_GRAPH = {"ER-AOM": ER_AOM_GRAPH, "LH-AOM": LH_AOM_GRAPH}
+
+
+def stack_step_parameters(steps, step_nums, names, ndim=1):
+    """把 {步骤号: {参数名: 值}} 堆叠为形状 (n_steps, 1, ..., 1) 的数组
+
+    返回的数组与 ndim 维的 η/pH 网格广播后得到 (n_steps, *grid) 的结果。
+    """
+    shape = (len(step_nums),) + (1,) * ndim
+    return [np.array([float(steps[n][name]) for n in step_nums]).reshape(shape)
+            for name in names]
+
+
+def unstack_rate_constants(step_nums, ka, k_minus_a, kb, k_minus_b):
+    """把 (n_steps, ...) 的速率常数数组拆回 {'k1a': ..., 'k-1a': ...} 字典"""
+    k = {}
+    for i, n in enumerate(step_nums):
+        k[f'k{n}a'] = ka[i]
+        k[f'k-{n}a'] = k_minus_a[i]
+        k[f'k{n}b'] = kb[i]
+        k[f'k-{n}b'] = k_minus_b[i]
+    return k
+
+
+def combine_rate_constants(k, step_nums, pH):
+    """组合酸性(a)与碱性(b)通道：k_i = k_ia + k_ib·10^-(14-pH)，k_-i = k_-ia·10^-pH + k_-ib"""
+    for n in step_nums:
+        k[f'k{n}'] = k[f'k{n}a'] + k[f'k{n}b'] * 10.0 ** -(14 - pH)
+        k[f'k-{n}'] = k[f'k-{n}a'] * 10.0 ** -pH + k[f'k-{n}b']
+    return k
+
+
+def er_aom_theta(k):
+    """ER-AOM 稳态覆盖度；分母无效（过小或溢出）的点返回 NaN
+
+    展开公式保留作为 kernels 中生成代码的对照。
+    """
+    term1 = k['k-1']*k['k-2']*k['k-3'] + k['k-1']*k['k-2']*k['k4'] + k['k-1']*k['k3']*k['k4'] + k['k2']*k['k3']*k['k4']
+    term2 = k['k1']*k['k-2']*k['k-3'] + k['k1']*k['k-2']*k['k4'] + k['k1']*k['k3']*k['k4'] + k['k-2']*k['k-3']*k['k-4']
+    term3 = k['k1']*k['k2']*k['k-3'] + k['k1']*k['k2']*k['k4'] + k['k-1']*k['k-3']*k['k-4'] + k['k2']*k['k-3']*k['k-4']
+    term4 = k['k1']*k['k2']*k['k3'] + k['k-1']*k['k-2']*k['k-4'] + k['k-1']*k['k3']*k['k-4'] + k['k2']*k['k3']*k['k-4']
+
+    denominator = term1 + term2 + term3 + term4
+    with np.errstate(invalid='ignore'):
+        valid = np.isfinite(denominator) & (denominator > 1e-30)  # 避免浮点精度问题
+    denominator = np.where(valid, denominator, np.nan)
+
+    return {
+        'theta*': term1 / denominator,
+        'theta*OH': term2 / denominator,
+        'theta*O': term3 / denominator,
+        'theta*OOH': term4 / denominator
+    }
+
+
+def lh_aom_theta(k):
+    """LH-AOM 稳态覆盖度；分母为零或溢出的点返回 NaN"""
+    term1 = k['k-1']*k['k-21']*k['k-22']*k['k-31']*k['k-4'] + k['k-1']*k['k-21']*k['k-22']*k['k-31']*k['k5'] + k['k-1']*k['k-21']*k['k-22']*k['k-32']*k['k-4'] + k['k-1']*k['k-21']*k['k-22']*k['k-32']*k['k5'] + k['k-1']*k['k-21']*k['k-22']*k['k4']*k['k5'] + k['k-1']*k['k-21']*k['k-31']*k['k32']*k['k-4'] + k['k-1']*k['k-21']*k['k-31']*k['k32']*k['k5'] + k['k-1']*k['k-21']*k['k32']*k['k4']*k['k5'] + k['k-1']*k['k-22']*k['k31']*k['k-32']*k['k-4'] + k['k-1']*k['k-22']*k['k31']*k['k-32']*k['k5'] + k['k-1']*k['k-22']*k['k31']*k['k4']*k['k5'] + k['k-1']*k['k31']*k['k32']*k['k4']*k['k5'] + k['k21']*k['k-22']*k['k31']*k['k4']*k['k5'] + k['k21']*k['k31']*k['k32']*k['k4']*k['k5'] + k['k-21']*k['k22']*k['k32']*k['k4']*k['k5'] + k['k22']*k['k31']*k['k32']*k['k4']*k['k5']
+    term2 = k['k1']*k['k-21']*k['k-22']*k['k-31']*k['k-4'] + k['k1']*k['k-21']*k['k-22']*k['k-31']*k['k5'] + k['k1']*k['k-21']*k['k-22']*k['k-32']*k['k-4'] + k['k1']*k['k-21']*k['k-22']*k['k-32']*k['k5'] + k['k1']*k['k-21']*k['k-22']*k['k4']*k['k5'] + k['k1']*k['k-21']*k['k-31']*k['k32']*k['k-4'] + k['k1']*k['k-21']*k['k-31']*k['k32']*k['k5'] + k['k1']*k['k-21']*k['k32']*k['k4']*k['k5'] + k['k1']*k['k-22']*k['k31']*k['k-32']*k['k-4'] + k['k1']*k['k-22']*k['k31']*k['k-32']*k['k5'] + k['k1']*k['k-22']*k['k31']*k['k4']*k['k5'] + k['k1']*k['k31']*k['k32']*k['k4']*k['k5'] + k['k-21']*k['k-22']*k['k-31']*k['k-4']*k['k-5'] + k['k-21']*k['k-22']*k['k-32']*k['k-4']*k['k-5'] + k['k-21']*k['k-31']*k['k32']*k['k-4']*k['k-5'] + k['k-22']*k['k31']*k['k-32']*k['k-4']*k['k-5']
+    term3 = k['k1']*k['k21']*k['k-22']*k['k-31']*k['k-4'] + k['k1']*k['k21']*k['k-22']*k['k-31']*k['k5'] + k['k1']*k['k21']*k['k-22']*k['k-32']*k['k-4'] + k['k1']*k['k21']*k['k-22']*k['k-32']*k['k5'] + k['k1']*k['k21']*k['k-22']*k['k4']*k['k5'] + k['k1']*k['k21']*k['k-31']*k['k32']*k['k-4'] + k['k1']*k['k21']*k['k-31']*k['k32']*k['k5'] + k['k1']*k['k21']*k['k32']*k['k4']*k['k5'] + k['k1']*k['k22']*k['k-31']*k['k32']*k['k-4'] + k['k1']*k['k22']*k['k-31']*k['k32']*k['k5'] + k['k-1']*k['k-22']*k['k-31']*k['k-4']*k['k-5'] + k['k-1']*k['k-31']*k['k32']*k['k-4']*k['k-5'] + k['k21']*k['k-22']*k['k-31']*k['k-4']*k['k-5'] + k['k21']*k['k-22']*k['k-32']*k['k-4']*k['k-5'] + k['k21']*k['k-31']*k['k32']*k['k-4']*k['k-5'] + k['k22']*k['k-31']*k['k32']*k['k-4']*k['k-5']
+    term4 = k['k1']*k['k21']*k['k31']*k['k-32']*k['k-4'] + k['k1']*k['k21']*k['k31']*k['k-32']*k['k5'] + k['k1']*k['k-21']*k['k22']*k['k-31']*k['k-4'] + k['k1']*k['k-21']*k['k22']*k['k-31']*k['k5'] + k['k1']*k['k-21']*k['k22']*k['k-32']*k['k-4'] + k['k1']*k['k-21']*k['k22']*k['k-32']*k['k5'] + k['k1']*k['k-21']*k['k22']*k['k4']*k['k5'] + k['k1']*k['k22']*k['k31']*k['k-32']*k['k-4'] + k['k1']*k['k22']*k['k31']*k['k-32']*k['k5'] + k['k1']*k['k22']*k['k31']*k['k4']*k['k5'] + k['k-1']*k['k-21']*k['k-32']*k['k-4']*k['k-5'] + k['k-1']*k['k31']*k['k-32']*k['k-4']*k['k-5'] + k['k21']*k['k31']*k['k-32']*k['k-4']*k['k-5'] + k['k-21']*k['k22']*k['k-31']*k['k-4']*k['k-5'] + k['k-21']*k['k22']*k['k-32']*k['k-4']*k['k-5'] + k['k22']*k['k31']*k['k-32']*k['k-4']*k['k-5']
+    term5 = k['k1']*k['k21']*k['k-22']*k['k31']*k['k-4'] + k['k1']*k['k21']*k['k-22']*k['k31']*k['k5'] + k['k1']*k['k21']*k['k31']*k['k32']*k['k-4'] + k['k1']*k['k21']*k['k31']*k['k32']*k['k5'] + k['k1']*k['k-21']*k['k22']*k['k32']*k['k-4'] + k['k1']*k['k-21']*k['k22']*k['k32']*k['k5'] + k['k1']*k['k22']*k['k31']*k['k32']*k['k-4'] + k['k1']*k['k22']*k['k31']*k['k32']*k['k5'] + k['k-1']*k['k-21']*k['k-22']*k['k-4']*k['k-5'] + k['k-1']*k['k-21']*k['k32']*k['k-4']*k['k-5'] + k['k-1']*k['k-22']*k['k31']*k['k-4']*k['k-5'] + k['k-1']*k['k31']*k['k32']*k['k-4']*k['k-5'] + k['k21']*k['k-22']*k['k31']*k['k-4']*k['k-5'] + k['k21']*k['k31']*k['k32']*k['k-4']*k['k-5'] + k['k-21']*k['k22']*k['k32']*k['k-4']*k['k-5'] + k['k22']*k['k31']*k['k32']*k['k-4']*k['k-5']
+    term6 = k['k1']*k['k21']*k['k-22']*k['k31']*k['k4'] + k['k1']*k['k21']*k['k31']*k['k32']*k['k4'] + k['k1']*k['k-21']*k['k22']*k['k32']*k['k4'] + k['k1']*k['k22']*k['k31']*k['k32']*k['k4'] + k['k-1']*k['k-21']*k['k-22']*k['k-31']*k['k-5'] + k['k-1']*k['k-21']*k['k-22']*k['k-32']*k['k-5'] + k['k-1']*k['k-21']*k['k-22']*k['k4']*k['k-5'] + k['k-1']*k['k-21']*k['k-31']*k['k32']*k['k-5'] + k['k-1']*k['k-21']*k['k32']*k['k4']*k['k-5'] + k['k-1']*k['k-22']*k['k31']*k['k-32']*k['k-5'] + k['k-1']*k['k-22']*k['k31']*k['k4']*k['k-5'] + k['k-1']*k['k31']*k['k32']*k['k4']*k['k-5'] + k['k21']*k['k-22']*k['k31']*k['k4']*k['k-5'] + k['k21']*k['k31']*k['k32']*k['k4']*k['k-5'] + k['k-21']*k['k22']*k['k32']*k['k4']*k['k-5'] + k['k22']*k['k31']*k['k32']*k['k4']*k['k-5']
+
+    denominator = term1 + term2 + term3 + term4 + term5 + term6
+    with np.errstate(invalid='ignore'):
+        valid = np.isfinite(denominator) & (denominator != 0)
+    denominator = np.where(valid, denominator, np.nan)
+
+    return {
+        'theta*': term1 / denominator,
+        'theta*OH': term2 / denominator,
+        'theta*(OH)2': term3 / denominator,
+        'theta*O': term4 / denominator,
+        'theta*O(OH)': term5 / denominator,
+        'theta*O(O)': term6 / denominator
+    }
+
+
+def er_aom_rates(k, theta):
+    """ER-AOM 各步净速率"""
+    return {
+        'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
+        'r2': k['k2'] * theta['theta*OH'] - k['k-2'] * theta['theta*O'],
+        'r3': k['k3'] * theta['theta*O'] - k['k-3'] * theta['theta*OOH'],
+        'r4': k['k4'] * theta['theta*OOH'] - k['k-4'] * theta['theta*']
+    }
+
+
+def lh_aom_rates(k, theta):
+    """LH-AOM 各步净速率（r2、r3 为并联支路之和）"""
+    r = {
+        'r1': k['k1'] * theta['theta*'] - k['k-1'] * theta['theta*OH'],
+        'r21': k['k21'] * theta['theta*OH'] - k['k-21'] * theta['theta*(OH)2'],
+        'r22': k['k22'] * theta['theta*OH'] - k['k-22'] * theta['theta*O'],
+        'r31': k['k31'] * theta['theta*(OH)2'] - k['k-31'] * theta['theta*O(OH)'],
+        'r32': k['k32'] * theta['theta*O'] - k['k-32'] * theta['theta*O(OH)'],
+        'r4': k['k4'] * theta['theta*O(OH)'] - k['k-4'] * theta['theta*O(O)'],
+        'r5': k['k5'] * theta['theta*O(O)'] - k['k-5'] * theta['theta*']
+    }
+    r['r2'] = r['r21'] + r['r22']
+    r['r3'] = r['r31'] + r['r32']
+    return r
+
+
+def solve_steady_state(model, k, solver="closed_form"):
+    """返回 (theta, r)；k 必须已包含组合后的 k_i / k_-i
+
+    solver="closed_form" 使用 codegen 生成的 King-Altman 计算核（与上面的展开公式相同，
+    经因式分解和公共子表达式消除），"gth" / "solve" 使用 coverage.coverage_theta 的
+    批量线性求解（大网格上更快）。
+    """
+    if solver != "closed_form":
+        from .coverage import coverage_theta
+        theta = coverage_theta(model, k, method=solver)
+    elif model == "ER-AOM":
+        theta = er_aom_theta_kernel(k)
+    else:
+        theta = lh_aom_theta_kernel(k)
+    if model == "ER-AOM":
+        return theta, er_aom_rates(k, theta)
+    return theta, lh_aom_rates(k, theta)
+
+
+def log_rate(r):
+    """lg|r|，r = 0 时为 -inf"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log10(np.abs(r))
@@ -0,0 +1,268 @@
+"""二维 η-pH 扫描的多进程并行
+
+pH 行按 chunk_rows 分块提交给 ProcessPoolExecutor，各进程直接把结果写入共享内存中的
+(n_fields, n_pH, n_η) 数组（lg r、θ* 与可选的速率控制度、Tafel 斜率），主进程不需要再收集和拼接。进程池在多次扫描之间复用，
+避免每次扫描都重新启动解释器。run_row_chunks 也供 store 模块的磁盘扫描使用。
+parallel_sample_values 以同样的方式把 engine.sample_values 的输入组分块并行计算。
+"""
+import atexit
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .engine import SLOPE_FIELDS, scan_2d, rate_constants, sample_values
+from .sensitivity import drc_fields
+from .mg import TABLE_CACHE, set_table_directory
+
+RESULT_FIELDS = ('lgr', 'theta')
+CHUNKS_PER_WORKER = 4  # 默认分块数为进程数的倍数，用于负载均衡
+MIN_CHUNKS = 16
+CANCEL_POLL = 0.1  # 等待子进程时检查取消标志的间隔，秒
+
+_executor = None
+_executor_key = None
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def _init_worker(table_directory):
+    set_table_directory(table_directory)
+
+
+def get_executor(max_workers):
+    """返回（必要时新建）max_workers 个进程的进程池；子进程与主进程共用 MG 插值表的磁盘目录"""
+    global _executor, _executor_key
+    key = (max_workers, TABLE_CACHE.directory)
+    if _executor is None or _executor_key != key:
+        shutdown_executor()
+        _executor = ProcessPoolExecutor(max_workers, initializer=_init_worker,
+                                        initargs=(TABLE_CACHE.directory,))
+        _executor_key = key
+    return _executor
+
+
+def shutdown_executor():
+    global _executor, _executor_key
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+    _executor = None
+    _executor_key = None
+
+
+atexit.register(shutdown_executor)
+
+
+def row_chunks(n_rows, chunk_rows=None, max_workers=1):
+    """[(start, stop), ...]；chunk_rows 为空时分成约 CHUNKS_PER_WORKER × max_workers 块（至少 MIN_CHUNKS 块）"""
+    if not chunk_rows:
+        n_chunks = max(CHUNKS_PER_WORKER * max_workers, MIN_CHUNKS)
+        chunk_rows = max(1, math.ceil(n_rows / n_chunks))
+    return [(start, min(start + chunk_rows, n_rows)) for start in range(0, n_rows, chunk_rows)]
+
+
+def _cancelled(cancel):
+    return cancel is not None and cancel.is_set()
+
+
+def run_row_chunks(task, args, chunks, max_workers=1, on_done=None, cancel=None):
+    """对每个 (start, stop) 执行 task(*args, start, stop)，返回已完成的块列表
+
+    max_workers 为 1 时在本进程依次执行（task 可以是闭包），否则提交到进程池
+    （task 与 args 须可序列化）。每块完成后在本进程回调 on_done(start, stop)；
+    cancel 置位后不再开始新块，已提交但未开始的块被撤销。
+    """
+    finished = []
+    if max_workers == 1:
+        for start, stop in chunks:
+            if _cancelled(cancel):
+                break
+            task(*args, start, stop)
+            finished.append((start, stop))
+            if on_done:
+                on_done(start, stop)
+        return finished
+
+    executor = get_executor(max_workers)
+    futures = [executor.submit(task, *args, start, stop) for start, stop in chunks]
+    try:
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=CANCEL_POLL, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.cancelled():
+                    continue
+                start, stop = future.result()
+                finished.append((start, stop))
+                if on_done:
+                    on_done(start, stop)
+            if _cancelled(cancel):
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+    return finished
+
+
+def result_fields(model, drc=False, slopes=False):
+    """scan_2d 结果中逐点计算的字段"""
+    return RESULT_FIELDS + (tuple(drc_fields(model)) if drc else ()) + (SLOPE_FIELDS if slopes else ())
+
+
+def _scan_rows(params, eta_values, ph_values, drc, slopes, shm_name, shape, start, stop):
+    """子进程：计算 pH 行 [start, stop) 并写入共享内存"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        result = scan_2d(params, eta_values, ph_values[start:stop], drc=drc, slopes=slopes)
+        for i, field in enumerate(result_fields(params.model, drc, slopes)):
+            out[i, start:stop] = result[field]
+        del out
+    finally:
+        shm.close()
+    return start, stop
+
+
+def prepare_tables(params, eta_values, ph_values):
+    """预先建立覆盖整个网格的 MG 插值表
+
+    驱动力对 η、pH 是线性的，极值出现在网格四角，因此在四角上算一次速率常数即可。
+    设置了插值表磁盘目录时，子进程直接载入这些表而不必各自重建。
+    """
+    if params.mg_method == "table":
+        corners = np.meshgrid([np.min(eta_values), np.max(eta_values)],
+                              [np.min(ph_values), np.max(ph_values)])
+        rate_constants(params, *corners)
+
+
+def parallel_scan_2d(params, eta_values, ph_values, max_workers=None, chunk_rows=None,
+                     progress=None, cancel=None, drc=False, slopes=False):
+    """多进程版 scan_2d，返回值相同，另含 'rows_done'（每个 pH 行是否已算完）
+
+    max_workers 默认为 CPU 核数；chunk_rows 为每个任务的 pH 行数，默认见 row_chunks。
+    只有一个进程时在本进程逐块计算。progress(已完成点数, 总点数) 在主进程中随各块完成回调；
+    cancel 置位后不再提交新块，尚未算完的行保持 NaN。
+    """
+    eta_values = np.asarray(eta_values, dtype=float)
+    ph_values = np.asarray(ph_values, dtype=float)
+    n_rows = ph_values.size
+    max_workers = max_workers or default_workers()
+    chunks = row_chunks(n_rows, chunk_rows, max_workers)
+    fields = result_fields(params.model, drc, slopes)
+    shape = (len(fields), n_rows, eta_values.size)
+    rows_done = np.zeros(n_rows, dtype=bool)
+
+    def on_done(start, stop):
+        rows_done[start:stop] = True
+        if progress:
+            progress(int(rows_done.sum()) * eta_values.size, n_rows * eta_values.size)
+
+    if max_workers == 1 or len(chunks) <= 1:
+        out = np.full(shape, np.nan)
+
+        def scan_rows(start, stop):
+            result = scan_2d(params, eta_values, ph_values[start:stop], drc=drc, slopes=slopes)
+            for i, field in enumerate(fields):
+                out[i, start:stop] = result[field]
+
+        run_row_chunks(scan_rows, (), chunks, 1, on_done, cancel)
+        return _assemble(eta_values, ph_values, fields, out, rows_done)
+
+    prepare_tables(params, eta_values, ph_values)
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+    try:
+        out = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        out[:] = np.nan
+        run_row_chunks(_scan_rows, (params, eta_values, ph_values, drc, slopes, shm.name, shape), chunks,
+                       max_workers, on_done, cancel)
+        # 取消时仍在运行的块可能只写了一部分，按未完成处理
+        out[:, ~rows_done] = np.nan
+        result = _assemble(eta_values, ph_values, fields, out.copy(), rows_done)
+        del out
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+
+def _assemble(eta_values, ph_values, fields, out, rows_done):
+    eta_grid, ph_grid = np.meshgrid(eta_values, ph_values)
+    result = {'eta': eta_grid, 'ph': ph_grid}
+    for i, field in enumerate(fields):
+        result[field] = out[i]
+    result['rows_done'] = rows_done
+    return result
+
+
+def _sample_rows(params, names, eta, pH, fields, inputs_name, inputs_shape, shm_name, shape, start, stop):
+    """子进程：计算输入组 [start, stop) 并写入共享内存；输入同样从共享内存读取，避免逐块序列化"""
+    inputs_shm = shared_memory.SharedMemory(name=inputs_name)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        inputs = np.ndarray(inputs_shape, dtype=float, buffer=inputs_shm.buf)
+        out = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        values = sample_values(params, dict(zip(names, inputs[:, start:stop])), eta, pH, fields=fields)
+        for i, field in enumerate(fields):
+            out[i, start:stop] = values[field]
+        del inputs, out
+    finally:
+        inputs_shm.close()
+        shm.close()
+    return start, stop
+
+
+def parallel_sample_values(params, samples, eta, pH, fields=('lgr',), max_workers=None, chunk_rows=None,
+                           progress=None, cancel=None):
+    """多进程版 sample_values，返回值相同
+
+    输入组按 chunk_rows 分块（默认见 row_chunks），progress(已完成组数, 总组数) 随各块完成回调；
+    cancel 置位后不再提交新块，未完成的组为 NaN。
+    """
+    names = list(samples)
+    inputs = np.array([np.asarray(samples[name], dtype=float).ravel() for name in names]).reshape(len(names), -1)
+    eta, pH = np.broadcast_arrays(np.atleast_1d(np.asarray(eta, dtype=float)),
+                                  np.atleast_1d(np.asarray(pH, dtype=float)))
+    n_samples = inputs.shape[1] if names else 1
+    max_workers = max_workers or default_workers()
+    chunks = row_chunks(n_samples, chunk_rows, max_workers)
+    shape = (len(fields), n_samples, eta.size)
+    rows_done = np.zeros(n_samples, dtype=bool)
+
+    def on_done(start, stop):
+        rows_done[start:stop] = True
+        if progress:
+            progress(int(rows_done.sum()), n_samples)
+
+    if max_workers == 1 or len(chunks) <= 1:
+        data = {name: np.full((n_samples, eta.size), np.nan) for name in fields}
+
+        def sample_rows(start, stop):
+            values = sample_values(params, dict(zip(names, inputs[:, start:stop])), eta, pH, fields=fields)
+            for name in fields:
+                data[name][start:stop] = values[name]
+
+        run_row_chunks(sample_rows, (), chunks, 1, on_done, cancel)
+        return data
+
+    inputs_shm = shared_memory.SharedMemory(create=True, size=max(inputs.nbytes, 1))
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * 8, 1))
+    try:
+        shared_inputs = np.ndarray(inputs.shape, dtype=float, buffer=inputs_shm.buf)
+        shared_inputs[:] = inputs
+        out = np.ndarray(shape, dtype=float, buffer=shm.buf)
+        out[:] = np.nan
+        run_row_chunks(_sample_rows, (params, names, eta, pH, tuple(fields), inputs_shm.name, inputs.shape,
+                                      shm.name, shape), chunks, max_workers, on_done, cancel)
+        # 取消时仍在运行的块可能只写了一部分，按未完成处理
+        out[:, ~rows_done] = np.nan
+        data = {name: out[i].copy() for i, name in enumerate(fields)}
+        del shared_inputs, out
+    finally:
+        for block in (inputs_shm, shm):
+            block.close()
+            block.unlink()
+    return data
@@ -0,0 +1,127 @@
+"""模拟参数对象
+
+界面在计算开始时把所有输入一次性读入 SimulationParameters，此后的扫描只依赖
+这个不可变对象，不再访问任何 Tk 变量，因此也可以在没有显示器的计算节点上运行。
+"""
+from collections import namedtuple
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from .constants import DELTA_GW
+from .mechanism import MODEL_STEPS
+
+BV_KINETICS = "Butler-Volmer kinetics"
+MARCUS_KINETICS = "Marcus kinetics"
+# MG 动力学选项对应的积分方式
+MG_KINETICS = {
+    "Marcus-Gerischer kinetics": "table",
+    "Marcus-Gerischer (fast approximation)": "approximation",
+}
+KINETICS = (BV_KINETICS, MARCUS_KINETICS, *MG_KINETICS)
+MODELS = tuple(MODEL_STEPS)
+METHODS = ("BEP", "Softplus")
+CHEM_STEP = 5  # LH-AOM 的化学步骤
+
+
+def step_parameter_names(kinetics):
+    """电化学步骤在给定动力学下需要的参数名"""
+    if kinetics == BV_KINETICS:
+        return ('deltaG', 'gamma', 'beta', 'z')
+    return ('deltaG', 'lambda', 'z')
+
+
+def required_steps(model):
+    """模型需要的全部步骤号（LH-AOM 含化学步骤5）"""
+    if model == "LH-AOM":
+        return MODEL_STEPS[model] + (CHEM_STEP,)
+    return MODEL_STEPS[model]
+
+
+class SimulationParameters(namedtuple('SimulationParameters', [
+        'model', 'kinetics', 'T', 'delta_gw', 'ea0', 'bv_method', 'chem_method', 'steps'])):
+    """一次计算的全部输入
+
+    steps 为只读映射 {步骤号: {参数名: 值}}；ea0 仅 BV 动力学和 LH-AOM 化学步骤使用，
+    其余情况为 None。请用 simulation_parameters() 构造，它会校验并冻结输入。
+    """
+    __slots__ = ()
+
+    @property
+    def mg_method(self):
+        """MG 积分方式，非 MG 动力学为 None"""
+        return MG_KINETICS.get(self.kinetics)
+
+    def __reduce__(self):
+        # MappingProxyType 不能序列化：按普通字典传给子进程，再经 simulation_parameters 冻结
+        fields = self._asdict()
+        fields['steps'] = {n: dict(step) for n, step in self.steps.items()}
+        return (_restore_parameters, (fields,))
+
+    def replace(self, **changes):
+        """返回修改部分字段后的新参数对象"""
+        fields = self._asdict()
+        fields.update(changes)
+        return simulation_parameters(**fields)
+
+
+def _restore_parameters(fields):
+    return simulation_parameters(**fields)
+
+
+def simulation_parameters(model, kinetics, T, steps, delta_gw=DELTA_GW, ea0=None,
+                          bv_method="BEP", chem_method="BEP"):
+    """校验输入并构造不可变的 SimulationParameters
+
+    steps 可以是 {步骤号: {参数名: 值}}，也可以是按步骤顺序排列的列表（ER-AOM 界面的写法）。
+    """
+    if model not in MODEL_STEPS:
+        raise ValueError(f"未知模型: {model}")
+    if kinetics not in KINETICS:
+        raise ValueError(f"未知动力学类型: {kinetics}")
+    if bv_method not in METHODS or chem_method not in METHODS:
+        raise ValueError(f"计算方法必须为 {' / '.join(METHODS)}")
+    if not isinstance(steps, Mapping):
+        steps = dict(enumerate(steps, start=1))
+
+    frozen = {}
+    for step_num in required_steps(model):
+        if step_num not in steps:
+            raise ValueError(f"缺少步骤 {step_num} 的参数")
+        if step_num == CHEM_STEP:
+            names = ('deltaG', 'gamma')
+        else:
+            names = step_parameter_names(kinetics)
+        step = steps[step_num]
+        values = {name: float(value) for name, value in step.items() if name != 'step'}
+        for name in names:
+            if name not in values:
+                raise ValueError(f"步骤 {step_num} 缺少参数 {name}")
+        frozen[step_num] = MappingProxyType(values)
+
+    needs_ea0 = kinetics == BV_KINETICS or model == "LH-AOM"
+    if needs_ea0 and ea0 is None:
+        raise ValueError("缺少 Ea,0")
+    return SimulationParameters(
+        model=model,
+        kinetics=kinetics,
+        T=float(T),
+        delta_gw=float(delta_gw),
+        ea0=float(ea0) if needs_ea0 else None,
+        bv_method=bv_method,
+        chem_method=chem_method,
+        steps=MappingProxyType(frozen),
+    )
+
+
+def parameters_to_dict(params):
+    """转换为可写入 JSON 的普通字典（步骤号转为字符串）"""
+    fields = params._asdict()
+    fields['steps'] = {str(n): dict(step) for n, step in params.steps.items()}
+    return fields
+
+
+def parameters_from_dict(fields):
+    """parameters_to_dict 的逆变换，同时做完整校验"""
+    fields = dict(fields)
+    fields['steps'] = {int(n): step for n, step in fields['steps'].items()}
+    return simulation_parameters(**fields)
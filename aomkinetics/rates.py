@@ -0,0 +1,88 @@
+"""向量化的速率常数计算
+
+所有函数都按 NumPy 广播规则工作：η、pH 可以是标量、一维数组或 meshgrid，
+步骤参数（ΔG、γ、β、z ...）也可以是数组（例如 ``(n_steps, 1)``），
+一次调用即可得到全部点、全部步骤的速率常数。
+"""
+import numpy as np
+
+from .constants import R, F, h, kB, DELTA_GW
+
+LN10 = np.log(10)
+
+
+def prefactor(T):
+    """指前因子 kB·T/h"""
+    return kB * T / h
+
+
+def potential_term(T, eta, pH):
+    """η - (RT/F)·ln10·pH"""
+    return eta - (R * T / F) * LN10 * pH
+
+
+def softplus_barrier(gamma, x):
+    """Softplus 活化能 (1/γ)·ln(1 + exp(γ·x))"""
+    return np.logaddexp(0.0, gamma * x) / gamma
+
+
+def bv_rate_constants(deltaG, gamma, beta, z, ea0, T, eta, pH,
+                      method="BEP", delta_gw=DELTA_GW):
+    """Butler-Volmer 动力学，返回 (ka, k-a, kb, k-b)
+
+    method 为 "BEP" 或 "Softplus"，与界面上的 B-V 方法选项对应。
+    """
+    A = prefactor(T)
+    kT = kB * T
+    U = (F / (R * T)) * potential_term(T, eta, pH)
+    forward = np.exp(beta * U)
+    backward = np.exp(-(1 - beta) * U)
+
+    if method == "BEP":
+        deltaG_b = deltaG - z * delta_gw
+        ka = A * np.exp(-(ea0 + gamma * deltaG) / kT) * forward
+        k_minus_a = A * np.exp(-(ea0 - gamma * deltaG) / kT) * backward
+        kb = A * np.exp(-(ea0 + gamma * deltaG_b) / kT) * forward
+        k_minus_b = A * np.exp(-(ea0 - gamma * deltaG_b) / kT) * backward
+    else:
+        # Softplus公式；a 通道正逆反应共用同一活化能
+        shift = z * (R * T / F) * LN10 * (-14)
+        term_a = A * np.exp(-softplus_barrier(gamma, deltaG) / kT)
+        ka = term_a * forward
+        k_minus_a = term_a * backward
+        kb = A * np.exp(-softplus_barrier(gamma, deltaG + shift) / kT) * forward
+        k_minus_b = A * np.exp(-softplus_barrier(gamma, -deltaG - shift) / kT) * backward
+
+    return ka, k_minus_a, kb, k_minus_b
+
+
+def chem_rate_constants(deltaG, gamma, ea0, T, method="BEP"):
+    """化学步骤（LH-AOM 步骤5），返回 (k5, k-5)"""
+    A = prefactor(T)
+    kT = kB * T
+    if method == "BEP":
+        k_forward = A * np.exp(-(ea0 + gamma * deltaG) / kT)
+        k_backward = A * np.exp(-(ea0 - gamma * deltaG) / kT)
+    else:
+        k_forward = A * np.exp(-softplus_barrier(gamma, deltaG) / kT)
+        k_backward = A * np.exp(-softplus_barrier(gamma, -deltaG) / kT)
+    return k_forward, k_backward
+
+
+def marcus_rate_constants(deltaG, lam, z, T, eta, pH, delta_gw=DELTA_GW):
+    """Marcus 动力学，返回 (ka, k-a, kb, k-b)
+
+    η、pH 为长度 n_points 的一维数组、ΔG、λ、z 按 (n_steps, 1) 堆叠时，
+    每个返回值都是 (n_steps, n_points) 数组。
+    """
+    A = prefactor(T)
+    denominator = 4 * lam * kB * T
+    U = potential_term(T, eta, pH)
+    x_a = deltaG - z * U
+    x_b = deltaG - z * (U + delta_gw)
+
+    ka = A * np.exp(-(x_a + lam) ** 2 / denominator)
+    k_minus_a = A * np.exp(-(-x_a + lam) ** 2 / denominator)
+    kb = A * np.exp(-(x_b + lam) ** 2 / denominator)
+    k_minus_b = A * np.exp(-(-x_b + lam) ** 2 / denominator)
+    return ka, k_minus_a, kb, k_minus_b
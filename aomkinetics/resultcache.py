@@ -0,0 +1,164 @@
+"""按内容寻址的扫描结果磁盘缓存
+
+缓存键是全部计算输入（SimulationParameters 与扫描设置）规范化为 JSON 后的 SHA-256，
+数组按内容摘要参与哈希；键中另含 CACHE_VERSION 与引擎可输出的字段（result_schema），
+新增结果字段后旧格式的缓存不再命中。一维结果（DataFrame）与二维结果（数组字典，自适应扫描另含四叉树）
+都存为一个未压缩的 .npz 文件，不含 pickle。目录总大小超过 max_bytes 时按最近使用时间
+（命中时更新文件修改时间）淘汰最旧的结果。
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .adaptive import QuadtreeMap
+from .params import parameters_to_dict
+from .engine import SLOPE_COLUMNS, sweep_fields
+
+CACHE_VERSION = 2  # 结果的组织方式（列、数组名）变化而字段表不变时递增
+RESULT_CACHE_BYTES = 512 * 2 ** 20
+TREE_FIELDS = ('eta_axis', 'ph_axis', 'keys', 'lgr', 'theta', 'cells')
+
+
+def _canonical(value):
+    """转为可稳定序列化的 JSON 值；数组以 dtype、形状与内容摘要表示"""
+    if isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+        return {'array': hashlib.sha256(value.tobytes()).hexdigest(),
+                'dtype': value.dtype.str, 'shape': list(value.shape)}
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def result_schema(model):
+    """model 的结果中可能出现的字段与列名（速率控制度、Tafel 斜率等）"""
+    return {'fields': sweep_fields(model), 'columns': list(SLOPE_COLUMNS.values())}
+
+
+def result_key(params, scan):
+    """params 与扫描设置 scan（字典，值可为数组）的缓存键"""
+    payload = {'version': CACHE_VERSION, 'schema': result_schema(params.model),
+               'params': parameters_to_dict(params), 'scan': _canonical(scan)}
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _pack(result, report):
+    arrays = {'report': np.array('' if report is None else report)}
+    if isinstance(result, pd.DataFrame):
+        arrays['kind'] = np.array('1d')
+        arrays['columns'] = np.array(list(result.columns))
+        for i, name in enumerate(result.columns):
+            values = result[name].to_numpy()
+            # 文本列（Model、Kinetics）存为定长 Unicode 数组，读取时不需要 pickle
+            arrays[f'column_{i}'] = values.astype(str) if values.dtype == object else values
+        return arrays
+    arrays['kind'] = np.array('2d')
+    for name, value in result.items():
+        if name == 'tree':
+            for field in TREE_FIELDS:
+                arrays[f'tree_{field}'] = getattr(value, field)
+            arrays['tree_levels'] = np.array(value.levels)
+        else:
+            arrays[name] = np.asarray(value)
+    return arrays
+
+
+def _unpack(data):
+    report = str(data['report']) or None
+    if str(data['kind']) == '1d':
+        columns = [str(name) for name in data['columns']]
+        return pd.DataFrame({name: data[f'column_{i}'] for i, name in enumerate(columns)}), report
+    result = {name: data[name] for name in data.files
+              if name not in ('kind', 'report') and not name.startswith('tree_')}
+    if 'tree_keys' in data.files:
+        result['tree'] = QuadtreeMap(*(data[f'tree_{field}'] for field in TREE_FIELDS),
+                                     int(data['tree_levels']))
+    return result, report
+
+
+class ResultCache:
+    """directory 下的结果缓存；hits、misses 为本会话的命中统计"""
+
+    def __init__(self, directory, max_bytes=RESULT_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _entries(self):
+        """[(修改时间, 字节数, 路径), ...]，最旧的在前"""
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.npz') and not name.endswith('.tmp.npz'):
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def get(self, key):
+        """返回 (结果, 精度报告)；未命中返回 None"""
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                cached = _unpack(data)
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        os.utime(path)  # 标记为最近使用
+        self.hits += 1
+        return cached
+
+    def put(self, key, result, report=None):
+        """写入结果，然后按 max_bytes 淘汰最久未使用的结果"""
+        os.makedirs(self.directory, exist_ok=True)
+        # 临时文件名唯一，多个界面共用目录时同时写同一个键也不会互相覆盖
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp.npz", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **_pack(result, report))
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.evict()
+
+    def evict(self, max_bytes=None):
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        self.evict(0)
+
+    def stats(self):
+        entries = self._entries()
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(entries),
+                'bytes': sum(size for _, size, _ in entries)}
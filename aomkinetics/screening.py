@@ -0,0 +1,151 @@
+"""催化剂高通量筛选
+
+参数表（CSV / Parquet）的每一行是一个催化剂，列名为 "{参数名}_{步骤号}"（如 deltaG_1、
+lambda_21、deltaG_5、gamma_5）；表中没有的参数取自基准 SimulationParameters，其余列
+（名称、编号等）原样保留在结果中。全部催化剂沿新增的催化剂轴一次向量化计算，
+η、pH 可以是单个条件，也可以是等长的一组条件（扫描）。
+
+结果为每个 (催化剂, 条件) 一行：lg(r)、各覆盖度和限速步骤，在每个条件内按 lg(r) 从高到低排名。
+限速步骤取正向单向速率 k_i·θ_反应物 最小的步骤；LH-AOM 的并联支路（21/22、31/32）按
+两条支路之和比较，报告为 "2"、"3"。
+
+MG 动力学使用插值表时，λ 的每个不同取值需要单独建表；λ 逐行不同的表格宜使用
+"Marcus-Gerischer (fast approximation)"。
+"""
+import numpy as np
+import pandas as pd
+
+from .mechanism import MODEL_THETA, MODEL_GRAPH, solve_steady_state, log_rate
+from .params import CHEM_STEP, step_parameter_names, required_steps
+from .engine import RATE_KEY, GRID_SOLVER, catalyst_rate_constants
+
+SCREEN_CHUNK_POINTS = 2 ** 18  # 每批计算的 (催化剂 × 条件) 点数
+LIMITING_STAGES = {
+    "ER-AOM": {'1': (1,), '2': (2,), '3': (3,), '4': (4,)},
+    "LH-AOM": {'1': (1,), '2': (21, 22), '3': (31, 32), '4': (4,), '5': (5,)},
+}
+CHEM_PARAMETERS = ('deltaG', 'gamma')
+
+
+def step_column(name, step):
+    """参数表的列名"""
+    return f"{name}_{step}"
+
+
+def _step_names(params, step):
+    return CHEM_PARAMETERS if step == CHEM_STEP else step_parameter_names(params.kinetics)
+
+
+def parameter_columns(params):
+    """params 的模型与动力学对应的全部参数列名"""
+    return [step_column(name, step) for step in required_steps(params.model) for name in _step_names(params, step)]
+
+
+def read_catalyst_table(path):
+    """读取 CSV 或 Parquet 参数表（Parquet 需要 pyarrow 或 fastparquet）"""
+    if path.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def catalyst_steps(params, table):
+    """{步骤号: {参数名: (n_catalysts,) 数组}}；表中缺少的参数取 params 中的值"""
+    columns = parameter_columns(params)
+    if not any(column in table.columns for column in columns):
+        raise ValueError(f"参数表中没有可识别的参数列（应为 {', '.join(columns[:4])} ... 这样的列名）")
+    n = len(table)
+    steps = {}
+    for step in required_steps(params.model):
+        values = {}
+        for name in _step_names(params, step):
+            column = step_column(name, step)
+            if column in table.columns:
+                values[name] = table[column].to_numpy(dtype=float)
+            else:
+                values[name] = np.full(n, float(params.steps[step][name]))
+        steps[step] = values
+    return steps
+
+
+def limiting_step(model, k, theta):
+    """正向单向速率最小的步骤（LIMITING_STAGES 的键），无法计算的点为空字符串"""
+    forward = {}
+    for step, source, _ in MODEL_GRAPH[model]:
+        forward[step] = k[f'k{step}'] * theta[source]
+    stages = list(LIMITING_STAGES[model])
+    flux = np.stack([sum(forward[step] for step in LIMITING_STAGES[model][stage]) for stage in stages])
+    valid = np.isfinite(flux).all(axis=0)
+    labels = np.array(stages)[np.argmin(np.where(np.isfinite(flux), flux, np.inf), axis=0)]
+    return np.where(valid, labels, "")
+
+
+def _screen_chunk(params, steps, eta, pH):
+    k = catalyst_rate_constants(params, steps, eta, pH)
+    theta, r = solve_steady_state(params.model, k, solver=GRID_SOLVER)
+    return log_rate(r[RATE_KEY[params.model]]), theta, limiting_step(params.model, k, theta)
+
+
+def evaluate_catalysts(params, steps, eta, pH, progress=None, cancel=None):
+    """按催化剂分批计算，返回 (lgr, theta, limiting, 已完成催化剂数)
+
+    steps 同 catalyst_steps 的返回值；返回的数组形状为 (n_catalysts, n_conditions)，theta 为
+    {覆盖度名: 数组}。cancel 置位后停止，未完成的催化剂为 NaN / 空字符串。
+    """
+    eta, pH = np.broadcast_arrays(np.atleast_1d(np.asarray(eta, dtype=float)),
+                                  np.atleast_1d(np.asarray(pH, dtype=float)))
+    n_catalysts = next(iter(steps.values()))[CHEM_PARAMETERS[0]].size
+    n_conditions = eta.size
+    chunk = max(1, SCREEN_CHUNK_POINTS // n_conditions)
+
+    lgr = np.full((n_catalysts, n_conditions), np.nan)
+    theta = {name: np.full((n_catalysts, n_conditions), np.nan) for name in MODEL_THETA[params.model]}
+    limiting = np.full((n_catalysts, n_conditions), "", dtype=object)
+    done = 0
+    for start in range(0, n_catalysts, chunk):
+        if cancel is not None and cancel.is_set():
+            break
+        stop = min(start + chunk, n_catalysts)
+        chunk_steps = {n: {name: values[start:stop] for name, values in step.items()} for n, step in steps.items()}
+        chunk_lgr, chunk_theta, chunk_limiting = _screen_chunk(params, chunk_steps, eta, pH)
+        lgr[start:stop] = chunk_lgr
+        for name in theta:
+            theta[name][start:stop] = chunk_theta[name]
+        limiting[start:stop] = chunk_limiting
+        done = stop
+        if progress:
+            progress(done, n_catalysts)
+    return lgr, theta, limiting, done
+
+
+def screen_catalysts(params, table, eta, pH, progress=None, cancel=None):
+    """按 params（模型、动力学、T、Ea0 与缺省参数）计算 table 中全部催化剂，返回排名后的 DataFrame
+
+    η、pH 为标量或可广播为同一长度的一维数组。progress(已完成催化剂数, 总数) 每批后回调；
+    cancel 置位后停止，只返回已完成的催化剂。
+    """
+    eta, pH = np.broadcast_arrays(np.atleast_1d(np.asarray(eta, dtype=float)),
+                                  np.atleast_1d(np.asarray(pH, dtype=float)))
+    n_conditions = eta.size
+    theta_names = MODEL_THETA[params.model]
+    lgr, theta, limiting, done = evaluate_catalysts(params, catalyst_steps(params, table), eta, pH,
+                                                    progress, cancel)
+
+    # 每个 (催化剂, 条件) 一行，非参数列作为催化剂标识保留
+    identifiers = table.drop(columns=[c for c in parameter_columns(params) if c in table.columns])
+    rows = np.repeat(np.arange(done), n_conditions)
+    result = identifiers.iloc[rows].reset_index(drop=True)
+    result.insert(0, 'catalyst', rows)
+    result['η'] = np.tile(eta, done)
+    result['pH'] = np.tile(pH, done)
+    result[f'lg({RATE_KEY[params.model]})'] = lgr[:done].ravel()
+    for name in theta_names:
+        result[name] = theta[name][:done].ravel()
+    result['limiting step'] = limiting[:done].ravel()
+
+    condition = np.tile(np.arange(n_conditions), done)
+    result['rank'] = (pd.Series(result[f'lg({RATE_KEY[params.model]})'])
+                      .groupby(condition).rank(ascending=False, method='min', na_option='bottom')
+                      .astype(int))
+    result['_condition'] = condition
+    result = result.sort_values(['_condition', 'rank'], kind='stable').drop(columns='_condition')
+    return result.reset_index(drop=True)
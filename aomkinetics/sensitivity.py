@@ -0,0 +1,68 @@
+"""速率控制度（Campbell degree of rate control）与速率对输入的导数
+
+X_i = ∂ln r/∂ln k_i，求导时保持平衡常数 K_i = k_i/k_-i 不变，即 k_i 与 k_-i 同乘一个因子。
+全部步骤的 ±h 扰动沿新增的首轴堆叠，只需一次稳态求解（中心差分，截断误差 O(h²)）。
+X_i 只依赖组合后的速率常数，因此也可以由结果目录中保存的 k 直接计算。
+
+log_rate_derivatives 沿给定方向（各 ln k 对某个输入的导数）求 ∂ln r/∂s：把 k 换成
+k·(1 + i·h·∂ln k/∂s) 后做一次复数 GTH 消元（coverage.complex_step_theta），虚部即导数。
+没有相减，h 可以取得极小，结果与解析导数一致到机器精度。
+"""
+import numpy as np
+
+from .mechanism import MODEL_GRAPH, solve_steady_state
+from .params import required_steps
+from .coverage import complex_step_theta
+
+DRC_STEP = 1e-3  # ln k 的扰动步长
+COMPLEX_STEP = 1e-20  # 复步长微分的虚部步长
+
+
+def drc_fields(model):
+    """各步骤速率控制度的字段名（LH-AOM 含化学步骤5）"""
+    return [f'DRC{step}' for step in required_steps(model)]
+
+
+def degree_of_rate_control(model, k, rate, solver="closed_form", step=DRC_STEP):
+    """k（组合后的速率常数）下 r[rate] 对各步骤的速率控制度，返回 {字段名: 数组}"""
+    steps = required_steps(model)
+    names = [f'k{sign}{n}' for n in steps for sign in ('', '-')]
+    shape = np.broadcast_shapes(*(np.shape(k[name]) for name in names))
+    n_perturbations = 2 * len(steps)
+    # 第 2i、2i+1 组把步骤 i 的 k_i、k_-i 同乘 e^{+h}、e^{-h}
+    factors = np.ones((len(steps), n_perturbations))
+    for i in range(len(steps)):
+        factors[i, 2 * i] = np.exp(step)
+        factors[i, 2 * i + 1] = np.exp(-step)
+    factors = factors.reshape((len(steps), n_perturbations) + (1,) * len(shape))
+
+    perturbed = {}
+    for i, n in enumerate(steps):
+        for sign in ('', '-'):
+            perturbed[f'k{sign}{n}'] = np.asarray(k[f'k{sign}{n}'], dtype=float) * factors[i]
+    _, r = solve_steady_state(model, perturbed, solver=solver)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ln_r = np.log(np.abs(r[rate]))
+        return {field: (ln_r[2 * i] - ln_r[2 * i + 1]) / (2 * step)
+                for i, field in enumerate(drc_fields(model))}
+
+
+def log_rate_derivatives(model, k, directions, rate, step=COMPLEX_STEP):
+    """∂ln|r[rate]|/∂s，形状 (len(directions), *网格)
+
+    directions 为一组 {k 名: ∂ln k/∂s}（组合后的 k1、k-1 ...，缺少的 k 视为不变）；
+    rate 为单个步骤的净速率（如 'r4'、'r5'）。无法计算 θ 的点为 NaN。
+    """
+    graph = MODEL_GRAPH[model]
+    names = [f'k{sign}{n}' for n, _, _ in graph for sign in ('', '-')]
+    shape = np.broadcast_shapes(*(np.shape(k[name]) for name in names),
+                                *(np.shape(value) for direction in directions for value in direction.values()))
+    perturbed = {}
+    for name in names:
+        slope = np.stack([np.broadcast_to(direction.get(name, 0.0), shape) for direction in directions])
+        perturbed[name] = np.asarray(k[name], dtype=float) * (1 + 1j * step * slope)
+    theta = complex_step_theta(model, perturbed)
+    n, source, product = next(edge for edge in graph if f'r{edge[0]}' == rate)
+    r = perturbed[f'k{n}'] * theta[source] - perturbed[f'k-{n}'] * theta[product]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return r.imag / (step * r.real)
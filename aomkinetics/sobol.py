@@ -0,0 +1,208 @@
+"""基于方差的全局灵敏度分析（Sobol 指数）
+
+输出为 RATE_KEY 对应速率的 lg r，输入为全部步骤参数（列名形式，如 deltaG_1、lambda_21、gamma_5）
+与 Ea0、ΔGw、T，各自在给定区间内均匀分布。一阶指数 S1 = V[E(Y|X_i)]/V(Y)，总指数
+ST = E[V(Y|X_~i)]/V(Y)；两者之差为 X_i 参与的交互作用。
+
+Saltelli 抽样：由 2d 维 Sobol 序列得到矩阵 A、B（N × d），AB_i 为把 A 的第 i 列换成 B 的第 i 列，
+共 N·(d+2) 次模型计算。估计量取 Saltelli (2010) 的 S1 与 Jansen (1999) 的 ST，置信区间由
+逐样本项的均值标准误给出。同一样本的 d+2 组输入相邻排列，交给 parallel_sample_values 分块
+并行计算（每块内沿催化剂轴向量化），取消后只用已完成的样本估计。lg r 无法计算（r ≤ 0、θ 分母
+为零）的样本在该条件下整组去掉。
+
+MG 插值表按 (λ, T) 的每个不同取值单独建表，λ 或 T 连续抽样时每组输入都要建一张表（并写入
+磁盘缓存），因此这种情况下自动改用 "Marcus-Gerischer (fast approximation)"（见 sobol_parameters），
+实际使用的动力学记录在结果中。
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm, qmc
+
+from .params import MG_KINETICS
+from .engine import RATE_KEY, sweep_axis, apply_inputs
+from .fitting import parameter_bounds
+from .parallel import parallel_sample_values
+from .screening import parameter_columns
+
+SOBOL_SAMPLES = 512  # Saltelli 的基本样本数 N，取 2 的幂时 Sobol 序列最均匀
+SOBOL_CONFIDENCE = 0.95
+# λ、T 参与抽样时代替 MG 插值表的动力学
+MG_SAMPLED_KINETICS = next(name for name, method in MG_KINETICS.items() if method == "approximation")
+# default_ranges 中各类输入的半宽（以 params 中的值为中心）
+SOBOL_WIDTHS = {
+    'deltaG': 0.2,
+    'gamma': 0.1,
+    'beta': 0.1,
+    'lambda': 0.2,
+    'z': 0.1,
+    'ea0': 0.1,
+    'delta_gw': 0.05,
+    'T': 10.0,
+}
+
+
+def sobol_inputs(params):
+    """参与分析的全部输入：步骤参数、Ea0（BV 动力学或 LH-AOM）、ΔGw 与 T"""
+    names = parameter_columns(params)
+    if params.ea0 is not None:
+        names.append('ea0')
+    return names + ['delta_gw', 'T']
+
+
+def _center(params, name):
+    name, kind = sweep_axis(params, name)
+    if kind == 'global':
+        return getattr(params, name)
+    parameter, _, step = name.rpartition('_')
+    return params.steps[int(step)][parameter]
+
+
+def default_ranges(params, widths=SOBOL_WIDTHS):
+    """{输入名: (下限, 上限)}：以 params 中的值为中心、按类别取 widths 中的半宽
+
+    区间截断到 fitting.default_bounds（随 BEP / Softplus 而定）；中心本身不在边界内时不截断，
+    保证区间包含 params 中的值且下限小于上限。
+    """
+    names = sobol_inputs(params)
+    ranges = {}
+    for name, (low, high) in zip(names, parameter_bounds(params, names)):
+        width = widths[name if name in widths else name.rpartition('_')[0]]
+        center = _center(params, name)
+        if low <= center <= high:
+            ranges[name] = (max(center - width, low), min(center + width, high))
+        else:
+            ranges[name] = (center - width, center + width)
+    return ranges
+
+
+def format_ranges(ranges):
+    """区间 → 每行 "输入名: 下限 上限" 的文本"""
+    return "\n".join(f"{name}: {low:g} {high:g}" for name, (low, high) in ranges.items())
+
+
+def parse_ranges(text):
+    """解析 format_ranges 格式的文本；忽略空行与 # 之后的注释"""
+    ranges = {}
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        name, _, spec = line.partition(':')
+        try:
+            low, high = (float(value) for value in spec.split())
+        except ValueError:
+            raise ValueError(f"无法解析区间 \"{line}\"（格式为 输入名: 下限 上限）") from None
+        if low > high:
+            raise ValueError(f"{name.strip()} 的下限大于上限")
+        ranges[name.strip()] = (low, high)
+    return ranges
+
+
+def sobol_parameters(params, ranges):
+    """实际计算用的参数：MG 插值表下 λ 或 T 的区间不为单点时改用闭式近似，其余情况原样返回"""
+    if params.mg_method != "table":
+        return params
+    for name, (low, high) in ranges.items():
+        name = sweep_axis(params, name)[0]
+        if high > low and (name == 'T' or name.rpartition('_')[0] == 'lambda'):
+            return params.replace(kinetics=MG_SAMPLED_KINETICS)
+    return params
+
+
+def saltelli_samples(ranges, n_samples=SOBOL_SAMPLES, seed=0):
+    """(n_samples, d+2, d) 的输入：[:, 0] 为 A，[:, 1] 为 B，[:, 2+i] 为 AB_i"""
+    low, high = (np.array(values, dtype=float) for values in zip(*ranges.values()))
+    d = low.size
+    sampler = qmc.Sobol(2 * d, scramble=True, seed=seed)
+    with warnings.catch_warnings():
+        # N 不是 2 的幂时 scipy 提示序列的平衡性变差，结果仍然可用
+        warnings.simplefilter('ignore', UserWarning)
+        unit = sampler.random(n_samples)
+    A = low + unit[:, :d] * (high - low)
+    B = low + unit[:, d:] * (high - low)
+    X = np.repeat(A[:, None, :], d + 2, axis=1)
+    X[:, 1] = B
+    X[:, 2 + np.arange(d), np.arange(d)] = B
+    return X
+
+
+def _mean(values, weights, count):
+    return (values * weights).sum(axis=0) / count
+
+
+def sobol_indices(params, eta, pH, ranges=None, n_samples=SOBOL_SAMPLES, seed=0, confidence=SOBOL_CONFIDENCE,
+                  max_workers=1, progress=None, cancel=None):
+    """η、pH 各条件下 lg r 的一阶与总 Sobol 指数
+
+    η、pH 为标量或可广播为同一长度的一维数组（选定的若干点，或一维扫描）；ranges 为
+    {输入名: (下限, 上限)}，默认 default_ranges(params)；下限等于上限的输入固定为该值、不参与
+    分析，下限大于上限时抛出 ValueError。返回字典：inputs、ranges、η、pH、
+    S1、S1_conf、ST、ST_conf（形状 (n_inputs, n_conditions)，conf 为置信区间半宽）、variance、
+    samples（每个条件实际使用的样本数）、evaluations、rate 与 kinetics（实际使用的动力学，
+    见 sobol_parameters）。progress(已完成组数, 总组数)
+    每块后回调；cancel 置位后停止，指数由已完成的样本估计。
+    """
+    ranges = dict(default_ranges(params) if ranges is None else ranges)
+    names = [sweep_axis(params, name)[0] for name in ranges]
+    ranges = dict(zip(names, (tuple(float(value) for value in bounds) for bounds in ranges.values())))
+    reversed_ranges = [name for name, (low, high) in ranges.items() if low > high]
+    if reversed_ranges:
+        raise ValueError(f"下限大于上限: {', '.join(reversed_ranges)}")
+    params = sobol_parameters(params, ranges)
+    params = apply_inputs(params, {name: low for name, (low, high) in ranges.items() if low == high})
+    ranges = {name: bounds for name, bounds in ranges.items() if bounds[0] < bounds[1]}
+    names = list(ranges)
+    if not names:
+        raise ValueError("没有参与分析的输入")
+    eta, pH = np.broadcast_arrays(np.atleast_1d(np.asarray(eta, dtype=float)),
+                                  np.atleast_1d(np.asarray(pH, dtype=float)))
+    d = len(names)
+    X = saltelli_samples(ranges, n_samples, seed)
+    samples = {name: X[:, :, i].ravel() for i, name in enumerate(names)}
+    lgr = parallel_sample_values(params, samples, eta, pH, max_workers=max_workers, progress=progress,
+                                 cancel=cancel)['lgr']
+    f = lgr.reshape(n_samples, d + 2, eta.size)
+
+    # 每个条件只用 d+2 组输入全部可算的样本
+    valid = np.isfinite(f).all(axis=1)
+    weights = valid.astype(float)
+    count = valid.sum(axis=0)
+    f = np.where(valid[:, None, :], f, 0.0)
+    f_A, f_B, f_AB = f[:, 0], f[:, 1], f[:, 2:]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = _mean(f_A + f_B, weights, 2 * count)
+        variance = (((f_A - mean) ** 2 + (f_B - mean) ** 2) * weights).sum(axis=0) / (2 * count - 1)
+        # 逐样本项，(n_samples, d, n_conditions)；f_B 减去均值以降低估计方差
+        first = (f_B - mean)[:, None] * (f_AB - f_A[:, None])
+        total = 0.5 * (f_A[:, None] - f_AB) ** 2
+        z = norm.ppf(0.5 + confidence / 2)
+        result = {'inputs': names, 'ranges': ranges, 'η': eta, 'pH': pH}
+        for key, terms in (('S1', first), ('ST', total)):
+            w = weights[:, None]
+            term_mean = _mean(terms, w, count)
+            term_var = _mean((terms - term_mean) ** 2, w, count)
+            result[key] = term_mean / variance
+            result[f'{key}_conf'] = z * np.sqrt(term_var / count) / variance
+    result.update(variance=variance, samples=count, evaluations=n_samples * (d + 2), rate=RATE_KEY[params.model],
+                  kinetics=params.kinetics)
+    return result
+
+
+def sobol_table(result):
+    """sobol_indices 的结果展开为每个 (条件, 输入) 一行的长表"""
+    names = result['inputs']
+    n_conditions = result['η'].size
+    return pd.DataFrame({
+        'η': np.tile(result['η'], len(names)),
+        'pH': np.tile(result['pH'], len(names)),
+        'input': np.repeat(names, n_conditions),
+        'S1': result['S1'].ravel(),
+        'S1 conf': result['S1_conf'].ravel(),
+        'ST': result['ST'].ravel(),
+        'ST conf': result['ST_conf'].ravel(),
+        f"var lg({result['rate']})": np.tile(result['variance'], len(names)),
+        'samples': np.tile(result['samples'], len(names)),
+        'Kinetics': result['kinetics'],
+    })
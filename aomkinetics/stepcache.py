@@ -0,0 +1,75 @@
+"""按步骤缓存的速率常数
+
+每个电化学步骤的 (k_a, k_-a, k_b, k_-b) 只取决于该步骤自身的参数、动力学类型与方法、
+T、ΔG_w（BV 另含 Ea0）以及 η/pH 网格。以这些为键缓存各步骤的数组后，只修改一个步骤的
+参数再计算时，其余步骤直接复用，只重新计算改动的步骤以及其后的组合、覆盖度与速率。
+"""
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from .params import BV_KINETICS, step_parameter_names
+
+STEP_CACHE_BYTES = 256 * 2 ** 20  # 内存上限，超出后按最近最少使用淘汰
+
+
+def grid_key(eta, pH):
+    """η/pH 网格的内容摘要"""
+    digest = hashlib.blake2b(digest_size=16)
+    for values in (eta, pH):
+        values = np.ascontiguousarray(values, dtype=float)
+        digest.update(repr(values.shape).encode())
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def step_key(params, step, grid):
+    """步骤 step 的速率常数缓存键"""
+    step_values = tuple(float(params.steps[step][name]) for name in step_parameter_names(params.kinetics))
+    if params.kinetics == BV_KINETICS:
+        method = (params.bv_method, params.ea0)
+    else:
+        method = (params.mg_method,)
+    return (params.kinetics, method, params.T, params.delta_gw, step, step_values, grid)
+
+
+class StepRateCache:
+    """按 step_key 索引的速率常数数组缓存（LRU，按字节数限制），缓存的数组为只读"""
+
+    def __init__(self, max_bytes=STEP_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, compute):
+        """返回缓存的数组元组；未命中时调用 compute() 计算并缓存"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = tuple(np.asarray(values) for values in compute())
+        size = sum(values.nbytes for values in entry)
+        if size <= self.max_bytes:
+            for values in entry:
+                values.flags.writeable = False
+            self._entries[key] = entry
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= sum(values.nbytes for values in evicted)
+        return entry
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self.nbytes}
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+
+STEP_CACHE = StepRateCache()
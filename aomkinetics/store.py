@@ -0,0 +1,207 @@
+"""二维扫描结果的磁盘存储（内存映射 .npy）
+
+一个结果目录包含 meta.json（参数、η/pH 轴、字段列表）、每个字段一个 (n_pH, n_η) 的
+.npy 文件，以及记录已完成 pH 行的 rows_done.npy。所有数组都以 numpy.memmap 打开，
+扫描按行块写入后即落盘，内存占用与网格大小无关；重新打开已完成的图只读取元数据，
+数据按需从磁盘分页载入。中断的扫描再次运行时只计算未完成的行。
+"""
+import json
+import os
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from .engine import RATE_KEY, GRID_SOLVER, SLOPE_FIELDS, grid_fields, scan_2d_fields, log_rate, rate_slopes
+from .params import parameters_to_dict, parameters_from_dict
+from .sensitivity import drc_fields, degree_of_rate_control
+from .parallel import default_workers, prepare_tables, row_chunks, run_row_chunks
+
+STORE_VERSION = 1
+META_FILE = "meta.json"
+ROWS_DONE_FILE = "rows_done.npy"
+TILE_POINTS = 2 ** 18  # 默认每块的网格点数，决定单个任务的内存占用而与网格总大小无关
+
+
+def _field_file(index):
+    # 字段名含 '*'、'(' 等字符，文件名只用序号，对应关系记在 meta.json 中
+    return f"field_{index:02d}.npy"
+
+
+class MapStore:
+    """磁盘上的二维扫描结果，store[字段名] 返回 (n_pH, n_η) 的内存映射数组"""
+
+    def __init__(self, directory, meta, mode="r"):
+        self.directory = directory
+        self.meta = meta
+        self.mode = mode
+        self.params = parameters_from_dict(meta['params'])
+        self.eta = np.asarray(meta['eta'], dtype=float)
+        self.ph = np.asarray(meta['ph'], dtype=float)
+        self.fields = list(meta['fields'])
+        self.rows_done = np.load(os.path.join(directory, ROWS_DONE_FILE), mmap_mode=mode)
+        self._arrays = {}
+
+    @property
+    def shape(self):
+        return (self.ph.size, self.eta.size)
+
+    @property
+    def complete(self):
+        return bool(np.all(self.rows_done))
+
+    def __getitem__(self, field):
+        if field not in self._arrays:
+            index = self.fields.index(field)
+            self._arrays[field] = np.load(os.path.join(self.directory, _field_file(index)), mmap_mode=self.mode)
+        return self._arrays[field]
+
+    @classmethod
+    def create(cls, directory, params, eta_values, ph_values):
+        """新建结果目录；各字段文件预先按完整大小分配并填充 NaN"""
+        os.makedirs(directory, exist_ok=True)
+        meta_path = os.path.join(directory, META_FILE)
+        if os.path.exists(meta_path):
+            # 先删除旧元数据，中途失败时目录不会被当作有效存储
+            os.remove(meta_path)
+        eta_values = np.asarray(eta_values, dtype=float)
+        ph_values = np.asarray(ph_values, dtype=float)
+        fields = grid_fields(params.model)
+        shape = (ph_values.size, eta_values.size)
+        for index in range(len(fields)):
+            array = open_memmap(os.path.join(directory, _field_file(index)), mode='w+', dtype=float, shape=shape)
+            array[:] = np.nan
+            array.flush()
+            del array
+        rows_done = open_memmap(os.path.join(directory, ROWS_DONE_FILE), mode='w+', dtype=bool, shape=(shape[0],))
+        rows_done.flush()
+        del rows_done
+
+        meta = {
+            'version': STORE_VERSION,
+            'params': parameters_to_dict(params),
+            'eta': eta_values.tolist(),
+            'ph': ph_values.tolist(),
+            'fields': fields,
+        }
+        # 元数据最后写入：目录中有 meta.json 才算有效的结果存储
+        tmp_path = os.path.join(directory, META_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+        return cls(directory, meta, mode="r+")
+
+    @classmethod
+    def open(cls, directory, mode="r"):
+        with open(os.path.join(directory, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get('version') != STORE_VERSION:
+            raise ValueError(f"不支持的结果存储版本: {meta.get('version')}")
+        return cls(directory, meta, mode)
+
+    def matches(self, params, eta_values, ph_values):
+        """是否为同一参数、同一网格的扫描（可续算）"""
+        return (self.params == params
+                and np.array_equal(self.eta, np.asarray(eta_values, dtype=float))
+                and np.array_equal(self.ph, np.asarray(ph_values, dtype=float)))
+
+    def write_rows(self, start, stop, values):
+        """写入 pH 行 [start, stop) 的全部字段并标记完成"""
+        for field in self.fields:
+            array = self[field]
+            array[start:stop] = values[field]
+            array.flush()
+        self.rows_done[start:stop] = True
+        self.rows_done.flush()
+
+    def results_2d(self, drc=False, slopes=False):
+        """与 scan_2d 相同格式的结果（供等值线图使用），lg r 与 θ* 由磁盘数据计算
+
+        drc=True 时由保存的速率常数按行块计算速率控制度图，不重新计算速率常数；
+        slopes=True 时按行块计算 Tafel 斜率与 pH 反应级数图（需要各通道的速率常数，磁盘上
+        只有组合后的 k，因此重新计算）。
+        """
+        eta_grid, ph_grid = np.meshgrid(self.eta, self.ph)
+        result = {
+            'eta': eta_grid,
+            'ph': ph_grid,
+            'lgr': log_rate(self[RATE_KEY[self.params.model]]),
+            'theta': np.asarray(self['theta*']),
+            'rows_done': np.asarray(self.rows_done),
+        }
+        if drc:
+            model = self.params.model
+            fields = drc_fields(model)
+            result.update((name, np.full(self.shape, np.nan)) for name in fields)
+            k_fields = [name for name in grid_fields(model) if name.startswith('k')]
+            rows = max(1, TILE_POINTS // (2 * len(fields)) // max(self.eta.size, 1))
+            for start in range(0, self.shape[0], rows):
+                k = {name: np.asarray(self[name][start:start + rows]) for name in k_fields}
+                values = degree_of_rate_control(model, k, RATE_KEY[model], GRID_SOLVER)
+                for name in fields:
+                    result[name][start:start + rows] = values[name]
+        if slopes:
+            result.update((name, np.full(self.shape, np.nan)) for name in SLOPE_FIELDS)
+            rows = max(1, TILE_POINTS // 2 // max(self.eta.size, 1))
+            for start in range(0, self.shape[0], rows):
+                stop = min(start + rows, self.shape[0])
+                values = rate_slopes(self.params, eta_grid[start:stop], ph_grid[start:stop])
+                for name in SLOPE_FIELDS:
+                    result[name][start:stop] = values[name]
+            for name in SLOPE_FIELDS:
+                result[name][~result['rows_done']] = np.nan
+        return result
+
+
+def open_map(directory):
+    """只读打开已有的结果目录"""
+    return MapStore.open(directory, mode="r")
+
+
+def _scan_rows_to_store(directory, start, stop):
+    """计算 pH 行 [start, stop) 并写入结果目录（可在子进程中运行）"""
+    store = MapStore.open(directory, mode="r+")
+    store.write_rows(start, stop, scan_2d_fields(store.params, store.eta, store.ph[start:stop]))
+    return start, stop
+
+
+def scan_2d_to_store(params, eta_values, ph_values, directory, max_workers=1, chunk_rows=None,
+                     progress=None, cancel=None):
+    """把二维扫描的全部字段按行块写入 directory，返回 MapStore（只读）
+
+    目录中已有同一参数、同一网格的结果时只计算未完成的行；否则新建（覆盖旧文件）。
+    chunk_rows 默认使每块约 TILE_POINTS 个点；max_workers > 1 时各子进程直接写入同一组内存映射文件。
+    progress、cancel 同 parallel_scan_2d；取消后已完成的行保留在磁盘上，下次调用时续算。
+    """
+    store = None
+    if os.path.exists(os.path.join(directory, META_FILE)):
+        try:
+            store = MapStore.open(directory, mode="r+")
+        except (OSError, ValueError, KeyError):
+            store = None
+        if store is not None and not store.matches(params, eta_values, ph_values):
+            store = None
+    if store is None:
+        store = MapStore.create(directory, params, eta_values, ph_values)
+
+    n_rows, n_eta = store.shape
+    max_workers = max_workers or default_workers()
+    chunk_rows = chunk_rows or max(1, TILE_POINTS // max(n_eta, 1))
+    todo = [(start, stop) for start, stop in row_chunks(n_rows, chunk_rows, max_workers)
+            if not np.all(store.rows_done[start:stop])]
+    # 续算时 chunk_rows 可能与上次不同，块内已完成的行不重复计数
+    counted = np.array(store.rows_done, dtype=bool)
+
+    def on_done(start, stop):
+        counted[start:stop] = True
+        if progress:
+            progress(int(counted.sum()) * n_eta, n_rows * n_eta)
+
+    if todo:
+        if max_workers == 1 or len(todo) == 1:
+            run_row_chunks(_scan_rows_to_store, (directory,), todo, 1, on_done, cancel)
+        else:
+            prepare_tables(params, eta_values, ph_values)
+            run_row_chunks(_scan_rows_to_store, (directory,), todo, max_workers, on_done, cancel)
+    elif progress:
+        progress(n_rows * n_eta, n_rows * n_eta)
+    return open_map(directory)
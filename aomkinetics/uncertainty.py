@@ -0,0 +1,202 @@
+"""参数误差的 Monte Carlo 传播：一维扫描上 lg r 与覆盖度的分位数带
+
+distributions 为 {输入名: (分布, 宽度)}，输入名同 sweep 的轴（deltaG_1、lambda_21、ea0、T ...），
+以 params 中的值为中心：'normal' 的宽度为标准差，'uniform' 为半宽。超出 fitting.default_bounds
+（如 β ∉ [0, 1]、Softplus 的 γ ≤ 0）的样本重新抽取，即按边界截尾的分布。样本按批交给 engine.sample_values 向量化计算，每批结果只用于
+更新 P² 流式分位数估计（Jain & Chlamtac, 1985），内存与样本数无关。
+"""
+import warnings
+
+import numpy as np
+
+from .mechanism import MODEL_STEPS, MODEL_THETA
+from .engine import RATE_KEY, sweep_axis, sample_values, scan_1d_frame, scan_1d_points
+from .fitting import parameter_bounds
+
+MC_SAMPLES = 2000
+MC_CHUNK_SAMPLES = 256  # 每批计算的样本数
+MC_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+DISTRIBUTIONS = ('normal', 'uniform')
+DFT_UNCERTAINTY = 0.15  # eV，default_distributions 中 ΔG 的标准差
+
+
+def default_distributions(params, width=DFT_UNCERTAINTY):
+    """全部电化学步骤的 ΔG 取标准差为 width 的正态分布"""
+    return {f"deltaG_{n}": ('normal', width) for n in MODEL_STEPS[params.model]}
+
+
+def format_distributions(distributions):
+    """分布 → 每行 "输入名: 分布 宽度" 的文本"""
+    return "\n".join(f"{name}: {kind} {width:g}" for name, (kind, width) in distributions.items())
+
+
+def parse_distributions(text):
+    """解析 format_distributions 格式的文本；忽略空行与 # 之后的注释"""
+    distributions = {}
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        name, _, spec = line.partition(':')
+        try:
+            kind, width = spec.split()
+            distributions[name.strip()] = (kind, float(width))
+        except ValueError:
+            raise ValueError(f"无法解析分布 \"{line}\"（格式为 输入名: normal 0.15）") from None
+        if kind not in DISTRIBUTIONS:
+            raise ValueError(f"未知分布 {kind}（可用 {'、'.join(DISTRIBUTIONS)}）")
+    return distributions
+
+
+def _draw(kind, center, width, n_samples, rng):
+    if kind == 'normal':
+        return rng.normal(center, width, n_samples)
+    if kind == 'uniform':
+        return rng.uniform(center - width, center + width, n_samples)
+    raise ValueError(f"未知分布 {kind}（可用 {'、'.join(DISTRIBUTIONS)}）")
+
+
+def draw_samples(params, distributions, n_samples, rng):
+    """{输入名: (n_samples,) 数组}，以 params 中的值为中心
+
+    超出边界的样本重新抽取；中心本身不在边界内时不限制（否则截尾分布不含中心值）。
+    """
+    samples = {}
+    for (name, (kind, width)), (low, high) in zip(distributions.items(),
+                                                  parameter_bounds(params, list(distributions))):
+        name, kind_of_input = sweep_axis(params, name)
+        if kind_of_input == 'global':
+            center = getattr(params, name)
+        else:
+            parameter, _, step = name.rpartition('_')
+            center = params.steps[int(step)][parameter]
+        values = _draw(kind, center, width, n_samples, rng)
+        if low <= center <= high:
+            # 中心在边界内时每次至少约一半的样本落在边界内
+            outside = (values < low) | (values > high)
+            while outside.any():
+                values[outside] = _draw(kind, center, width, int(outside.sum()), rng)
+                outside = (values < low) | (values > high)
+        samples[name] = values
+    return samples
+
+
+class StreamingQuantiles:
+    """P² 流式分位数估计
+
+    每个分位数、每个点只保存 5 个标记（高度与位置），逐个样本更新，全部点一起向量化；
+    非有限值（θ 无法计算、r = 0）跳过。
+    """
+
+    def __init__(self, quantiles, shape):
+        self.quantiles = np.asarray(quantiles, dtype=float)
+        self.shape = tuple(shape)
+        n_points = int(np.prod(self.shape))
+        p = self.quantiles[:, None, None]
+        zeros = np.zeros_like(p)
+        self._increments = np.concatenate([zeros, p / 2, p, (1 + p) / 2, zeros + 1], axis=1)
+        self._desired = np.broadcast_to(1 + 4 * self._increments, (p.size, 5, n_points)).copy()
+        self._positions = np.broadcast_to(np.arange(1.0, 6.0)[None, :, None], (p.size, 5, n_points)).copy()
+        self._heights = np.zeros((p.size, 5, n_points))
+        self._buffer = np.zeros((5, n_points))
+        self.count = np.zeros(n_points, dtype=int)
+
+    def update(self, values):
+        """加入一批样本，values 形状为 (n_samples, *shape)"""
+        values = np.asarray(values, dtype=float)
+        for x in values.reshape(len(values), -1):
+            self._add(x)
+
+    def _add(self, x):
+        valid = np.isfinite(x)
+        # 前 5 个样本直接保存，排序后作为初始标记
+        filling = valid & (self.count < 5)
+        if filling.any():
+            index = np.flatnonzero(filling)
+            self._buffer[self.count[index], index] = x[index]
+            self.count[index] += 1
+            ready = index[self.count[index] == 5]
+            self._heights[:, :, ready] = np.sort(self._buffer[:, ready], axis=0)
+        index = np.flatnonzero(valid & ~filling)
+        if not index.size:
+            return
+        self.count[index] += 1
+        x = x[index]
+        q = self._heights[:, :, index]
+        n = self._positions[:, :, index]
+        desired = self._desired[:, :, index] + self._increments
+
+        q[:, 0] = np.minimum(q[:, 0], x)
+        q[:, 4] = np.maximum(q[:, 4], x)
+        cell = (x >= q[:, 1:4]).sum(axis=1)  # x 所在区间 0–3
+        n += np.arange(5)[None, :, None] > cell[:, None, :]
+        for i in (1, 2, 3):
+            delta = desired[:, i] - n[:, i]
+            move = (((delta >= 1) & (n[:, i + 1] - n[:, i] > 1))
+                    | ((delta <= -1) & (n[:, i - 1] - n[:, i] < -1)))
+            s = np.where(move, np.sign(delta), 0.0)
+            # 分段抛物线插值，越过相邻标记时改为线性插值
+            parabolic = q[:, i] + s / (n[:, i + 1] - n[:, i - 1]) * (
+                (n[:, i] - n[:, i - 1] + s) * (q[:, i + 1] - q[:, i]) / (n[:, i + 1] - n[:, i])
+                + (n[:, i + 1] - n[:, i] - s) * (q[:, i] - q[:, i - 1]) / (n[:, i] - n[:, i - 1]))
+            neighbour_q = np.where(s > 0, q[:, i + 1], q[:, i - 1])
+            neighbour_n = np.where(s > 0, n[:, i + 1], n[:, i - 1])
+            linear = q[:, i] + s * (neighbour_q - q[:, i]) / (neighbour_n - n[:, i])
+            inside = (q[:, i - 1] < parabolic) & (parabolic < q[:, i + 1])
+            q[:, i] = np.where(move, np.where(inside, parabolic, linear), q[:, i])
+            n[:, i] += s
+
+        self._heights[:, :, index] = q
+        self._positions[:, :, index] = n
+        self._desired[:, :, index] = desired
+
+    def result(self):
+        """(n_quantiles, *shape) 的分位数估计；不足 5 个样本的点直接由已有样本计算，没有样本为 NaN"""
+        estimate = self._heights[:, 2].copy()
+        few = np.flatnonzero(self.count < 5)
+        if few.size:
+            kept = np.where(np.arange(5)[:, None] < self.count[few], self._buffer[:, few], np.nan)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                estimate[:, few] = np.nanquantile(kept, self.quantiles, axis=0)
+        return estimate.reshape((self.quantiles.size,) + self.shape)
+
+
+def quantile_column(quantile, label):
+    """分位数带在结果表格中的列名，如 p5 lg(r4)、p50 theta*"""
+    return f"p{100 * quantile:g} {label}"
+
+
+def uncertainty_scan(params, variable, values, fixed_value, distributions, n_samples=MC_SAMPLES,
+                     quantiles=MC_QUANTILES, seed=0, progress=None, cancel=None):
+    """一维扫描的 Monte Carlo 不确定度
+
+    返回 scan_1d 的标称结果表格，另含 lg r（RATE_KEY）与各覆盖度的分位数列（列名见 quantile_column）
+    和实际计算的样本数 "MC samples"。progress(已完成样本数, 总样本数) 每批后回调，cancel 置位后停止，
+    分位数由已完成的样本给出。
+    """
+    values = np.asarray(values, dtype=float)
+    eta, pH = scan_1d_points(variable, values, fixed_value)
+    fields = ['lgr'] + list(MODEL_THETA[params.model])
+    labels = [f"lg({RATE_KEY[params.model]})"] + fields[1:]
+    estimator = StreamingQuantiles(quantiles, (len(fields), values.size))
+    rng = np.random.default_rng(seed)
+
+    done = 0
+    for start in range(0, n_samples, MC_CHUNK_SAMPLES):
+        if cancel is not None and cancel.is_set():
+            break
+        size = min(MC_CHUNK_SAMPLES, n_samples - start)
+        batch = sample_values(params, draw_samples(params, distributions, size, rng), eta, pH, fields=fields)
+        estimator.update(np.stack([batch[name] for name in fields], axis=1))
+        done += size
+        if progress:
+            progress(done, n_samples)
+
+    result = scan_1d_frame(params, variable, values, fixed_value)
+    bands = estimator.result()
+    for i, quantile in enumerate(estimator.quantiles):
+        for j, label in enumerate(labels):
+            result[quantile_column(quantile, label)] = bands[i, j]
+    result["MC samples"] = done
+    return result
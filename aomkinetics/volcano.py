@@ -0,0 +1,108 @@
+"""基于标度关系的火山图
+
+选取一到两个描述符（如 ΔG_OH、ΔG_O）作为扫描轴，其余步骤的 ΔG 由线性标度关系给出：
+
+    ΔG_step = a + b1·D1 + b2·D2
+
+relations 为 {步骤号: (a, (b1, b2))}，未列出的步骤与其余参数（γ、β、λ、z ...）取自基准
+SimulationParameters。描述符网格上的每个点相当于一个催化剂，沿 screening 的催化剂轴分批
+向量化计算，在固定的 η、pH 下得到 lg(r4)（ER-AOM）或 lg(r5)（LH-AOM）与限速步骤。
+"""
+import numpy as np
+import pandas as pd
+
+from .params import required_steps
+from .engine import RATE_KEY
+from .screening import catalyst_steps, evaluate_catalysts
+
+DESCRIPTORS = ('ΔG_OH', 'ΔG_O')
+# ER-AOM 以 ΔG_OH、ΔG_O 为描述符：ΔG_OOH = ΔG_OH + 3.2，四步之和为 4.92 eV
+# LH-AOM 取吸附能可加：ΔG_(OH)2 = 2ΔG_OH、ΔG_O(OH) = ΔG_O + ΔG_OH、ΔG_O(O) = 2ΔG_O，
+# 两条支路 21+31 与 22+32 的 ΔG 之和相同；化学步骤5 放出 O2，全部步骤之和为 4.92 eV
+SCALING_RELATIONS = {
+    "ER-AOM": {
+        1: (0.0, (1.0, 0.0)),
+        2: (0.0, (-1.0, 1.0)),
+        3: (3.2, (1.0, -1.0)),
+        4: (1.72, (-1.0, 0.0)),
+    },
+    "LH-AOM": {
+        1: (0.0, (1.0, 0.0)),
+        21: (0.0, (1.0, 0.0)),
+        22: (0.0, (-1.0, 1.0)),
+        31: (0.0, (-1.0, 1.0)),
+        32: (0.0, (1.0, 0.0)),
+        4: (0.0, (-1.0, 1.0)),
+        5: (4.92, (0.0, -2.0)),
+    },
+}
+
+
+def format_scaling_relations(relations):
+    """标度关系 → 每行 "步骤: a, b1, b2" 的文本"""
+    return "\n".join(f"{step}: " + ", ".join(f"{value:g}" for value in (intercept, *slopes))
+                     for step, (intercept, slopes) in relations.items())
+
+
+def parse_scaling_relations(text):
+    """解析 format_scaling_relations 格式的文本；忽略空行与 # 之后的注释"""
+    relations = {}
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        step, _, values = line.partition(':')
+        try:
+            values = [float(value) for value in values.split(',')]
+            relations[int(step)] = (values[0], tuple(values[1:]))
+        except (ValueError, IndexError):
+            raise ValueError(f"无法解析标度关系 \"{line}\"（格式为 步骤: a, b1, b2）") from None
+    return relations
+
+
+def scaling_table(params, relations, axes):
+    """描述符网格上每个点的 ΔG 参数表（列名同 screening 的参数表），点按 (D2, D1) 行优先排列"""
+    unknown = sorted(set(relations) - set(required_steps(params.model)))
+    if unknown:
+        raise ValueError(f"{params.model} 没有步骤 {', '.join(map(str, unknown))}")
+    grids = [grid.ravel() for grid in np.meshgrid(*axes)]
+    table = {}
+    for step, (intercept, slopes) in relations.items():
+        if any(slopes[len(axes):]):
+            raise ValueError(f"步骤 {step} 的标度关系用到了未扫描的描述符 D{len(axes) + 1}")
+        deltaG = np.full(grids[0].size, float(intercept))
+        for slope, grid in zip(slopes, grids):
+            deltaG += slope * grid
+        table[f"deltaG_{step}"] = deltaG
+    return pd.DataFrame(table)
+
+
+def volcano(params, relations, axes, eta, pH, progress=None, cancel=None):
+    """在固定 η、pH 下计算一维或二维火山图
+
+    axes 为一个或两个描述符取值数组。返回字典：model、x（D1）、y（仅二维，D2）、lgr 与 limiting
+    （限速步骤，见 screening.LIMITING_STAGES）；二维时 lgr 形状为 (len(y), len(x))，可直接用于 contourf。
+    cancel 置位后未完成的点为 NaN。
+    """
+    axes = [np.asarray(axis, dtype=float) for axis in axes]
+    if len(axes) not in (1, 2):
+        raise ValueError("火山图需要一个或两个描述符")
+    steps = catalyst_steps(params, scaling_table(params, relations, axes))
+    lgr, _, limiting, _ = evaluate_catalysts(params, steps, eta, pH, progress, cancel)
+
+    shape = tuple(axis.size for axis in reversed(axes))
+    result = {'model': np.array(params.model), 'x': axes[0], 'lgr': lgr.reshape(shape),
+              'limiting': limiting.astype(str).reshape(shape)}
+    if len(axes) == 2:
+        result['y'] = axes[1]
+    return result
+
+
+def volcano_table(result, descriptors=DESCRIPTORS):
+    """火山图结果展平为 (描述符..., lg(r), limiting step) 长表"""
+    axes = [result['x']] + ([result['y']] if 'y' in result else [])
+    grids = np.meshgrid(*axes)
+    table = pd.DataFrame({name: grid.ravel() for name, grid in zip(descriptors, grids)})
+    table[f'lg({RATE_KEY[str(result["model"])]})'] = result['lgr'].ravel()
+    table['limiting step'] = result['limiting'].ravel()
+    return table